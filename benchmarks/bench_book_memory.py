@@ -0,0 +1,39 @@
+"""JSON'dan yüklenen kitap başına bellek kullanımı (tracemalloc).
+
+    python -m benchmarks.bench_book_memory --books 200000 --authors 5000
+"""
+import argparse
+import json
+import random
+import tracemalloc
+
+from library_app.models import Book
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--books", type=int, default=200_000)
+    parser.add_argument("--authors", type=int, default=5_000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    authors = [f"Author {i} {rng.random():.6f}" for i in range(args.authors)]
+    payload = json.dumps([
+        {"title": f"Book title {i}", "author": rng.choice(authors), "isbn": str(9780000000000 + i)}
+        for i in range(args.books)
+    ])
+
+    tracemalloc.start()
+    records = json.loads(payload)
+    books = [Book.from_dict(item) for item in records]
+    del records
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"books={len(books)} authors={args.authors}")
+    print(f"{current / len(books):.1f} bayt/kitap (metinler dahil)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""Toplu ISBN içe aktarma hızı: yerel sahte sunucuya karşı eşzamanlılık karşılaştırması.
+
+    python -m benchmarks.bench_bulk_fetch --isbns 200 --latency 0.05
+"""
+import argparse
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.mock_server import MockServer
+from library_app.cache import MetadataCache
+from library_app.isbn import to_isbn13
+from library_app.models import Library
+from library_app.resilience import ResiliencePolicy
+
+
+def _isbns(count: int):
+    return [to_isbn13(str(i).zfill(9)) for i in range(count)]
+
+
+async def _run(args):
+    async with MockServer(latency=args.latency) as server:
+        with tempfile.TemporaryDirectory() as tmp:
+            library = Library(str(Path(tmp) / "library.json"), cache=MetadataCache())
+            for provider in library.providers.providers:
+                provider.base_url = server.url
+                provider.policy = ResiliencePolicy(provider.name)  # Hız sınırı olmadan ölç
+            for concurrency in args.concurrency:
+                library.cache.clear()
+                start = time.perf_counter()
+                found = 0
+                async for _, book in library.fetch_books_from_api(_isbns(args.isbns), concurrency=concurrency):
+                    found += book is not None
+                elapsed = time.perf_counter() - start
+                print(f"concurrency={concurrency:3d}: {found} kitap, {elapsed:6.2f} s, "
+                      f"{found / elapsed:7.1f} ISBN/s")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--isbns", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.05, help="Sahte sunucu gecikmesi (s)")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32])
+    asyncio.run(_run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Yakın eşleşme önerileri: difflib taraması ile FuzzyIndex karşılaştırması.
+
+    python -m benchmarks.bench_fuzzy --books 100000 --queries 50
+"""
+import argparse
+import random
+import string
+import time
+from difflib import get_close_matches
+
+from library_app.fuzzy import FuzzyIndex
+
+
+def _typo(value: str, rng: random.Random) -> str:
+    pos = rng.randrange(len(value))
+    return value[:pos] + rng.choice(string.ascii_lowercase) + value[pos + 1:]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--books", type=int, default=100_000)
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--cutoff", type=float, default=0.6)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    words = ["".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 9))) for _ in range(20_000)]
+    titles = [" ".join(rng.choices(words, k=rng.randint(1, 4))) for _ in range(args.books)]
+    queries = [_typo(rng.choice(titles), rng) for _ in range(args.queries)]
+
+    start = time.perf_counter()
+    index = FuzzyIndex()
+    for title in titles:
+        index.add(title)
+    build = time.perf_counter() - start
+
+    start = time.perf_counter()
+    expected = [get_close_matches(q, titles, n=3, cutoff=args.cutoff) for q in queries]
+    difflib_ms = (time.perf_counter() - start) * 1000 / len(queries)
+
+    start = time.perf_counter()
+    actual = [index.suggest(q, n=3, cutoff=args.cutoff) for q in queries]
+    index_ms = (time.perf_counter() - start) * 1000 / len(queries)
+
+    top_hits = sum(1 for e, a in zip(expected, actual) if e[:1] == a[:1])
+    print(f"books={args.books} queries={len(queries)} cutoff={args.cutoff}")
+    print(f"FuzzyIndex kurulum: {build:.2f} s")
+    print(f"difflib:    {difflib_ms:9.2f} ms/sorgu")
+    print(f"FuzzyIndex: {index_ms:9.2f} ms/sorgu ({difflib_ms / index_ms:.0f}x)")
+    print(f"İlk öneri aynı: {top_hits}/{len(queries)}")
+
+
+if __name__ == "__main__":
+    main()
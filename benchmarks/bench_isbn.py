@@ -0,0 +1,33 @@
+"""Toplu ISBN normalleştirme hızı.
+
+    python -m benchmarks.bench_isbn --count 1000000
+"""
+import argparse
+import random
+import time
+
+from library_app.isbn import canonical_many, to_isbn10, to_isbn13
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, default=1_000_000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    isbn13 = [to_isbn13(str(rng.randrange(10 ** 9)).zfill(9)) for _ in range(args.count)]
+    inputs = {
+        "ISBN-13": isbn13,
+        "ISBN-10": [to_isbn10(i) for i in isbn13],
+        "tireli ISBN-13": [f"{i[:3]}-{i[3]}-{i[4:7]}-{i[7:12]}-{i[12]}" for i in isbn13],
+    }
+    for name, values in inputs.items():
+        start = time.perf_counter()
+        canonical_many(values)
+        elapsed = time.perf_counter() - start
+        print(f"{name:15s}: {len(values) / elapsed / 1e6:5.2f} M ISBN/s")
+
+
+if __name__ == "__main__":
+    main()
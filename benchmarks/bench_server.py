@@ -0,0 +1,115 @@
+"""HTTP servisi için yük testi: istek/s ve p50/p99 gecikme.
+
+    python -m benchmarks.bench_server --books 10000 --clients 32 --duration 10 --write-ratio 0.1
+
+Sunucu ayrı bir süreçte (`python -m library_app.server`) geçici bir
+katalogla başlatılır; istemciler keep-alive bağlantılar üzerinden ham
+HTTP/1.1 istekleri gönderir, böylece ölçüm istemci kütüphanesinin
+maliyetini içermez.
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from pathlib import Path
+
+from benchmarks.catalog import WORDS, isbn_for, write_catalog
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+async def request(reader, writer, method: str, target: str, body=None) -> int:
+    data = json.dumps(body).encode() if body is not None else b""
+    writer.write(f"{method} {target} HTTP/1.1\r\nHost: bench\r\nContent-Type: application/json\r\n"
+                 f"Content-Length: {len(data)}\r\n\r\n".encode() + data)
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while (line := await reader.readline()) not in (b"\r\n", b""):
+        name, _, value = line.partition(b":")
+        if name.lower() == b"content-length":
+            length = int(value)
+    await reader.readexactly(length)
+    return status
+
+
+async def client(host, port, books, args, deadline, latencies, errors, rng, worker):
+    reader, writer = await asyncio.open_connection(host, port)
+    written = 0
+    try:
+        while time.perf_counter() < deadline:
+            if rng.random() < args.write_ratio:
+                kind, method, body = "add", "POST", {"title": f"Yeni {worker}-{written}", "author": "Yük",
+                                                     "isbn": f"W{worker}-{written}"}
+                target = "/books"
+                written += 1
+            else:
+                kind = rng.choice(("lookup", "search", "list"))
+                method, body = "GET", None
+                i = rng.randrange(books)
+                target = {"lookup": f"/books/{isbn_for(i)}", "search": f"/search?q={rng.choice(WORDS)}&limit=10",
+                          "list": f"/books?offset={i}&limit=20&sort=title"}[kind]
+            start = time.perf_counter()
+            status = await request(reader, writer, method, target, body)
+            latencies[kind].append(time.perf_counter() - start)
+            if status >= 400:
+                errors[kind] += 1
+    finally:
+        writer.close()
+
+
+def percentile(values, p):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(p * len(ordered)))] if ordered else float("nan")
+
+
+async def run(args, host, port):
+    latencies, errors = defaultdict(list), defaultdict(int)
+    rng = random.Random(args.seed)
+    deadline = time.perf_counter() + args.duration
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        client(host, port, args.books, args, deadline, latencies, errors, random.Random(rng.random()), w)
+        for w in range(args.clients)
+    ))
+    elapsed = time.perf_counter() - start
+
+    everything = [v for values in latencies.values() for v in values]
+    print(f"{len(everything) / elapsed:,.0f} istek/s ({args.clients} istemci, {elapsed:.1f} s)")
+    for kind, values in sorted(latencies.items()) + [("toplam", everything)]:
+        print(f"{kind:8s}: {len(values):7d} istek, p50 {percentile(values, 0.50) * 1000:6.2f} ms, "
+              f"p99 {percentile(values, 0.99) * 1000:6.2f} ms, hata {errors.get(kind, 0)}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--books", type=int, default=10_000)
+    parser.add_argument("--clients", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--write-ratio", type=float, default=0.1)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        write_catalog(Path(tmp) / "library.json", args.books, args.seed)
+        proc = subprocess.Popen([sys.executable, "-m", "library_app.server", "--port", "0",
+                                 "--file", str(Path(tmp) / "library.json")],
+                                cwd=tmp, env=dict(os.environ, PYTHONPATH=str(ROOT)),
+                                stdout=subprocess.PIPE, text=True)
+        try:
+            url = proc.stdout.readline().split()[-1]  # "Dinleniyor: http://127.0.0.1:PORT"
+            host, port = url.rsplit("/", 1)[-1].split(":")
+            asyncio.run(run(args, host, int(port)))
+        finally:
+            proc.terminate()
+            proc.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""CLI açılış süresi: `-X importtime` toplamı ve `--help` / `list-books` duvar saati.
+
+    python -m benchmarks.bench_startup --books 10000 --runs 5
+    python -m benchmarks.bench_startup --label lazy --output benchmarks/results/startup.json
+
+Her ölçüm yeni bir Python sürecinde yapılır; `list-books` geçici bir
+dizinde üretilen `--books` kitaplık library.json ile çalışır. `--output`
+verilirse sonuç, dosyadaki diğer etiketli ölçümlerin yanına `--label`
+adıyla eklenir.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+CLI = "from library_app.cli import cli; cli()"
+
+
+def _env(root: Path):
+    return dict(os.environ, PYTHONPATH=str(root), PYTHONDONTWRITEBYTECODE="1")
+
+
+def import_time(root: Path, module: str = "library_app.cli"):
+    """(toplam mikrosaniye, içe aktarılan modül adları)"""
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                          env=_env(root), capture_output=True, text=True, check=True)
+    total, modules = 0, set()
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        modules.add(name.strip())
+        if name.strip() == module:
+            total = int(cumulative)
+    return total, modules
+
+
+def wall_clock(root: Path, args, cwd: Path, runs: int) -> float:
+    """Medyan süre (ms)"""
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", CLI, *args], cwd=cwd, env=_env(root),
+                       stdout=subprocess.DEVNULL, check=True)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def bare_python(runs: int) -> float:
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", "pass"], check=True)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--root", type=Path, default=ROOT, help="Ölçülecek depo dizini")
+    parser.add_argument("--books", type=int, default=10_000)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--output", type=Path, help="Sonuçların yazılacağı JSON dosyası")
+    parser.add_argument("--label", default="current", help="Ölçümün dosyadaki adı")
+    args = parser.parse_args()
+
+    total_us, modules = import_time(args.root)
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        catalog = [{"title": f"Kitap {i}", "author": f"Yazar {i % 997}", "isbn": str(i)} for i in range(args.books)]
+        (tmp / "library.json").write_text(json.dumps(catalog), encoding="utf-8")
+        results = {
+            "python": sys.version.split()[0],
+            "books": args.books,
+            "import_library_app_cli_ms": round(total_us / 1000, 1),
+            "imports_httpx": "httpx" in modules,
+            "help_ms": round(wall_clock(args.root, ["--help"], tmp, args.runs), 1),
+            "list_books_ms": round(wall_clock(args.root, ["list-books"], tmp, args.runs), 1),
+        }
+    results["python_baseline_ms"] = round(bare_python(args.runs), 1)  # Boş Python süreci
+
+    for key, value in results.items():
+        print(f"{key:26s}: {value}")
+    if args.output:
+        tracked = json.loads(args.output.read_text(encoding="utf-8")) if args.output.exists() else {}
+        tracked[args.label] = results
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(tracked, indent=2) + "\n", encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+"""Benchmark'lar için tekrarlanabilir sentetik katalog üretimi.
+
+Aynı `seed` her zaman aynı kitapları üretir. Başlık ve yazarlar ~2000
+kelimelik bir sözlükten seçilir (arama sonuçları gerçekçi boyutta kalır),
+ISBN'ler geçerli ISBN-13'lerdir.
+"""
+import json
+import random
+from pathlib import Path
+from typing import Dict, Iterator
+
+from library_app.isbn import to_isbn13
+
+_rng = random.Random(0)
+WORDS = sorted({"".join(_rng.choice("abcdefghiklmnoprstuvyz") for _ in range(_rng.randint(4, 9)))
+                for _ in range(2000)})
+
+
+def isbn_for(i: int) -> str:
+    return to_isbn13(str(i).zfill(9))
+
+
+def make_records(count: int, seed: int = 42, start: int = 0) -> Iterator[Dict]:
+    """`start`'tan başlayarak `count` kitap kaydı; başlıklar numarayla tekilleşir"""
+    rng = random.Random(seed + start)
+    for i in range(start, start + count):
+        title = " ".join(rng.choice(WORDS) for _ in range(rng.randint(2, 4)))
+        author = " ".join(rng.choice(WORDS).capitalize() for _ in range(2))
+        yield {"title": f"{title} {i}", "author": author, "isbn": isbn_for(i)}
+
+
+def write_catalog(path, count: int, seed: int = 42) -> Path:
+    """library.json biçiminde katalog dosyası yazar"""
+    path = Path(path)
+    path.write_text(json.dumps(list(make_records(count, seed))), encoding="utf-8")
+    return path
@@ -0,0 +1,57 @@
+"""İki `benchmarks.suite` çıktısını karşılaştırır.
+
+    python -m benchmarks.compare base.json head.json --threshold 10
+
+Her (işlem, boyut) için işlem/s, p99 ve tepe RSS değişimi yazdırılır.
+İşlem/s `threshold` yüzdesinden fazla düşen veya p99'u bu kadar artan
+ölçüm varsa çıkış kodu 1 olur (CI'da gerileme kontrolü için).
+"""
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+
+def _load(path: Path) -> Dict[Tuple[str, int], Dict]:
+    report = json.loads(path.read_text(encoding="utf-8"))
+    return {(r["op"], r["size"]): r for r in report["results"]}
+
+
+def _change(old: Optional[float], new: Optional[float]) -> Optional[float]:
+    if old is None or new is None or old == 0:
+        return None
+    return (new - old) / old * 100
+
+
+def _fmt(change: Optional[float]) -> str:
+    return "      -" if change is None else f"{change:+6.1f}%"
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("base", type=Path)
+    parser.add_argument("head", type=Path)
+    parser.add_argument("--threshold", type=float, default=10.0, help="Gerileme sayılacak değişim (%%)")
+    args = parser.parse_args()
+
+    base, head = _load(args.base), _load(args.head)
+    regressions = []
+    print(f"{'işlem':11s} {'boyut':>9s}  {'işlem/s':>8s}  {'p99':>7s}  {'RSS':>7s}")
+    for key in sorted(base.keys() & head.keys()):
+        old, new = base[key], head[key]
+        throughput = _change(old["ops_per_sec"], new["ops_per_sec"])
+        p99 = _change(old.get("p99_ms"), new.get("p99_ms"))
+        rss = _change(old.get("peak_rss_mb"), new.get("peak_rss_mb"))
+        slower = (throughput is not None and throughput < -args.threshold) or (p99 is not None and p99 > args.threshold)
+        if slower:
+            regressions.append(key)
+        print(f"{key[0]:11s} {key[1]:>9,d}  {_fmt(throughput)}  {_fmt(p99)}  {_fmt(rss)}{'  <-- gerileme' if slower else ''}")
+    for key in sorted(base.keys() ^ head.keys()):
+        print(f"{key[0]:11s} {key[1]:>9,d}  yalnızca {'base' if key in base else 'head'} içinde")
+
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""Open Library ve Google Books için yerel sahte HTTP sunucusu.
+
+Ağ erişimi olmadan benchmark ve testlerde kullanılır; `fail_next` ve
+`down` ile 429/5xx hataları ve kesintiler taklit edilebilir:
+
+    server = MockServer(latency=0.05)
+    await server.start()
+    for provider in library.providers.providers:
+        provider.base_url = server.url
+"""
+import asyncio
+import json
+from collections import Counter, deque
+from typing import Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+
+class MockServer:
+    def __init__(self, latency: float = 0.0, host: str = "127.0.0.1", port: int = 0):
+        self.latency = latency
+        self.host = host
+        self.port = port
+        self.requests: Counter = Counter()  # yol -> istek sayısı
+        self.missing = set()  # 404 dönecek ISBN'ler
+        self.down = False  # True iken her istek 503 alır
+        self._faults = deque()  # Sıradaki isteklere dönecek hata kodları
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    @property
+    def total_requests(self) -> int:
+        return sum(self.requests.values())
+
+    def fail_next(self, status: int, times: int = 1):
+        """Sıradaki `times` isteğe `status` koduyla yanıt verir"""
+        self._faults.extend([status] * times)
+
+    async def start(self):
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.stop()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    pass  # Başlıklar kullanılmıyor
+                _, target, _ = request_line.decode("latin-1").split(" ", 2)
+                self.requests[urlsplit(target).path] += 1
+                if self.latency:
+                    await asyncio.sleep(self.latency)
+                if self.down:
+                    status, body = 503, {"error": "unavailable"}
+                elif self._faults:
+                    status, body = self._faults.popleft(), {"error": "injected"}
+                else:
+                    status, body = self.respond(target)
+                payload = json.dumps(body).encode()
+                writer.write(
+                    f"HTTP/1.1 {status} {'OK' if status == 200 else 'Error'}\r\n"
+                    f"Content-Type: application/json\r\n"
+                    f"Content-Length: {len(payload)}\r\n"
+                    f"Connection: keep-alive\r\n\r\n".encode() + payload
+                )
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    def respond(self, target: str) -> Tuple[int, Dict]:
+        """İstek yoluna göre (durum kodu, JSON gövde) döner"""
+        parts = urlsplit(target)
+        path = parts.path
+        if path.startswith("/isbn/") and path.endswith(".json"):
+            isbn = path[len("/isbn/"):-len(".json")]
+            if isbn in self.missing:
+                return 404, {"error": "notfound"}
+            return 200, {
+                "title": f"Mock Book {isbn}",
+                "authors": [{"key": f"/authors/OL{sum(map(ord, isbn)) % 100}A"}],
+                "isbn_13": [isbn] if len(isbn) == 13 else [],
+                "isbn_10": [isbn] if len(isbn) == 10 else [],
+            }
+        if path.startswith("/authors/") and path.endswith(".json"):
+            key = path[len("/authors/"):-len(".json")]
+            return 200, {"key": f"/authors/{key}", "name": f"Mock Author {key}"}
+        if path == "/books/v1/volumes":
+            isbn = parse_qs(parts.query).get("q", [""])[0].replace("isbn:", "")
+            if isbn in self.missing:
+                return 200, {"totalItems": 0}
+            return 200, {"totalItems": 1, "items": [{"volumeInfo": {
+                "title": f"Mock Book {isbn}", "authors": ["Mock Author"]}}]}
+        if path == "/search.json":
+            return 200, {"numFound": 0, "docs": []}
+        return 404, {"error": "notfound"}
@@ -0,0 +1,217 @@
+"""Katalog, arama ve API sıcak yolları için benchmark paketi.
+
+    python -m benchmarks.suite --sizes 10000 100000 --output bench.json
+    python -m benchmarks.suite --sizes 1000000 --ops load load_snap save add_book
+    python -m benchmarks.suite --sizes 100000 1000000 --ops search --output benchmarks/results/search.json
+    python -m benchmarks.compare base.json bench.json
+
+Her (işlem, katalog boyutu) çifti ayrı bir Python sürecinde çalışır;
+böylece tepe bellek (ru_maxrss) o işleme aittir ve ölçümler birbirini
+etkilemez. Kataloglar `benchmarks.catalog` ile sabit tohumdan üretilir,
+API çağrıları yerel `MockServer`'a gider. Sonuçlar commit'ler arasında
+karşılaştırılabilecek JSON olarak yazılır.
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from benchmarks.catalog import WORDS, isbn_for, make_records, write_catalog
+
+ROOT = Path(__file__).resolve().parent.parent
+OPS = ("load", "load_snap", "save", "add_book", "lookup", "lookup_snap", "find_book", "search", "list", "fetch",
+       "fetch_bulk")
+
+
+def _peak_rss_mb() -> Optional[float]:
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def _percentile(ordered: List[float], p: float) -> float:
+    return ordered[min(len(ordered) - 1, int(p * len(ordered)))]
+
+
+def _timed(fn: Callable[[int], object], count: int) -> Dict:
+    """fn(i)'yi `count` kez çağırır; çağrı başına gecikme ölçülür"""
+    samples = []
+    clock = time.perf_counter
+    start = clock()
+    for i in range(count):
+        t = clock()
+        fn(i)
+        samples.append(clock() - t)
+    return _summary(count, clock() - start, samples)
+
+
+def _summary(count: int, seconds: float, samples: Optional[List[float]] = None) -> Dict:
+    result = {"ops": count, "seconds": round(seconds, 4), "ops_per_sec": round(count / seconds, 1)}
+    if samples:
+        ordered = sorted(samples)
+        for name, p in (("p50_ms", 0.50), ("p95_ms", 0.95), ("p99_ms", 0.99)):
+            result[name] = round(_percentile(ordered, p) * 1000, 4)
+    return result
+
+
+def _library(tmp: Path, size: int, seed: int, **kwargs):
+    from library_app.models import Library
+
+    path = write_catalog(tmp / "library.json", size, seed)
+    return Library(str(path), lazy=False, **kwargs)
+
+
+def run_case(op: str, size: int, samples: int, seed: int) -> Dict:
+    from library_app.models import Book, Library
+    from library_app.snapshot import json_to_snapshot
+
+    rng = random.Random(seed)
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        if op == "load":
+            path = write_catalog(tmp / "library.json", size, seed)
+            start = time.perf_counter()
+            Library(str(path), lazy=False)
+            return _summary(size, time.perf_counter() - start)
+
+        if op == "load_snap":  # Açılış + ilk arama: kitaplar mmap'ten erişildikçe çözülür
+            path = write_catalog(tmp / "library.json", size, seed)
+            json_to_snapshot(path, tmp / "library.snap")
+            start = time.perf_counter()
+            Library(str(tmp / "library.snap"), lazy=False).lookup(isbn_for(size // 2))
+            return _summary(size, time.perf_counter() - start)
+        if op == "lookup_snap":
+            json_to_snapshot(write_catalog(tmp / "library.json", size, seed), tmp / "library.snap")
+            lib = Library(str(tmp / "library.snap"), lazy=False)
+            keys = [isbn_for(rng.randrange(size)) for _ in range(samples)]
+            return _timed(lambda i: lib.lookup(keys[i]), samples)
+
+        if op in ("fetch", "fetch_bulk"):
+            return asyncio.run(_run_fetch(op, tmp, size, samples, seed))
+
+        lib = _library(tmp, size, seed)
+        if op == "save":
+            start = time.perf_counter()
+            lib.save_books()
+            return _summary(size, time.perf_counter() - start)
+        if op == "add_book":
+            new = [Book.from_dict(r) for r in make_records(samples, seed, start=size)]
+            return _timed(lambda i: lib.add_book(new[i]), samples)
+        if op == "lookup":
+            keys = [isbn_for(rng.randrange(size)) for _ in range(samples)]
+            return _timed(lambda i: lib.lookup(keys[i]), samples)
+        if op == "find_book":
+            # Yarısı bulunur, yarısı öneri yoluna (search + suggest) düşer
+            queries = [isbn_for(rng.randrange(size)) if i % 2 else f"{rng.choice(WORDS)}x" for i in range(samples)]
+            with contextlib.redirect_stdout(io.StringIO()):
+                lib.search(WORDS[0])  # Metin ve öneri indeksleri ölçüm dışında kurulsun
+                lib.suggest(WORDS[0])
+                return _timed(lambda i: lib.find_book(queries[i]), samples)
+        if op == "search":
+            queries = [" ".join(rng.sample(WORDS, rng.randint(1, 2))) for _ in range(samples)]
+            lib.search(WORDS[0])  # İndeks ve sıralı terim listesi ölçüm dışında kurulsun
+            return _timed(lambda i: lib.search(queries[i]), samples)
+        if op == "list":
+            offsets = [rng.randrange(size) for _ in range(samples)]
+            lib.list_books(limit=1, sort_by="title")  # Sıralı indeks ölçüm dışında kurulsun
+            return _timed(lambda i: list(lib.list_books(offsets[i], 20, sort_by="title")), samples)
+    raise ValueError(f"Bilinmeyen işlem: {op}")
+
+
+async def _run_fetch(op: str, tmp: Path, size: int, samples: int, seed: int) -> Dict:
+    from benchmarks.mock_server import MockServer
+    from library_app.cache import MetadataCache
+    from library_app.resilience import ResiliencePolicy
+
+    async with MockServer() as server:
+        lib = _library(tmp, size, seed, cache=MetadataCache())
+        for provider in lib.providers.providers:
+            provider.base_url = server.url
+            provider.policy = ResiliencePolicy(provider.name)  # Hız sınırı olmadan ölç
+        isbns = [isbn_for(size + i) for i in range(samples)]
+        try:
+            if op == "fetch":
+                latencies = []
+                start = time.perf_counter()
+                for isbn in isbns:
+                    t = time.perf_counter()
+                    await lib.fetch_book_from_api(isbn)
+                    latencies.append(time.perf_counter() - t)
+                return _summary(samples, time.perf_counter() - start, latencies)
+            start = time.perf_counter()
+            async for _ in lib.fetch_books_from_api(isbns, concurrency=32):
+                pass
+            return _summary(samples, time.perf_counter() - start)
+        finally:
+            await lib.aclose()
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000])
+    parser.add_argument("--ops", nargs="+", choices=OPS, default=list(OPS))
+    parser.add_argument("--samples", type=int, default=2000, help="Gecikme ölçülen işlemlerde çağrı sayısı")
+    parser.add_argument("--fetch-samples", type=int, default=300)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", type=Path, help="Sonuçların yazılacağı JSON dosyası")
+    parser.add_argument("--case", nargs=2, metavar=("OP", "SIZE"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.case:  # Alt süreç: tek ölçüm yapıp JSON yazar
+        op, size = args.case[0], int(args.case[1])
+        samples = args.fetch_samples if op.startswith("fetch") else args.samples
+        result = run_case(op, size, samples, args.seed)
+        result["peak_rss_mb"] = _peak_rss_mb()
+        print(json.dumps(result))
+        return
+
+    results = []
+    for size in args.sizes:
+        for op in args.ops:
+            proc = subprocess.run(
+                [sys.executable, "-m", "benchmarks.suite", "--case", op, str(size), "--seed", str(args.seed),
+                 "--samples", str(args.samples), "--fetch-samples", str(args.fetch_samples)],
+                cwd=ROOT, env=dict(os.environ, PYTHONHASHSEED="0"), capture_output=True, text=True,
+            )
+            if proc.returncode != 0:
+                print(f"{op:11s} {size:>9,d}: HATA\n{proc.stderr}", file=sys.stderr)
+                continue
+            result = {"op": op, "size": size, **json.loads(proc.stdout.strip().splitlines()[-1])}
+            results.append(result)
+            p99 = f"p99 {result['p99_ms']:8.3f} ms" if "p99_ms" in result else " " * 16
+            print(f"{op:11s} {size:>9,d}: {result['ops_per_sec']:>12,.1f} işlem/s  {p99}  "
+                  f"tepe RSS {result['peak_rss_mb']} MB", flush=True)
+
+    if args.output:
+        report = {
+            "meta": {"commit": _git_commit(), "python": platform.python_version(), "platform": platform.platform(),
+                     "time": time.strftime("%Y-%m-%dT%H:%M:%S"), "seed": args.seed, "samples": args.samples,
+                     "fetch_samples": args.fetch_samples},
+            "results": results,
+        }
+        args.output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,22 +1,99 @@
+import asyncio
 import httpx
-from typing import Optional, Dict, List
+from typing import AsyncIterator, Optional, Dict, List
 from .exceptions import APIError
+from .isbn import canonical, is_valid
+from .resilience import ResiliencePolicy
+from .session import HttpSession
+
+# Arama sonuçlarından yalnızca katalog için gereken alanlar istenir
+SEARCH_FIELDS = ("title", "author_name", "isbn")
+
+
+def search_doc_to_record(doc: Dict) -> Optional[Dict]:
+    """Arama sonucunu Library kaydına çevirir; geçerli ISBN'i olmayan sonuç None"""
+    isbns = [i for i in doc.get("isbn", []) if is_valid(i)]
+    if not doc.get("title") or not isbns:
+        return None
+    # Aynı eserin baskıları arasından tekrarlanabilir seçim: en küçük ISBN-13
+    isbn = min(canonical(i) for i in isbns)
+    return {"title": doc["title"], "author": ", ".join(doc.get("author_name", [])) or "Bilinmeyen Yazar",
+            "isbn": isbn}
+
 
 class OpenLibraryClient:
     BASE_URL = "https://openlibrary.org"
+    MAX_PAGE_SIZE = 1000  # search.json'un kabul ettiği en büyük limit
+
+    def __init__(self, session: Optional[HttpSession] = None, policy: Optional[ResiliencePolicy] = None):
+        self.session = session or HttpSession()
+        self._owns_session = session is None
+        self.policy = policy or ResiliencePolicy("openlibrary", rate=5.0, burst=10.0)
+
+    async def aclose(self):
+        if self._owns_session:
+            await self.session.aclose()
+
+    async def __aenter__(self):
+        return self
 
-    async def _fetch_data(self, endpoint: str) -> Optional[Dict]:
+    async def __aexit__(self, *exc):
+        await self.aclose()
+
+    async def _fetch_data(self, endpoint: str, params: Optional[Dict] = None) -> Optional[Dict]:
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(f"{self.BASE_URL}{endpoint}", timeout=10.0)
-                response.raise_for_status()
-                return response.json()
+            response = await self.policy.get(self.session, f"{self.BASE_URL}{endpoint}", params=params, timeout=10.0)
+            response.raise_for_status()
+            return response.json()
         except httpx.HTTPStatusError as e:
             raise APIError(f"API Hatası: {e}")
+        except httpx.TransportError as e:
+            raise APIError(f"API bağlantı hatası: {e}")
 
     async def fetch_book_by_isbn(self, isbn: str) -> Optional[Dict]:
         return await self._fetch_data(f"/isbn/{isbn}.json")
 
     async def search_books(self, query: str, limit: int = 5) -> List[Dict]:
-        data = await self._fetch_data(f"/search.json?q={query}&limit={limit}")
-        return data.get("docs", [])
\ No newline at end of file
+        data = await self._fetch_data("/search.json", params={"q": query, "limit": limit})
+        return data.get("docs", [])
+
+    async def _search_page(self, query: str, offset: int, limit: int, fields) -> Dict:
+        params = {"q": query, "offset": offset, "limit": limit}
+        if fields:
+            params["fields"] = ",".join(fields)
+        return await self._fetch_data("/search.json", params=params) or {}
+
+    async def iter_search(self, query: str, page_size: int = 100, max_results: Optional[int] = None,
+                          fields=SEARCH_FIELDS) -> AsyncIterator[Dict]:
+        """Arama sonuçlarını sayfa sayfa verir; sonraki sayfa mevcut sayfa işlenirken istenir.
+
+        Bellekte en fazla iki sayfa bulunur. `fields=None` bütün alanları ister.
+        Sonuçlar `search_doc_to_record` ile Library kayıtlarına çevrilebilir.
+        """
+        page_size = max(1, min(page_size, self.MAX_PAGE_SIZE))
+
+        def fetch(offset: int) -> "asyncio.Task":
+            limit = page_size if max_results is None else min(page_size, max_results - offset)
+            return asyncio.ensure_future(self._search_page(query, offset, limit, fields))
+
+        offset = 0
+        pending = fetch(offset) if max_results is None or max_results > 0 else None
+        try:
+            while pending is not None:
+                data = await pending
+                pending = None
+                docs = data.get("docs", [])
+                if max_results is not None:
+                    docs = docs[:max_results - offset]
+                offset += len(docs)
+                total = data.get("numFound", data.get("num_found"))
+                # Son sayfa kısa gelir; toplam biliniyorsa boş sayfa için ayrıca istek atılmaz
+                if (len(docs) == page_size and (total is None or offset < total)
+                        and (max_results is None or offset < max_results)):
+                    pending = fetch(offset)
+                for doc in docs:
+                    yield doc
+        finally:
+            # Tüketici erken bıraktı: önceden istenen sayfa iptal edilir
+            if pending is not None and not pending.cancel() and not pending.cancelled():
+                pending.exception()  # Tamamlanmışsa olası hata "alınmadı" uyarısı vermesin
\ No newline at end of file
@@ -0,0 +1,95 @@
+import asyncio
+import logging
+import sys
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Set
+
+
+class AuthorResolver:
+    """Open Library yazar anahtarlarını (/authors/OL...A) isimlere çevirir.
+
+    - Çözülen isimler bellekte (LRU) tutulur; aynı yazar bir daha istenmez.
+    - Aynı anahtar için eşzamanlı istekler tek bir sonucu bekler.
+    - `batch_window` saniye içinde biriken anahtarlar tek partide çözülür;
+      partideki her farklı anahtar için `fetch_one` en fazla bir kez çağrılır.
+      Toplu uç noktası olan kaynaklar `fetch_batch`'i ezebilir.
+    """
+
+    def __init__(self, fetch_one: Callable[[str, Any], Awaitable[Optional[str]]],
+                 batch_window: float = 0.01, max_batch: int = 50, max_cache: int = 50_000):
+        self.fetch_one = fetch_one
+        self.batch_window = batch_window
+        self.max_batch = max_batch
+        self.max_cache = max_cache
+        self._names: "OrderedDict[str, str]" = OrderedDict()
+        self._pending: Dict[str, asyncio.Future] = {}  # Çözülmekte olan anahtarlar
+        self._queue: List[str] = []  # Henüz partiye girmemiş anahtarlar
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._session: Any = None  # Partiyi gönderecek HTTP oturumu
+        self._tasks: Set[asyncio.Task] = set()
+        self.requests = 0  # İstatistik: fetch_one çağrı sayısı
+
+    def cached(self, key: str) -> Optional[str]:
+        name = self._names.get(key)
+        if name is not None:
+            self._names.move_to_end(key)
+        return name
+
+    async def resolve(self, key: str, session: Any = None) -> Optional[str]:
+        name = self.cached(key)
+        if name is not None:
+            return name
+
+        future = self._pending.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = self._pending[key] = loop.create_future()
+            self._queue.append(key)
+            self._session = session
+            if len(self._queue) >= self.max_batch:
+                self._flush()
+            elif self._flush_handle is None:
+                self._flush_handle = loop.call_later(self.batch_window, self._flush)
+        return await asyncio.shield(future)
+
+    def _flush(self):
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        keys, self._queue = self._queue, []
+        if keys:
+            task = asyncio.ensure_future(self._run_batch(keys, self._session))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(self, keys: List[str], session: Any):
+        try:
+            names = await self.fetch_batch(keys, session)
+        except Exception as e:
+            logging.warning(f"Yazar bilgisi alınamadı ({len(keys)} anahtar): {str(e)}")
+            names = {}
+        for key in keys:
+            name = names.get(key)
+            if name is not None:
+                self._remember(key, name)
+            future = self._pending.pop(key, None)
+            if future is not None and not future.done():
+                future.set_result(name)
+
+    async def fetch_batch(self, keys: Iterable[str], session: Any = None) -> Dict[str, Optional[str]]:
+        keys = list(dict.fromkeys(keys))
+        self.requests += len(keys)
+        results = await asyncio.gather(*(self.fetch_one(k, session) for k in keys), return_exceptions=True)
+        names = {}
+        for key, result in zip(keys, results):
+            if isinstance(result, Exception):
+                logging.warning(f"Yazar bilgisi alınamadı ({key}): {str(result)}")
+            else:
+                names[key] = result
+        return names
+
+    def _remember(self, key: str, name: str):
+        self._names[key] = sys.intern(name)
+        self._names.move_to_end(key)
+        while len(self._names) > self.max_cache:
+            self._names.popitem(last=False)
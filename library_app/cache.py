@@ -0,0 +1,113 @@
+import sqlite3
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+
+from . import metrics
+from .isbn import canonical
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS metadata (
+    isbn TEXT PRIMARY KEY,
+    title TEXT,
+    author TEXT,
+    book_isbn TEXT,
+    expires_at REAL NOT NULL
+)
+"""
+
+
+class MetadataCache:
+    """API sonuçları için iki katmanlı önbellek.
+
+    Bellekte boyutu sınırlı bir LRU, arkasında (path verilirse) sqlite
+    dosyası bulunur. Kayıtlar kanonik ISBN ile tutulur; bir kitabın bütün
+    ISBN-10/13 karşılıkları aynı kayda çıkar. Bulunamayan (404) ISBN'ler de
+    daha kısa bir süre için saklanır.
+    """
+
+    def __init__(self, path: Optional[str] = None, max_entries: int = 10_000,
+                 ttl: float = 30 * 24 * 3600, negative_ttl: float = 24 * 3600):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        # kanonik ISBN -> (son geçerlilik zamanı, kitap kaydı veya None)
+        self._memory: "OrderedDict[str, Tuple[float, Optional[Dict]]]" = OrderedDict()
+        self._conn: Optional[sqlite3.Connection] = None
+        if path is not None:
+            self._conn = sqlite3.connect(str(Path(path)))
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(_SCHEMA)
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def get(self, isbn: str) -> Tuple[bool, Optional[Dict]]:
+        """(önbellekte var mı, kitap kaydı) döner; kayıt None ise ISBN daha önce bulunamamıştır"""
+        key = canonical(isbn)
+        now = time.time()
+        entry = self._memory.get(key)
+        layer = "memory"
+        if entry is None and self._conn is not None:
+            layer = "disk"
+            row = self._conn.execute(
+                "SELECT expires_at, title, author, book_isbn FROM metadata WHERE isbn = ?", (key,)
+            ).fetchone()
+            if row is not None:
+                record = {"title": row[1], "author": row[2], "isbn": row[3]} if row[1] is not None else None
+                entry = (row[0], record)
+                self._remember(key, entry)
+
+        if entry is None:
+            metrics.inc("library_cache_requests_total", result="miss", layer=layer)
+            return False, None
+        if entry[0] < now:
+            self._forget(key)
+            metrics.inc("library_cache_requests_total", result="expired", layer=layer)
+            return False, None
+        self._memory.move_to_end(key)
+        metrics.inc("library_cache_requests_total", result="hit" if entry[1] else "negative_hit", layer=layer)
+        return True, entry[1]
+
+    def put(self, isbns: Iterable[str], record: Dict):
+        """Kitap kaydını verilen bütün ISBN'ler (ve kitabın kendi ISBN'i) altında saklar"""
+        keys = {canonical(i) for i in isbns} | {canonical(record["isbn"])}
+        self._store(keys, (time.time() + self.ttl, record))
+
+    def put_missing(self, isbn: str):
+        self._store({canonical(isbn)}, (time.time() + self.negative_ttl, None))
+
+    def clear(self):
+        self._memory.clear()
+        if self._conn is not None:
+            with self._conn:
+                self._conn.execute("DELETE FROM metadata")
+
+    def _store(self, keys, entry: Tuple[float, Optional[Dict]]):
+        keys = [k for k in keys if k]
+        for key in keys:
+            self._remember(key, entry)
+        if self._conn is not None:
+            expires_at, record = entry
+            row = (record["title"], record["author"], record["isbn"]) if record else (None, None, None)
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO metadata (isbn, title, author, book_isbn, expires_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    [(key, *row, expires_at) for key in keys],
+                )
+
+    def _remember(self, key: str, entry: Tuple[float, Optional[Dict]]):
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _forget(self, key: str):
+        self._memory.pop(key, None)
+        if self._conn is not None:
+            with self._conn:
+                self._conn.execute("DELETE FROM metadata WHERE isbn = ?", (key,))
@@ -1,17 +1,52 @@
 # cli.py
+import json
+import logging
+import os
+import sys
+from typing import Optional
+
 import click
+from . import metrics
 from .models import Library, Book
 
-# Tek bir kütüphane nesnesi
-library = Library()
+METRICS_FILE = 'library.metrics.json'
+
+# Tek bir kütüphane nesnesi; ilk komutta oluşturulur (--help kataloga dokunmaz)
+library: Optional[Library] = None
+file_path = 'library.json'
+
+def get_library() -> Library:
+    global library
+    if library is None:
+        library = Library(file_path)
+    return library
 
 @click.group(invoke_without_command=True)
+@click.option('--file', 'catalog', default='library.json', show_default=True,
+              help='Katalog dosyası (.snap uzantılı ise ikili anlık görüntü)')
+@click.option('--metrics/--no-metrics', 'collect_metrics', default=None,
+              help=f'Komutun ölçümlerini {METRICS_FILE} dosyasına ekle (varsayılan: LIBRARY_METRICS)')
 @click.pass_context
-def cli(ctx):
+def cli(ctx, catalog, collect_metrics):
     """E-Library Management CLI"""
+    global file_path
+    file_path = catalog
+    logging.basicConfig(
+        filename='library.log',
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s'
+    )
+    if collect_metrics is not None:
+        metrics.registry.enabled = collect_metrics
+    if metrics.registry.enabled and ctx.invoked_subcommand not in (None, 'stats'):
+        ctx.call_on_close(_save_metrics)
     if ctx.invoked_subcommand is None:
         click.echo(ctx.get_help())  # Komut verilmezse ana menü/yardım göster
 
+def _save_metrics():
+    metrics.save(METRICS_FILE)
+    metrics.registry.reset()  # Aynı süreçte sonraki komut aynı ölçümleri yeniden eklemesin
+
 @cli.command()
 @click.option('--title', prompt='Book title')
 @click.option('--author', prompt='Author')
@@ -19,39 +54,206 @@ def cli(ctx):
 def add(title, author, isbn):
     """Yeni kitap ekler"""
     book = Book(title, author, isbn)
-    library.add_book(book)
+    get_library().add_book(book)
 
 @cli.command(name="list-books")
-def list_books():
-    """Tüm kitapları listeler"""
-    library.list_books()
+@click.option('--page', default=1, show_default=True, type=click.IntRange(min=1), help='Sayfa numarası')
+@click.option('--limit', default=20, show_default=True, type=click.IntRange(min=1), help='Sayfa başına kitap')
+@click.option('--sort', 'sort_by', type=click.Choice(['title', '-title', 'author', '-author', 'isbn', '-isbn']),
+              default=None, help='Sıralama alanı (- önekiyle ters); varsayılan ekleme sırası')
+@click.option('--filter', 'filter_', default=None, help='Başlık veya yazarda geçen metin')
+@click.option('--stream', is_flag=True, help='Sayfalamadan bütün kitapları doğrudan yaz')
+def list_books(page, limit, sort_by, filter_, stream):
+    """Kitapları sayfa sayfa listeler"""
+    library = get_library()
+    if stream:
+        out = sys.stdout
+        for book in library.iter_books(sort_by, filter_):
+            out.write(f"{book}\n")
+        return
+
+    result = library.list_books(offset=(page - 1) * limit, limit=limit, sort_by=sort_by, filter=filter_)
+    for line in result:
+        click.echo(line)
+    pages = max(1, -(-result.total // limit))
+    click.echo(f"Sayfa {page}/{pages} (toplam {result.total} kitap)")
 
 @cli.command()
 @click.option('--isbn', prompt='ISBN')
 def remove(isbn):
     """ISBN ile kitap siler"""
-    library.remove_book(isbn)
+    get_library().remove_book(isbn)
 
 @cli.command()
 @click.option('--query', prompt='Search by ISBN, title, or author')
-def find(query):
+@click.option('--limit', default=20, show_default=True, help='En fazla sonuç sayısı')
+def find(query, limit):
     """ISBN, başlık veya yazar ile kitap arar"""
-    results = []
-    for b in library.books:
-        if query.lower() in b.isbn.lower() or query.lower() in b.title.lower() or query.lower() in b.author.lower():
-            results.append(b)
+    library = get_library()
+    results = library.search(query, limit=limit)
 
     if results:
         for book in results:
             print(book)
     else:
         # Yakın eşleşme kontrolü
-        titles = [b.title for b in library.books]
-        authors = [b.author for b in library.books]
-        suggestions = get_close_matches(query, titles + authors, n=3, cutoff=0.5)
+        suggestions = library.suggest(query, n=3, cutoff=0.5, include_authors=True)
         if suggestions:
             print("Book not found. Did you mean?")
             for s in suggestions:
                 print(f" - {s}")
         else:
             print("Book not found.")
+
+@cli.command()
+@click.option('--source', default='library.json', show_default=True, help='İçe aktarılacak JSON dosyası')
+@click.option('--target', default='library.db', show_default=True, help='SQLite veritabanı')
+def migrate(source, target):
+    """library.json dosyasını SQLite veritabanına aktarır"""
+    from .sqlite_library import SQLiteLibrary
+
+    with SQLiteLibrary(target) as db:
+        added = db.import_json(source)
+        click.echo(f"{added} kitap aktarıldı ({target}, toplam {len(db)})")
+
+@cli.command(name="import")
+@click.argument('source', type=click.Path(exists=True, dir_okay=False))
+@click.option('--format', 'fmt', type=click.Choice(['json', 'jsonl', 'csv']), default=None,
+              help='Dosya biçimi (varsayılan: uzantıdan)')
+@click.option('--chunk-size', default=1000, show_default=True, help='Tek kayıt işlemindeki kitap sayısı')
+def import_(source, fmt, chunk_size):
+    """JSON, JSON Lines veya CSV dosyasındaki kitapları akış halinde ekler"""
+    try:
+        counts = get_library().import_file(source, fmt=fmt, chunk_size=chunk_size)
+    except ValueError as e:
+        raise click.ClickException(str(e))
+    click.echo(f"{counts['added']} kitap eklendi, {counts['duplicates']} zaten mevcut, "
+               f"{counts['skipped']} kayıt atlandı ({counts['read']} okundu)")
+
+@cli.command()
+@click.argument('target', type=click.Path(dir_okay=False))
+@click.option('--format', 'fmt', type=click.Choice(['json', 'jsonl', 'csv']), default=None,
+              help='Dosya biçimi (varsayılan: uzantıdan)')
+@click.option('--chunk-size', default=1000, show_default=True, help='Tek seferde yazılan kayıt sayısı')
+def export(target, fmt, chunk_size):
+    """Katalogu JSON, JSON Lines veya CSV dosyasına yazar"""
+    try:
+        written = get_library().export_file(target, fmt=fmt, chunk_size=chunk_size)
+    except ValueError as e:
+        raise click.ClickException(str(e))
+    click.echo(f"{written} kitap yazıldı ({target})")
+
+@cli.command()
+@click.argument('source', type=click.Path(exists=True, dir_okay=False))
+@click.argument('target', type=click.Path(dir_okay=False))
+def convert(source, target):
+    """Katalogu biçimler arasında çevirir (JSON <-> .snap ikili anlık görüntü, JSON Lines, CSV)"""
+    from .snapshot import write_snapshot
+    from .storage import open_storage
+    from . import streaming
+
+    def catalog_format(path):
+        return 'snap' if path.endswith('.snap') else streaming.detect_format(path)
+
+    try:
+        source_fmt, target_fmt = catalog_format(source), catalog_format(target)
+    except ValueError as e:
+        raise click.ClickException(str(e))
+    if source_fmt in ('json', 'snap'):
+        # Katalog dosyası: günlükte bekleyen değişiklikler de dahil edilir
+        records = open_storage(source).load()
+    else:
+        records = streaming.read_records(source, source_fmt)
+    if target_fmt == 'snap':
+        written = write_snapshot(target, records)
+    else:
+        written = streaming.write_records(target, records, target_fmt)
+    click.echo(f"{written} kitap yazıldı ({target})")
+
+@cli.command(name="import-isbns")
+@click.argument('source', type=click.File('r'), default='-')
+@click.option('--concurrency', default=8, type=click.IntRange(min=1), show_default=True, help='Eşzamanlı API isteği sayısı')
+def import_isbns(source, concurrency):
+    """Dosyadaki (veya stdin) ISBN'leri API'den çekip ekler; her satırda bir ISBN"""
+    import asyncio  # Ağ komutlarına özgü; diğer komutların açılışını yavaşlatmasın
+
+    isbns = (line.strip() for line in source if line.strip())
+    library = get_library()
+
+    async def run():
+        added = 0
+        async with library:
+            async for isbn, book in library.fetch_books_from_api(isbns, concurrency=concurrency):
+                if book is None:
+                    click.echo(f"❌ {isbn}: bulunamadı")
+                elif library.add_book(book):
+                    added += 1
+                    click.echo(f"✅ {isbn}: {book.title}")
+                else:
+                    click.echo(f"⚠️ {isbn}: zaten mevcut")
+        return added
+
+    added = asyncio.run(run())
+    click.echo(f"{added} kitap eklendi")
+
+@cli.command(name="import-search")
+@click.argument('query')
+@click.option('--max-results', default=1000, show_default=True, type=click.IntRange(min=1),
+              help='En fazla eklenecek arama sonucu')
+@click.option('--page-size', default=100, show_default=True, type=click.IntRange(1, 1000),
+              help='İstek başına sonuç sayısı')
+@click.option('--chunk-size', default=1000, show_default=True, help='Tek kayıt işlemindeki kitap sayısı')
+def import_search(query, max_results, page_size, chunk_size):
+    """OpenLibrary aramasının sonuçlarını sayfa sayfa çekip ekler"""
+    import asyncio
+    from .api_client import OpenLibraryClient, search_doc_to_record
+    from .exceptions import APIError
+
+    library = get_library()
+
+    async def run():
+        async with OpenLibraryClient(session=library.session) as client:
+            docs = client.iter_search(query, page_size=page_size, max_results=max_results)
+            try:
+                return await library.import_records((search_doc_to_record(d) async for d in docs), chunk_size)
+            finally:
+                await library.aclose()
+
+    try:
+        counts = asyncio.run(run())
+    except APIError as e:
+        raise click.ClickException(str(e))
+    click.echo(f"{counts['added']} kitap eklendi, {counts['duplicates']} zaten mevcut, "
+               f"{counts['skipped']} sonuç atlandı ({counts['read']} sonuç okundu)")
+
+@cli.command()
+@click.option('--host', default='127.0.0.1', show_default=True)
+@click.option('--port', default=8080, show_default=True)
+def serve(host, port):
+    """Katalogu HTTP/JSON servisi olarak sunar"""
+    import asyncio
+    from .server import serve as run_server
+
+    try:
+        asyncio.run(run_server(get_library(), host, port))
+    except KeyboardInterrupt:
+        pass
+
+@cli.command()
+@click.option('--format', 'fmt', type=click.Choice(['prometheus', 'json']), default='prometheus',
+              show_default=True)
+@click.option('--reset', is_flag=True, help='Yazdırdıktan sonra biriken ölçümleri sil')
+def stats(fmt, reset):
+    """--metrics ile çalışan komutlardan biriken ölçümleri yazdırır"""
+    collected = metrics.load(METRICS_FILE)
+    collected.merge(metrics.registry.snapshot())
+    if fmt == 'json':
+        click.echo(json.dumps(collected.snapshot(), indent=2))
+    else:
+        text = collected.to_prometheus()
+        click.echo(text or "# Ölçüm yok (komutları --metrics ile çalıştırın)", nl=not text)
+    if reset and os.path.exists(METRICS_FILE):
+        os.remove(METRICS_FILE)
+
+if __name__ == "__main__":
+    cli()
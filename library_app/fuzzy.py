@@ -0,0 +1,74 @@
+import heapq
+from collections import Counter
+from typing import Dict, List, Set, Tuple
+
+
+def _grams(value: str) -> Set[str]:
+    padded = f"  {value} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class FuzzyIndex:
+    """"Bunu mu demek istediniz?" önerileri için trigram indeksi.
+
+    Her sorguda bütün katalogu difflib ile taramak yerine sorguyla en çok
+    trigram paylaşan `candidates` değer seçilir ve yalnızca bunlar
+    SequenceMatcher ile puanlanır; sonuçlar get_close_matches ile aynı
+    biçimdedir. Büyük/küçük harf ayrımı yapılmaz.
+    """
+
+    def __init__(self, candidates: int = 50):
+        self.candidates = candidates
+        self._grams: Dict[str, Set[str]] = {}  # trigram -> küçük harfli değerler
+        self._values: Dict[str, str] = {}  # küçük harfli değer -> ilk eklenen yazılışı
+        self._refs: Counter = Counter()  # Aynı değeri paylaşan kitap sayısı
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def add(self, value: str):
+        key = value.lower()
+        self._refs[key] += 1
+        if self._refs[key] > 1:
+            return
+        self._values[key] = value
+        for gram in _grams(key):
+            self._grams.setdefault(gram, set()).add(key)
+
+    def remove(self, value: str):
+        key = value.lower()
+        if self._refs[key] > 1:
+            self._refs[key] -= 1
+            return
+        if self._refs.pop(key, None) is None:
+            return
+        del self._values[key]
+        for gram in _grams(key):
+            keys = self._grams[gram]
+            keys.discard(key)
+            if not keys:
+                del self._grams[gram]
+
+    def scored(self, query: str, n: int = 3, cutoff: float = 0.6) -> List[Tuple[float, str]]:
+        """En benzer `n` değeri (benzerlik, değer) olarak döner"""
+        query = query.lower()
+        shared: Counter = Counter()
+        for gram in _grams(query):
+            shared.update(self._grams.get(gram, ()))
+
+        from difflib import SequenceMatcher  # Yalnızca öneri istendiğinde yüklenir
+
+        matcher = SequenceMatcher()
+        matcher.set_seq2(query)
+        results = []
+        for key, _ in shared.most_common(self.candidates):
+            # Uzunluk farkı tek başına eşiği aşmayı imkansız kılıyorsa atla
+            if 2 * min(len(key), len(query)) / (len(key) + len(query)) < cutoff:
+                continue
+            matcher.set_seq1(key)
+            if matcher.quick_ratio() >= cutoff and matcher.ratio() >= cutoff:
+                results.append((matcher.ratio(), self._values[key]))
+        return heapq.nlargest(n, results)
+
+    def suggest(self, query: str, n: int = 3, cutoff: float = 0.6) -> List[str]:
+        return [value for _, value in self.scored(query, n, cutoff)]
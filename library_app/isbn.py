@@ -0,0 +1,104 @@
+"""ISBN-10 / ISBN-13 doğrulama, dönüştürme ve kanonik anahtar üretimi.
+
+Kanonik anahtar: geçerli her ISBN (10 veya 13 haneli, tireli/boşluklu)
+için ayraçsız ISBN-13; geçersiz değerler için baştaki/sondaki boşlukları
+atılmış büyük harfli ham değer. Katalog indeksleri, tekrar kontrolü,
+kalıcı kayıtlar ve API önbelleği bu anahtarı kullanır.
+"""
+from operator import mul
+from typing import Iterable, Iterator, List, Optional
+
+_SEPARATORS = str.maketrans("", "", "- \t")
+_W10 = (10, 9, 8, 7, 6, 5, 4, 3, 2)
+_ZERO = ord("0")
+_W10_OFFSET = _ZERO * sum(_W10)
+_DIGIT = "0123456789"
+_W13_OFFSET = _ZERO * (6 + 3 * 6)
+
+
+def clean(isbn: str) -> str:
+    """Tire/boşluk gibi ayraçları atar; ISBN-10 kontrol hanesi 'X' korunur"""
+    return "".join(c for c in isbn.upper() if c.isdigit() or c == "X")
+
+
+def _isbn10_check(body: bytes) -> str:
+    check = (11 - (sum(map(mul, body, _W10)) - _W10_OFFSET) % 11) % 11
+    return "X" if check == 10 else str(check)
+
+
+def _isbn13_check(body: bytes) -> str:
+    # Tek/çift konumların toplamı C seviyesinde: sum(bytes dilimi)
+    total = sum(body[0:12:2]) + 3 * sum(body[1:12:2]) - _W13_OFFSET
+    return _DIGIT[(10 - total % 10) % 10]
+
+
+def _compact(isbn: str) -> str:
+    if not isbn.isalnum():  # translate pahalı: yalnızca ayraç varsa
+        isbn = isbn.translate(_SEPARATORS)
+    return isbn if isbn.isdigit() else isbn.upper()
+
+
+def is_valid_isbn10(isbn: str) -> bool:
+    value = _compact(isbn)
+    return (len(value) == 10 and value[:9].isdigit() and value[:9].isascii()
+            and _isbn10_check(value[:9].encode()) == value[9])
+
+
+def is_valid_isbn13(isbn: str) -> bool:
+    value = _compact(isbn)
+    return (len(value) == 13 and value.isdigit() and value.isascii()
+            and _isbn13_check(value[:12].encode()) == value[12])
+
+
+def is_valid(isbn: str) -> bool:
+    """Kontrol hanesi doğru bir ISBN-10 veya ISBN-13 mü?"""
+    return is_valid_isbn10(isbn) or is_valid_isbn13(isbn)
+
+
+def to_isbn13(isbn10: str) -> str:
+    """ISBN-10'u 978 önekli ISBN-13'e çevirir (kontrol hanesi yeniden hesaplanır)"""
+    body = "978" + clean(isbn10)[:9]
+    return body + _isbn13_check(body.encode())
+
+
+def to_isbn10(isbn13: str) -> Optional[str]:
+    """978 önekli ISBN-13'ü ISBN-10'a çevirir; 979 önekinin ISBN-10 karşılığı yoktur"""
+    value = _compact(isbn13)
+    if not is_valid_isbn13(value) or not value.startswith("978"):
+        return None
+    body = value[3:12]
+    return body + _isbn10_check(body.encode())
+
+
+def canonical(isbn: str) -> str:
+    """Aynı kitabın bütün ISBN yazılışları için ortak anahtar"""
+    value = _compact(isbn)
+    if len(value) == 13:
+        if value.isdigit() and value.isascii() and _isbn13_check(value[:12].encode()) == value[12]:
+            return value
+    elif len(value) == 10:
+        body = value[:9]
+        if body.isdigit() and body.isascii() and _isbn10_check(body.encode()) == value[9]:
+            body = "978" + body
+            return body + _isbn13_check(body.encode())
+    return isbn.strip().upper()
+
+
+def iter_canonical(isbns: Iterable[str]) -> Iterator[str]:
+    """Büyük içe aktarmalar için akış halinde kanonik anahtar üretir"""
+    return map(canonical, isbns)
+
+
+def canonical_many(isbns: Iterable[str]) -> List[str]:
+    """ISBN listesini toplu olarak kanonik anahtarlara çevirir"""
+    return list(map(canonical, isbns))
+
+
+def aliases(isbn: str) -> List[str]:
+    """ISBN'in bilinen bütün ayraçsız biçimleri (ISBN-13 ve varsa ISBN-10)"""
+    key = canonical(isbn)
+    if not is_valid_isbn13(key):
+        return [key]
+    isbn10 = to_isbn10(key)
+    return [key, isbn10] if isbn10 else [key]
+
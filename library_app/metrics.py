@@ -0,0 +1,203 @@
+"""Sayaçlar, histogramlar ve süre ölçümleri (span).
+
+Varsayılan olarak kapalıdır; `LIBRARY_METRICS=1` ortam değişkeni, CLI'da
+`--metrics` veya `registry.enable()` ile açılır. Kapalıyken her çağrı tek
+bir bayrak kontrolüyle döner ve hiçbir şey kaydedilmez.
+
+    from . import metrics
+    metrics.inc("library_lookups_total", result="hit")
+    with metrics.span("library_operation_seconds", op="load"):
+        ...
+
+Anlık görüntü Prometheus metin biçiminde (`to_prometheus`) veya JSON
+(`snapshot`) olarak alınabilir; `merge` ile başka bir süreçten gelen
+görüntü eklenebilir. CLI komutları ölçümlerini `save` ile bir dosyada
+biriktirir, `stats` komutu bu dosyayı okur.
+"""
+import json
+import os
+import time
+from bisect import bisect_left
+from contextlib import nullcontext
+from typing import Dict, List, Optional, Tuple
+
+# Saniye cinsinden üst sınırlar; sonuncusu +Inf
+DEFAULT_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0)
+
+_Key = Tuple[str, Tuple[Tuple[str, str], ...]]
+_NULL_SPAN = nullcontext()
+
+
+class Histogram:
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # Kova başına (birikimsiz) sayı
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative(self) -> List[Tuple[str, int]]:
+        total, result = 0, []
+        for bound, count in zip([*map(repr, self.buckets), "+Inf"], self.counts):
+            total += count
+            result.append((bound, total))
+        return result
+
+
+class _Span:
+    __slots__ = ("registry", "name", "labels", "start")
+
+    def __init__(self, registry: "Registry", name: str, labels: Dict):
+        self.registry = registry
+        self.name = name
+        self.labels = labels
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, *exc):
+        if exc_type is not None:
+            self.labels["error"] = exc_type.__name__
+        self.registry.observe(self.name, time.perf_counter() - self.start, **self.labels)
+
+
+class Registry:
+    def __init__(self, enabled: bool = False, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.enabled = enabled
+        self.buckets = buckets
+        self._counters: Dict[_Key, float] = {}
+        self._histograms: Dict[_Key, Histogram] = {}
+
+    def enable(self):
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+
+    def reset(self):
+        self._counters.clear()
+        self._histograms.clear()
+
+    def inc(self, name: str, value: float = 1, **labels):
+        if not self.enabled:
+            return
+        key = (name, tuple(sorted(labels.items())))
+        self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, name: str, value: float, **labels):
+        if not self.enabled:
+            return
+        key = (name, tuple(sorted(labels.items())))
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            histogram = self._histograms[key] = Histogram(self.buckets)
+        histogram.observe(value)
+
+    def span(self, name: str, **labels):
+        """Blok süresini `name` histogramına yazar; hata olursa `error` etiketi eklenir"""
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name, labels)
+
+    def counter(self, name: str, **labels) -> float:
+        return self._counters.get((name, tuple(sorted(labels.items()))), 0)
+
+    def histogram(self, name: str, **labels) -> Histogram:
+        return self._histograms.get((name, tuple(sorted(labels.items()))))
+
+    # Export
+    def snapshot(self) -> Dict:
+        """JSON'a yazılabilir anlık görüntü"""
+        return {
+            "counters": [{"name": n, "labels": dict(l), "value": v} for (n, l), v in sorted(self._counters.items())],
+            "histograms": [
+                {"name": n, "labels": dict(l), "count": h.count, "sum": h.sum,
+                 "buckets": list(h.buckets), "counts": list(h.counts)}
+                for (n, l), h in sorted(self._histograms.items(), key=lambda item: item[0])
+            ],
+        }
+
+    def merge(self, snapshot: Dict):
+        """Başka bir süreçten alınmış anlık görüntüyü ekler (kapalıyken de çalışır)"""
+        for item in snapshot.get("counters", []):
+            key = (item["name"], tuple(sorted(item["labels"].items())))
+            self._counters[key] = self._counters.get(key, 0) + item["value"]
+        for item in snapshot.get("histograms", []):
+            key = (item["name"], tuple(sorted(item["labels"].items())))
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram(tuple(item["buckets"]))
+            if list(histogram.buckets) != item["buckets"]:
+                continue  # Farklı kovalarla toplanmış ölçüm birleştirilemez
+            histogram.counts = [a + b for a, b in zip(histogram.counts, item["counts"])]
+            histogram.count += item["count"]
+            histogram.sum += item["sum"]
+
+    def to_prometheus(self) -> str:
+        lines = []
+        typed = set()
+        for (name, labels), value in sorted(self._counters.items()):
+            if name not in typed:
+                typed.add(name)
+                lines.append(f"# TYPE {name} counter")
+            lines.append(f"{name}{_labels(labels)} {_number(value)}")
+        for (name, labels), histogram in sorted(self._histograms.items(), key=lambda item: item[0]):
+            if name not in typed:
+                typed.add(name)
+                lines.append(f"# TYPE {name} histogram")
+            for bound, count in histogram.cumulative():
+                lines.append(f"{name}_bucket{_labels(labels + (('le', bound),))} {count}")
+            lines.append(f"{name}_sum{_labels(labels)} {histogram.sum!r}")
+            lines.append(f"{name}_count{_labels(labels)} {histogram.count}")
+        return "\n".join(lines) + "\n" if lines else ""
+
+
+def load(path) -> Registry:
+    """`save` ile biriktirilmiş ölçümler; dosya yoksa boş kayıt defteri"""
+    loaded = Registry()
+    try:
+        with open(path, encoding="utf-8") as f:
+            loaded.merge(json.load(f))
+    except FileNotFoundError:
+        pass
+    return loaded
+
+
+def save(path, source: Optional[Registry] = None):
+    """`source` ölçümlerini dosyadakilere ekleyerek yazar"""
+    from .storage import FileLock
+    from .streaming import atomic_open
+
+    with FileLock(f"{path}.lock")():  # Aynı anda biten komutlar birbirinin ölçümünü ezmesin
+        merged = load(path)
+        merged.merge((source or registry).snapshot())
+        with atomic_open(path) as f:
+            json.dump(merged.snapshot(), f)
+
+
+def _labels(labels: Tuple[Tuple[str, str], ...]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels) + "}"
+
+
+def _escape(value) -> str:
+    # Prometheus metin biçimi: etiket değerinde \, " ve satır sonu kaçışlanır
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _number(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(value)
+
+
+registry = Registry(enabled=os.environ.get("LIBRARY_METRICS", "") not in ("", "0"))
+
+# Modül düzeyinde kısayollar: metrics.inc(...), metrics.span(...)
+inc = registry.inc
+observe = registry.observe
+span = registry.span
@@ -1,205 +1,708 @@
-import json
-import httpx
+import heapq
 import logging
+import sys
+from bisect import bisect_left, insort
+from contextlib import contextmanager
+from itertools import islice
 from pathlib import Path
-from typing import List, Optional, Dict
-from difflib import get_close_matches
+from typing import TYPE_CHECKING, AsyncIterable, AsyncIterator, Iterable, Iterator, List, Optional, Dict, Set, Tuple
+from .exceptions import APIError
+from .fuzzy import FuzzyIndex
+from .isbn import canonical as canonical_isbn, clean as clean_isbn, is_valid as is_valid_isbn
+from .search import SearchIndex
+from . import metrics, streaming
+from .snapshot import Snapshot, SnapshotBooks, SnapshotIndex
+from .storage import Storage, open_storage, read_json, write_json
 
-logging.basicConfig(
-    filename='library.log',
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s'
-)
+if TYPE_CHECKING:  # httpx/sqlite3 yalnızca ağ ve önbellek yollarında yüklenir
+    from .cache import MetadataCache
+    from .providers import ProviderRegistry
+    from .session import HttpSession
+    from .singleflight import SingleFlight
 
 class Book:
+    # __dict__ yerine sabit alanlar: büyük kataloglarda kitap başına bellek azalır
+    __slots__ = ("title", "author", "isbn")
+
     def __init__(self, title: str, author: str, isbn: str):
         self.title = title
-        self.author = author
+        self.author = sys.intern(author)  # Aynı yazarın kitapları tek metni paylaşır
         self.isbn = isbn
 
+    @classmethod
+    def from_dict(cls, data: Dict) -> "Book":
+        return cls(data["title"], data["author"], data["isbn"])
+
+    def to_dict(self) -> Dict:
+        return {"title": self.title, "author": self.author, "isbn": self.isbn}
+
     def __str__(self):
         return f"{self.title} by {self.author} (ISBN: {self.isbn})"
 
+class BatchResult:
+    """Toplu ekleme/silme işleminin kitap bazında sonucu"""
+
+    def __init__(self):
+        self.added: List[Book] = []
+        self.duplicates: List[Book] = []
+        self.rejected: List[Book] = []
+        self.removed: List[Book] = []
+        self.not_found: List[str] = []
+
+    def __repr__(self):
+        return (f"BatchResult(added={len(self.added)}, duplicates={len(self.duplicates)}, "
+                f"rejected={len(self.rejected)}, removed={len(self.removed)}, "
+                f"not_found={len(self.not_found)})")
+
+class BookPage:
+    """list_books sonucu: yalnızca sayfadaki kitaplar tutulur, metinleri istendikçe üretilir"""
+
+    def __init__(self, books: List[Book], offset: int, limit: Optional[int], total: int):
+        self.books = books
+        self.offset = offset
+        self.limit = limit
+        self.total = total  # Filtreye uyan toplam kitap sayısı
+
+    @property
+    def has_next(self) -> bool:
+        return self.offset + len(self.books) < self.total
+
+    def __len__(self) -> int:
+        return len(self.books)
+
+    def __iter__(self) -> Iterator[str]:
+        return map(str, self.books)
+
+    def __getitem__(self, index: int) -> str:
+        return str(self.books[index])
+
+    def __repr__(self):
+        return f"BookPage(offset={self.offset}, size={len(self.books)}, total={self.total})"
+
 class Library:
-    def __init__(self, file_path: str = "library.json"):
+    """Kitap katalogu.
+
+    Katalog dosyası ilk erişimde okunur (`lazy=False` ile hemen); HTTP
+    oturumu, sağlayıcılar ve API önbelleği de ilk API çağrısında kurulur.
+    Böylece `--help` gibi kataloga dokunmayan yollar bu maliyeti ödemez.
+    """
+
+    def __init__(self, file_path: str = "library.json", storage: Optional[Storage] = None,
+                 session: Optional["HttpSession"] = None, cache: Optional["MetadataCache"] = None,
+                 providers: Optional["ProviderRegistry"] = None, lazy: bool = True):
         self.file_path = Path(file_path)
-        self.books: List[Book] = []
-        self._api_cache = {}  # API yanıtlarını önbelleğe almak için
-        self.load_books()
+        self.storage = storage or open_storage(self.file_path)
+        self._session = session
+        self._owns_session = session is None
+        self._providers = providers
+        self._cache = cache
+        self._inflight: Optional["SingleFlight"] = None  # Kanonik ISBN başına tek API isteği
+        self._loaded = False
+        self._books: Dict[int, Book] = {}  # kitap no -> kitap (ekleme sırası korunur)
+        self._next_id = 0
+        # Arama indeksleri: kanonik ISBN / küçük harfli başlık ve yazar -> sıralı kitap numaraları
+        self._isbn_index: Dict[str, List[int]] = {}
+        self._title_index: Dict[str, List[int]] = {}
+        self._author_index: Dict[str, List[int]] = {}
+        self._sorted: Dict[str, List[int]] = {}  # Sıralama alanı -> sıralı kitap numaraları (önbellek)
+        # Tam metin ve benzerlik indeksleri ilk search/suggest çağrısında kurulur
+        self._search_index: Optional[SearchIndex] = None
+        self._title_fuzzy: Optional[FuzzyIndex] = None
+        self._author_fuzzy: Optional[FuzzyIndex] = None
+        self.suggestion_cutoff = 0.4  # "Benzer kitaplar" önerileri için benzerlik eşiği
+        self._batch: Optional[List[Tuple[str, int, Book]]] = None
+        if not lazy:
+            self.load_books()
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded
+
+    def _ensure_loaded(self):
+        """Katalog yüklü değilse yükler; yüklüyse başka süreçlerin değişikliklerini uygular"""
+        if self._batch is not None:  # batch kilidi tutuyor, katalog zaten güncel
+            return
+        if not self._loaded:
+            self.load_books()
+        else:
+            self._apply_changes()
+
+    def _apply_changes(self):
+        changes = self.storage.changes()
+        if changes is None:  # Dosya tümüyle değişti (ör. başka süreç sıkıştırdı)
+            self.load_books()
+            return
+        self._replay(changes)
+
+    def _replay(self, entries: Iterable[Tuple[str, Dict]]):
+        for op, record in entries:
+            book = Book.from_dict(record)
+            if op == "add":
+                if not self._is_duplicate(book):
+                    self._insert(book)
+            elif op == "remove":
+                book_id = self._find_same(book)
+                if book_id is not None:
+                    self._delete(book_id)
+
+    @contextmanager
+    def _writing(self):
+        """Oku-değiştir-yaz adımı boyunca dosyayı kilitler ve katalogu güncel tutar"""
+        if self._batch is not None:
+            yield
+            return
+        with self.storage.lock():
+            if not self._loaded:
+                self.load_books()
+            else:
+                self._apply_changes()
+            yield
+
+    @property
+    def session(self) -> "HttpSession":
+        if self._session is None:
+            from .session import HttpSession
+            self._session = HttpSession()
+        return self._session
+
+    @session.setter
+    def session(self, session: "HttpSession"):
+        self._session = session
+        self._owns_session = False  # Dışarıdan verilen oturumu aclose() kapatmaz
+
+    @property
+    def providers(self) -> "ProviderRegistry":
+        if self._providers is None:
+            from .providers import default_registry
+            self._providers = default_registry()
+        return self._providers
+
+    @providers.setter
+    def providers(self, providers: "ProviderRegistry"):
+        self._providers = providers
+
+    @property
+    def cache(self) -> "MetadataCache":
+        if self._cache is None:
+            from .cache import MetadataCache
+            # API yanıtları için kalıcı önbellek (ör. library.json.cache.db)
+            self._cache = MetadataCache(self.file_path.with_name(self.file_path.name + ".cache.db"))
+        return self._cache
+
+    @cache.setter
+    def cache(self, cache: "MetadataCache"):
+        self._cache = cache
 
-    # JSON Operations
+    @property
+    def books(self) -> List[Book]:
+        self._ensure_loaded()
+        return list(self._books.values())
+
+    @books.setter
+    def books(self, books: List[Book]):
+        self._reset()
+        for book in books:
+            self._insert(book)
+
+    def _reset(self, snapshot: Optional[Snapshot] = None):
+        """Katalogu boşaltır; `snapshot` verilirse kitaplar ve indeksler onun üzerinden okunur"""
+        self._loaded = True
+        if snapshot is None:
+            self._books = {}
+            self._next_id = 0
+            self._isbn_index = {}
+            self._title_index = {}
+            self._author_index = {}
+        else:  # Kitaplar erişildikçe oluşturulur, indeks aramaları dosyadaki sıralı bölümlerden yapılır
+            self._books = SnapshotBooks(snapshot, Book)
+            self._next_id = len(snapshot)
+            self._isbn_index = SnapshotIndex(snapshot, "isbn")
+            self._title_index = SnapshotIndex(snapshot, "title")
+            self._author_index = SnapshotIndex(snapshot, "author")
+        self._sorted = {}
+        self._search_index = None
+        self._title_fuzzy = None
+        self._author_fuzzy = None
+
+    # Index Operations
+    @staticmethod
+    def _normalize(value: str) -> str:
+        return value.lower()
+
+    def _insert(self, book: Book) -> int:
+        book_id = self._next_id
+        self._next_id += 1
+        self._books[book_id] = book
+        self._index(book_id, book)
+        return book_id
+
+    def _delete(self, book_id: int) -> Book:
+        book = self._books.pop(book_id)
+        self._unindex(book_id, book)
+        return book
+
+    def _index(self, book_id: int, book: Book):
+        for field, (index, key) in zip(self._INDEX_FIELDS, self._index_keys(book)):
+            insort(index.setdefault(key, []), book_id)
+            ids = self._sorted.get(field)
+            if ids is not None:  # Sıralı liste baştan kurulmaz, kitap yerine yerleştirilir
+                insort(ids, book_id, key=lambda i, f=field: (self._field_key(f, self._books[i]), i))
+        self._text_index(book_id, book)
+
+    def _unindex(self, book_id: int, book: Book):
+        for field, (index, key) in zip(self._INDEX_FIELDS, self._index_keys(book)):
+            ids = index[key]  # Numara sırasında: sık anahtarlarda da doğrusal arama yapılmaz
+            del ids[bisect_left(ids, book_id)]
+            if not ids:
+                del index[key]
+            ids = self._sorted.get(field)
+            if ids is not None:  # Kitap sözlükten çıkmış olabilir; anahtarı `book` üzerinden hesaplanır
+                pos = bisect_left(ids, (key, book_id), key=lambda i, f=field: (
+                    key if i == book_id else self._field_key(f, self._books[i]), i))
+                del ids[pos]
+        if self._search_index is not None:
+            self._search_index.remove(book_id, self._search_text(book))
+        if self._title_fuzzy is not None:
+            self._title_fuzzy.remove(book.title)
+            self._author_fuzzy.remove(book.author)
+
+    def _text_index(self, book_id: int, book: Book):
+        if self._search_index is not None:
+            self._search_index.add(book_id, self._search_text(book))
+        if self._title_fuzzy is not None:
+            self._title_fuzzy.add(book.title)
+            self._author_fuzzy.add(book.author)
+
+    def _ensure_text_indexes(self):
+        """Listeleme ve ISBN/başlık aramaları bu indeksleri gerektirmez"""
+        self._ensure_loaded()
+        if self._search_index is None:
+            self._search_index = SearchIndex()
+            with metrics.span("library_operation_seconds", op="text_index"):
+                for book_id, book in self._books.items():
+                    self._search_index.add(book_id, self._search_text(book))
+
+    def _ensure_fuzzy_indexes(self):
+        """Öneri indeksleri ayrı kurulur: yalnızca arama yapan süreç onların belleğini ödemez"""
+        self._ensure_loaded()
+        if self._title_fuzzy is None:
+            self._title_fuzzy = FuzzyIndex()
+            self._author_fuzzy = FuzzyIndex()
+            with metrics.span("library_operation_seconds", op="fuzzy_index"):
+                for book in self._books.values():
+                    self._title_fuzzy.add(book.title)
+                    self._author_fuzzy.add(book.author)
+
+    @staticmethod
+    def _search_text(book: Book) -> str:
+        return f"{book.title} {book.author} {book.isbn}"
+
+    _INDEX_FIELDS = ("isbn", "title", "author")  # _index_keys ile aynı sırada
+
+    def _field_key(self, field: str, book: Book) -> str:
+        return canonical_isbn(book.isbn) if field == "isbn" else self._normalize(getattr(book, field))
+
+    def _index_keys(self, book: Book):
+        return (
+            (self._isbn_index, canonical_isbn(book.isbn)),
+            (self._title_index, self._normalize(book.title)),
+            (self._author_index, self._normalize(book.author)),
+        )
+
+    def _lookup(self, query: str) -> Optional[int]:
+        """Sorguyla ISBN, başlık veya yazarı eşleşen ilk kitabın numarası"""
+        key = self._normalize(query)
+        hits = [
+            ids[0]
+            for ids in (self._isbn_index.get(canonical_isbn(query)), self._title_index.get(key),
+                        self._author_index.get(key))
+            if ids
+        ]
+        return min(hits) if hits else None
+
+    def _find_same(self, book: Book) -> Optional[int]:
+        """Başlığı, yazarı ve ISBN'i aynı olan kitabın numarası"""
+        for book_id in self._isbn_index.get(canonical_isbn(book.isbn), ()):
+            other = self._books[book_id]
+            if other.title == book.title and other.author == book.author:
+                return book_id
+        return None
+
+    def _is_duplicate(self, book: Book) -> bool:
+        if self._normalize(book.title) in self._title_index:
+            return True
+        # ISBN-10/13 ve tireli/tiresiz yazılışlar aynı kanonik anahtara düşer
+        return canonical_isbn(book.isbn) in self._isbn_index
+
+    # Persistence
     def load_books(self):
-        try:
-            if self.file_path.exists():
-                with open(self.file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    self.books = [Book(**item) for item in data]
-        except (json.JSONDecodeError, FileNotFoundError):
-            self.books = []
+        opened = self.storage.open_snapshot()
+        if opened is None:
+            self.books = [Book.from_dict(item) for item in self.storage.load()]
+            return
+        snapshot, entries = opened
+        self._reset(snapshot)
+        self._replay(entries)
 
     def save_books(self):
-        with open(self.file_path, 'w', encoding='utf-8') as f:
-            json.dump([b.__dict__ for b in self.books], f, indent=2)
+        """Tüm katalogu anlık görüntü olarak yazar (günlük sıfırlanır)"""
+        with self._writing():
+            self.storage.compact(b.to_dict() for b in self._books.values())
+
+    def _persist(self, op: str, book_id: int, book: Book):
+        if self._batch is not None:
+            self._batch.append((op, book_id, book))
+            return
+        self.storage.append(op, book.to_dict())
+        if self.storage.needs_compaction():
+            self.save_books()
+
+    @contextmanager
+    def batch(self):
+        """Değişiklikleri blok sonunda tek seferde kaydeder.
+
+        Blok içinde veya kayıt sırasında hata oluşursa bellekteki katalog
+        bloktan önceki haline döner ve diske hiçbir şey yazılmaz.
+        """
+        if self._batch is not None:  # İç içe batch dıştakine katılır
+            yield self
+            return
+
+        with self._writing():  # Blok boyunca diğer süreçler yazamaz
+            self._batch = []
+            try:
+                yield self
+                if self._batch:
+                    self.storage.append_many((op, book.to_dict()) for op, _, book in self._batch)
+            except BaseException:
+                self._rollback(self._batch)
+                raise
+            finally:
+                self._batch = None
+            if self.storage.needs_compaction():
+                self.save_books()
+
+    def _rollback(self, log: List[Tuple[str, int, Book]]):
+        restored = False
+        for op, book_id, book in reversed(log):
+            if op == "add":
+                self._delete(book_id)
+            else:
+                self._books[book_id] = book
+                self._index(book_id, book)
+                restored = True
+        # Geri eklenen kitaplar eski sıralarına yerleşsin (SnapshotBooks numara sırasını kendisi korur)
+        if restored and isinstance(self._books, dict):
+            self._books = dict(sorted(self._books.items()))
+
+    def export_json(self, path: str):
+        """Katalogu library.json biçiminde dışa aktarır"""
+        self._ensure_loaded()
+        write_json(Path(path), (b.to_dict() for b in self._books.values()))
+
+    def import_json(self, path: str) -> int:
+        """library.json biçimindeki dosyadaki yeni kitapları ekler, eklenen sayısını döner"""
+        return sum(self.add_book(Book.from_dict(item)) for item in read_json(Path(path)))
+
+    def import_file(self, path: str, fmt: Optional[str] = None, chunk_size: int = 1000) -> Dict[str, int]:
+        """JSON, JSON Lines veya CSV dosyasını akış halinde içe aktarır.
+
+        Kayıtlar okunur, ISBN'ler kanonik biçime çevrilir, dosya içindeki
+        tekrarlar ayıklanır ve `chunk_size` kitaplık parçalar tek kayıt
+        işlemiyle eklenir. Dosya hiçbir zaman bütünüyle belleğe alınmaz.
+        """
+        counts = {"read": 0, "added": 0, "duplicates": 0, "skipped": 0}
+
+        def counted(records):
+            for record in records:
+                counts["read"] += 1
+                yield record
+
+        records = streaming.dedup(streaming.normalize(counted(streaming.read_records(path, fmt))))
+        for chunk in streaming.chunked(records, chunk_size):
+            self._import_chunk(chunk, counts)
+        counts["skipped"] = counts["read"] - counts["added"] - counts["duplicates"]
+        return counts
+
+    async def import_records(self, records: AsyncIterable[Optional[Dict]], chunk_size: int = 1000) -> Dict[str, int]:
+        """Asenkron kayıt akışını (ör. `OpenLibraryClient.iter_search`) parçalar halinde ekler.
+
+        `import_file` ile aynı sayaçları döner; None veya eksik kayıtlar
+        atlanır. Bellekte en fazla bir parça tutulur.
+        """
+        counts = {"read": 0, "added": 0, "duplicates": 0, "skipped": 0}
+        chunk = []
+        async for record in records:
+            counts["read"] += 1
+            chunk.extend(streaming.normalize([record]))
+            if len(chunk) >= chunk_size:
+                self._import_chunk(chunk, counts)
+                chunk = []
+        if chunk:
+            self._import_chunk(chunk, counts)
+        counts["skipped"] = counts["read"] - counts["added"] - counts["duplicates"]
+        return counts
+
+    def _import_chunk(self, chunk: List[Dict], counts: Dict[str, int]):
+        result = self.add_books(Book.from_dict(r) for r in chunk)
+        counts["added"] += len(result.added)
+        counts["duplicates"] += len(result.duplicates)
+
+    def export_file(self, path: str, fmt: Optional[str] = None, chunk_size: int = 1000) -> int:
+        """Katalogu JSON, JSON Lines veya CSV olarak parçalar halinde yazar, yazılan sayısını döner"""
+        self._ensure_loaded()
+        return streaming.write_records(path, (b.to_dict() for b in self._books.values()), fmt, chunk_size)
 
     # Core Methods
     def add_book(self, book: Book) -> bool:
         """Kitap eklerken tüm ISBN varyasyonlarını kontrol et"""
-        # Kitabın zaten var olup olmadığını kontrol etme
-        for existing_book in self.books:
-            if book.isbn == existing_book.isbn or book.title.lower() == existing_book.title.lower():
+        with self._writing():
+            # Aynı ISBN veya başlık indekste varsa ekleme
+            if self._is_duplicate(book):
                 return False
-        
-        self.books.append(book)
-        self.save_books()
-        return True
 
-    def remove_book(self, isbn: str):
-        book = self.find_book(isbn)
-        if book:
-            self.books.remove(book)
-            self.save_books()
+            self._persist("add", self._insert(book), book)
             return True
-        return False
 
-    def list_books(self):
-        return [str(book) for book in self.books]
+    def add_books(self, books: Iterable[Book]) -> BatchResult:
+        """Kitapları tek kayıt işlemiyle ekler"""
+        result = BatchResult()
+        with self.batch():
+            for book in books:
+                if not isinstance(book, Book) or not book.title.strip() or not book.isbn.strip():
+                    result.rejected.append(book)
+                elif self.add_book(book):
+                    result.added.append(book)
+                else:
+                    result.duplicates.append(book)
+        return result
+
+    def remove_book(self, isbn: str):
+        with self._writing():
+            book_id = self._lookup(isbn)
+            if book_id is not None:
+                self._persist("remove", book_id, self._delete(book_id))
+                return True
+            return False
+
+    def remove_books(self, isbns: Iterable[str]) -> BatchResult:
+        """Kitapları tek kayıt işlemiyle siler"""
+        result = BatchResult()
+        with self.batch():
+            for isbn in isbns:
+                book_id = self._lookup(isbn)
+                if book_id is None:
+                    result.not_found.append(isbn)
+                else:
+                    book = self._delete(book_id)
+                    self._persist("remove", book_id, book)
+                    result.removed.append(book)
+        return result
+
+    SORT_FIELDS = ("title", "author", "isbn")
+
+    def _sorted_list(self, sort_by: str) -> List[int]:
+        """Alana göre artan sıralı kitap numaraları ('-' öneki yok sayılır)"""
+        field = sort_by.lstrip("-")
+        if field not in self.SORT_FIELDS:
+            raise ValueError(f"Geçersiz sıralama alanı: {sort_by} ({', '.join(self.SORT_FIELDS)})")
+        ids = self._sorted.get(field)
+        if ids is None:
+            # Hash indekslerinin anahtarları zaten normalleştirilmiş; yalnızca anahtarlar sıralanır
+            index = {"title": self._title_index, "author": self._author_index, "isbn": self._isbn_index}[field]
+            ids = self._sorted[field] = [i for _, key_ids in sorted(index.items()) for i in key_ids]
+        return ids
+
+    def _sorted_ids(self, sort_by: Optional[str]) -> Iterable[int]:
+        """Kitap numaraları istenen sırada; '-' önekli alan ters sıralar"""
+        if not sort_by:
+            return iter(self._books)
+        ids = self._sorted_list(sort_by)
+        return reversed(ids) if sort_by.startswith("-") else iter(ids)
+
+    def iter_books(self, sort_by: Optional[str] = None, filter: Optional[str] = None) -> Iterator[Book]:
+        """Kitapları ara liste kurmadan sırayla verir.
+
+        `filter` verilirse başlığında veya yazarında bu metni (büyük/küçük
+        harf ayrımı olmadan) içeren kitaplar döner.
+        """
+        self._ensure_loaded()
+        books = map(self._books.__getitem__, self._sorted_ids(sort_by))
+        if filter:
+            needle = filter.lower()
+            books = (b for b in books if needle in b.title.lower() or needle in b.author.lower())
+        return books
+
+    def list_books(self, offset: int = 0, limit: Optional[int] = None, sort_by: Optional[str] = None,
+                   filter: Optional[str] = None) -> BookPage:
+        """`offset`'ten başlayarak en fazla `limit` kitaplık sayfa (limit yoksa hepsi)"""
+        if offset < 0 or (limit is not None and limit < 0):
+            raise ValueError("offset ve limit negatif olamaz")
+        stop = None if limit is None else offset + limit
+        if not filter:
+            self._ensure_loaded()
+            total = len(self._books)
+            if not sort_by:
+                page_ids = islice(self._books, offset, stop)
+            else:  # Sıralı listeden doğrudan dilim alınır: maliyet offset'ten bağımsız
+                ids = self._sorted_list(sort_by)
+                end = total if stop is None else min(stop, total)
+                if not sort_by.startswith("-"):
+                    page_ids = ids[offset:end]
+                else:
+                    page_ids = ids[total - end:total - offset][::-1] if offset < total else []
+            return BookPage([self._books[i] for i in page_ids], offset, limit, total)
+
+        page, total = [], 0
+        for book in self.iter_books(sort_by, filter):  # Filtreye uyanlar sayılırken yalnızca sayfadakiler tutulur
+            if total >= offset and (stop is None or total < stop):
+                page.append(book)
+            total += 1
+        return BookPage(page, offset, limit, total)
+
+    def lookup(self, query: str) -> Optional[Book]:
+        """ISBN, başlık veya yazarı tam eşleşen ilk kitap (öneri yazdırmaz)"""
+        self._ensure_loaded()
+        book_id = self._lookup(query)
+        metrics.inc("library_lookups_total", result="miss" if book_id is None else "hit")
+        return self._books[book_id] if book_id is not None else None
 
     def find_book(self, query: str) -> Optional[Book]:
-        query = query.lower()
-        for book in self.books:
-            if query in (book.isbn.lower(), book.title.lower(), book.author.lower()):
-                return book
-        
-        matches = get_close_matches(query, [b.title for b in self.books], n=3, cutoff=0.4)
+        book = self.lookup(query)
+        if book is not None:
+            return book
+
+        metrics.inc("library_fuzzy_fallbacks_total")
+        matches = [b.title for b in self.search(query, limit=3)] or self.suggest(query)
         if matches:
             print("Benzer kitaplar:")
             for match in matches:
                 print(f"- {match}")
         return None
 
+    def search(self, query: str, limit: int = 10) -> List[Book]:
+        """Başlık, yazar ve ISBN içinde sıralı tam metin araması"""
+        self._ensure_text_indexes()
+        with metrics.span("library_operation_seconds", op="search"):
+            return [self._books[book_id] for book_id, _ in self._search_index.search(query, limit)]
+
+    def suggest(self, query: str, n: int = 3, cutoff: Optional[float] = None,
+                include_authors: bool = False) -> List[str]:
+        """Sorguya en çok benzeyen başlıklar (istenirse yazarlar da)"""
+        self._ensure_fuzzy_indexes()
+        cutoff = self.suggestion_cutoff if cutoff is None else cutoff
+        with metrics.span("library_operation_seconds", op="suggest"):
+            scored = self._title_fuzzy.scored(query, n, cutoff)
+            if include_authors:
+                scored = heapq.nlargest(n, scored + self._author_fuzzy.scored(query, n, cutoff))
+        return [value for _, value in scored]
+
     # API Integration
+    async def aclose(self):
+        """Library'nin kendi oluşturduğu HTTP oturumunu kapatır"""
+        if self._owns_session and self._session is not None:
+            await self._session.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.aclose()
+
     async def fetch_book_from_api(self, isbn: str) -> Optional[Book]:
         """ISBN ile kitap bilgisi getirir (tüm sorunlar giderildi)"""
-        cleaned_isbn = ''.join(c for c in isbn if c.isdigit())
-        if not cleaned_isbn or len(cleaned_isbn) not in (10, 13):
-            print("⚠️ Geçersiz ISBN formatı (10 veya 13 rakam olmalı)")
+        cleaned_isbn = clean_isbn(isbn)  # ISBN-10 kontrol hanesi 'X' korunur
+        if not is_valid_isbn(cleaned_isbn):
+            print("⚠️ Geçersiz ISBN (10 veya 13 haneli ve kontrol hanesi doğru olmalı)")
             return None
 
-        # Önbelleği kontrol etme
-        for cached_isbn, book in self._api_cache.items():
-            if cleaned_isbn in [cached_isbn, book.isbn]:
-                return book
+        # Önbelleği kontrol etme (ISBN-10/13 karşılıkları aynı kayda çıkar)
+        cached, record = self.cache.get(cleaned_isbn)
+        if cached:
+            return Book.from_dict(record) if record else None
 
+        # Aynı kitap için süren bir istek varsa onun sonucu beklenir
+        if self._inflight is None:
+            from .singleflight import SingleFlight
+            self._inflight = SingleFlight()
+        return await self._inflight.do(canonical_isbn(cleaned_isbn), lambda: self._fetch_uncached(cleaned_isbn))
+
+    async def _fetch_uncached(self, cleaned_isbn: str) -> Optional[Book]:
         try:
-            # Open Library'yi deneme (302 yönlendirmelerini takip et)
-            async with httpx.AsyncClient(follow_redirects=True, timeout=10.0) as client:
-                response = await client.get(f"https://openlibrary.org/isbn/{cleaned_isbn}.json")
-                if response.status_code == 404:
-                    return None
-                    
-                data = response.json()
-                
-                # ISBN'leri toplama (10 ve 13 haneli)
-                isbns = set()
-                isbns.add(cleaned_isbn)
-                if "isbn_10" in data:
-                    isbns.update(data["isbn_10"])
-                if "isbn_13" in data:
-                    isbns.update(data["isbn_13"])
-                
-                # Aynı kitabın diğer ISBN'lerini kontrol etme
-                for existing_isbn in isbns:
-                    if existing_isbn in self._api_cache:
-                        return self._api_cache[existing_isbn]
-                
-                # Yazar bilgisi
-                author = "Bilinmeyen Yazar"
-                if "authors" in data:
-                    if isinstance(data["authors"][0], dict):
-                        author = data["authors"][0].get("name", author)
-                    elif isinstance(data["authors"][0], str):
-                        author = data["authors"][0]
-                
-                # Kitap nesnesi oluşturma
-                book = Book(
-                    title=data.get("title", f"Bilinmeyen (ISBN: {cleaned_isbn})"),
-                    author=author,
-                    isbn=cleaned_isbn
-                )
-                
-                # Tüm ISBN'leri önbelleğe ekleme
-                for isbn_num in isbns:
-                    self._api_cache[isbn_num] = book
-                    
-                return book
-                
-        except httpx.RequestError as e:
-            logging.error(f"OpenLibrary API hatası (ISBN: {cleaned_isbn}): {str(e)}")
+            # Sağlayıcılar kayıt sırasıyla ve seçilen modda (hedged/race/sequential) denenir
+            record = await self.providers.lookup(cleaned_isbn, self.session)
+        except APIError as e:
+            logging.error(f"API hatası (ISBN: {cleaned_isbn}): {str(e)}")
             print(f"⚠️ API bağlantı hatası: {str(e)}")
+            return None
         except Exception as e:
             logging.error(f"Beklenmeyen hata (ISBN: {cleaned_isbn}): {str(e)}")
             print(f"⚠️ İşlem hatası: {str(e)}")
-        
-        return None
+            return None
 
-    async def _try_open_library(self, isbn: str) -> Optional[Book]:
-        """Open Library API denemesi (geliştirilmiş)"""
-        url = f"https://openlibrary.org/isbn/{isbn}.json"
-        
-        try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(url)
-                
-                if response.status_code == 404:
-                    return None
-                    
-                response.raise_for_status()
-                data = response.json()
-                
-                # Debug için ham veriyi logla
-                logging.debug(f"OpenLibrary API Yanıtı: {data}")
-                
-                title = data.get("title", f"Bilinmeyen (ISBN: {isbn})")
-                
-                # Yazar bilgisi için gelişmiş çözüm
-                author = "Bilinmeyen Yazar"
-                if "authors" in data and data["authors"]:
-                    first_author = data["authors"][0]
-                    if isinstance(first_author, dict):
-                        author = first_author.get("name", author)
-                    elif isinstance(first_author, str):
-                        author = first_author
-                    elif "key" in first_author:
-                        author_url = f"https://openlibrary.org{first_author['key']}.json"
-                        author_res = await client.get(author_url)
-                        if author_res.status_code == 200:
-                            author_data = author_res.json()
-                            author = author_data.get("name", author)
-                
-                return Book(title, author, isbn)
-                
-        except httpx.RequestError as e:
-            logging.warning(f"OpenLibrary ağ hatası: {str(e)}")
+        if record is None:
+            self.cache.put_missing(cleaned_isbn)
             return None
-        except (json.JSONDecodeError, KeyError) as e:
-            logging.warning(f"OpenLibrary veri hatası: {str(e)}")
+
+        # Kitap nesnesi oluşturma ve tüm ISBN'leri önbelleğe ekleme
+        book = Book(record["title"], record["author"], cleaned_isbn)
+        self.cache.put([cleaned_isbn, *record.get("aliases", [])], book.to_dict())
+        return book
+
+    async def fetch_books_from_api(self, isbns: Iterable[str],
+                                   concurrency: int = 8) -> AsyncIterator[Tuple[str, Optional[Book]]]:
+        """ISBN'leri en fazla `concurrency` eşzamanlı istekle sorgular.
+
+        Sonuçlar (isbn, kitap) olarak tamamlanma sırasıyla akar. ISBN-10 ve
+        ISBN-13 biçimi aynı olan kitaplar yalnızca bir kez sorgulanır.
+        """
+        import asyncio  # Yalnızca ağ yolunda gerekir; açılışta yüklenmez
+
+        if concurrency < 1:
+            raise ValueError("Eşzamanlı istek sayısı en az 1 olmalı")
+        semaphore = asyncio.Semaphore(concurrency)
+        pending: Set[asyncio.Task] = set()
+
+        async def lookup(key: str) -> Tuple[str, Optional[Book]]:
+            try:
+                return key, await self.fetch_book_from_api(key)
+            finally:
+                semaphore.release()
+
+        seen: Set[str] = set()
+        try:
+            for raw in isbns:
+                key = canonical_isbn(raw)
+                if not key or key in seen:
+                    continue
+                seen.add(key)
+                await semaphore.acquire()  # Boş yer açılana kadar yeni istek başlatma
+                pending.add(asyncio.create_task(lookup(key)))
+                for task in [t for t in pending if t.done()]:
+                    pending.discard(task)
+                    yield task.result()
+
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _try_provider(self, name: str, isbn: str) -> Optional[Book]:
+        provider = self.providers.get(name)
+        try:
+            record = await self.providers.call(provider, isbn, self.session)
+        except Exception as e:
+            logging.warning(f"{name} hatası: {str(e)}")
             return None
+        return Book(record["title"], record["author"], isbn) if record else None
+
+    async def _try_open_library(self, isbn: str) -> Optional[Book]:
+        """Open Library API denemesi (geliştirilmiş)"""
+        return await self._try_provider("openlibrary", isbn)
 
     async def _try_google_books(self, isbn: str) -> Optional[Book]:
         """Google Books API yedek kaynak uygulamak için"""
-        url = f"https://www.googleapis.com/books/v1/volumes?q=isbn:{isbn}"
-        
-        try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                response = await client.get(url)
-                data = response.json()
-                
-                if data.get("totalItems", 0) > 0:
-                    item = data["items"][0]["volumeInfo"]
-                    return Book(
-                        title=item.get("title", "Bilinmeyen"),
-                        author=", ".join(item.get("authors", ["Bilinmeyen Yazar"])),
-                        isbn=isbn
-                    )
-        except Exception:
-            return None
\ No newline at end of file
+        return await self._try_provider("googlebooks", isbn)
@@ -0,0 +1,262 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Dict, Iterable, List, Optional
+
+from . import metrics
+from .authors import AuthorResolver
+from .exceptions import APIError
+from .resilience import ResiliencePolicy
+from .session import HttpSession
+
+
+class LatencyStats:
+    """Bir sağlayıcının son yanıt sürelerini ve hata sayısını tutar"""
+
+    def __init__(self, window: int = 200):
+        self._samples = deque(maxlen=window)
+        self.successes = 0
+        self.misses = 0
+        self.failures = 0
+
+    def record(self, seconds: float):
+        self._samples.append(seconds)
+
+    @property
+    def count(self) -> int:
+        return len(self._samples)
+
+    def percentile(self, p: float) -> Optional[float]:
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(p * len(ordered)))]
+
+    def as_dict(self) -> Dict:
+        return {
+            "count": self.count,
+            "successes": self.successes,
+            "misses": self.misses,
+            "failures": self.failures,
+            "p50": self.percentile(0.50),
+            "p95": self.percentile(0.95),
+        }
+
+
+class Provider:
+    """Kitap bilgisi kaynağı.
+
+    `lookup` bulunan kitabı {"title", "author", "isbn", "aliases"} kaydı
+    olarak, bulunamazsa None döner; ağ/sunucu hatalarında istisna fırlatır.
+    """
+
+    name = "provider"
+    BASE_URL = ""
+    RATE: Optional[float] = None  # Saniyedeki istek sınırı (None: sınırsız)
+    BURST: Optional[float] = None
+
+    def __init__(self, base_url: Optional[str] = None, timeout: float = 10.0,
+                 policy: Optional[ResiliencePolicy] = None):
+        self.base_url = base_url or self.BASE_URL
+        self.timeout = timeout
+        self.policy = policy or ResiliencePolicy(self.name, rate=self.RATE, burst=self.BURST)
+        self.stats = LatencyStats()
+
+    async def lookup(self, isbn: str, session: HttpSession) -> Optional[Dict]:
+        raise NotImplementedError
+
+
+class OpenLibraryProvider(Provider):
+    name = "openlibrary"
+    BASE_URL = "https://openlibrary.org"
+    RATE = 5.0
+    BURST = 10.0
+
+    def __init__(self, base_url: Optional[str] = None, timeout: float = 10.0,
+                 policy: Optional[ResiliencePolicy] = None, authors: Optional[AuthorResolver] = None):
+        super().__init__(base_url, timeout, policy)
+        self.authors = authors or AuthorResolver(self._fetch_author)
+
+    async def _fetch_author(self, key: str, session: HttpSession) -> Optional[str]:
+        response = await self.policy.get(session, f"{self.base_url}{key}.json", timeout=self.timeout)
+        if response.status_code != 200:
+            return None
+        return response.json().get("name")
+
+    async def lookup(self, isbn: str, session: HttpSession) -> Optional[Dict]:
+        response = await self.policy.get(session, f"{self.base_url}/isbn/{isbn}.json", timeout=self.timeout)
+        if response.status_code == 404:
+            return None
+        response.raise_for_status()
+        data = response.json()
+        logging.debug(f"OpenLibrary API Yanıtı: {data}")
+
+        author = "Bilinmeyen Yazar"
+        if data.get("authors"):
+            first_author = data["authors"][0]
+            if isinstance(first_author, str):
+                author = first_author
+            elif "name" in first_author:
+                author = first_author["name"]
+            elif "key" in first_author:
+                # Önbellekli, eşzamanlı istekleri birleştiren ve partiler halinde çözen katman
+                author = await self.authors.resolve(first_author["key"], session) or author
+
+        return {
+            "title": data.get("title", f"Bilinmeyen (ISBN: {isbn})"),
+            "author": author,
+            "isbn": isbn,
+            "aliases": data.get("isbn_10", []) + data.get("isbn_13", []),
+        }
+
+
+class GoogleBooksProvider(Provider):
+    name = "googlebooks"
+    BASE_URL = "https://www.googleapis.com"
+    RATE = 10.0
+    BURST = 20.0
+
+    def __init__(self, base_url: Optional[str] = None, timeout: float = 5.0,
+                 policy: Optional[ResiliencePolicy] = None):
+        super().__init__(base_url, timeout, policy)
+
+    async def lookup(self, isbn: str, session: HttpSession) -> Optional[Dict]:
+        response = await self.policy.get(session, f"{self.base_url}/books/v1/volumes",
+                                         params={"q": f"isbn:{isbn}"}, timeout=self.timeout)
+        response.raise_for_status()
+        data = response.json()
+        if data.get("totalItems", 0) == 0:
+            return None
+        item = data["items"][0]["volumeInfo"]
+        identifiers = item.get("industryIdentifiers", [])
+        return {
+            "title": item.get("title", "Bilinmeyen"),
+            "author": ", ".join(item.get("authors", ["Bilinmeyen Yazar"])),
+            "isbn": isbn,
+            "aliases": [i["identifier"] for i in identifiers if i.get("type", "").startswith("ISBN")],
+        }
+
+
+class ProviderRegistry:
+    """Sağlayıcıları sırasıyla tutar ve aramayı seçilen modda yürütür.
+
+    - "sequential": sıradaki sağlayıcı ancak öncekiler sonuç vermezse denenir
+    - "race": hepsi aynı anda başlar, ilk geçerli yanıt alınır, diğerleri iptal edilir
+    - "hedged": önceki sağlayıcı p95 gecikmesi içinde yanıt vermezse (veya başarısız
+      olursa) sıradaki de başlatılır; ilk geçerli yanıt alınır
+    """
+
+    MODES = ("sequential", "race", "hedged")
+
+    def __init__(self, providers: Optional[Iterable[Provider]] = None, mode: str = "hedged",
+                 hedge_after: float = 1.0, min_samples: int = 20):
+        if mode not in self.MODES:
+            raise ValueError(f"Geçersiz arama modu: {mode}")
+        self._providers: List[Provider] = list(providers or [])
+        self.mode = mode
+        self.hedge_after = hedge_after  # Yeterli ölçüm yokken kullanılan bekleme (s)
+        self.min_samples = min_samples
+
+    @property
+    def providers(self) -> List[Provider]:
+        return list(self._providers)
+
+    def register(self, provider: Provider, index: Optional[int] = None):
+        if index is None:
+            self._providers.append(provider)
+        else:
+            self._providers.insert(index, provider)
+
+    def unregister(self, name: str):
+        self._providers = [p for p in self._providers if p.name != name]
+
+    def get(self, name: str) -> Provider:
+        for provider in self._providers:
+            if provider.name == name:
+                return provider
+        raise KeyError(name)
+
+    def stats(self) -> Dict[str, Dict]:
+        return {p.name: p.stats.as_dict() for p in self._providers}
+
+    def hedge_delay(self, provider: Provider) -> float:
+        """Sıradaki sağlayıcıyı başlatmadan önce beklenecek süre"""
+        p95 = provider.stats.percentile(0.95)
+        if p95 is None or provider.stats.count < self.min_samples:
+            return self.hedge_after
+        return min(max(p95, 0.01), provider.timeout)
+
+    async def call(self, provider: Provider, isbn: str, session: HttpSession) -> Optional[Dict]:
+        """Sağlayıcıyı çağırır ve gecikme/hata istatistiklerini günceller"""
+        start = time.perf_counter()
+        try:
+            record = await provider.lookup(isbn, session)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            provider.stats.failures += 1
+            metrics.observe("library_provider_lookup_seconds", time.perf_counter() - start,
+                            provider=provider.name, result="error")
+            raise
+        elapsed = time.perf_counter() - start
+        provider.stats.record(elapsed)
+        if record is None:
+            provider.stats.misses += 1
+        else:
+            provider.stats.successes += 1
+        metrics.observe("library_provider_lookup_seconds", elapsed, provider=provider.name,
+                        result="miss" if record is None else "hit")
+        return record
+
+    async def lookup(self, isbn: str, session: HttpSession, mode: Optional[str] = None) -> Optional[Dict]:
+        """İlk geçerli kaydı döner; hiçbir sağlayıcı bulamazsa None.
+
+        Hiçbir sağlayıcı sonuç vermez ve en az biri hata verirse APIError
+        fırlatılır (kitabın gerçekten bulunamadığı kesin değildir).
+        """
+        mode = mode or self.mode
+        waiting = list(self._providers)
+        running: Dict[asyncio.Task, Provider] = {}
+        errors: List[str] = []
+
+        def start_next():
+            provider = waiting.pop(0)
+            running[asyncio.create_task(self.call(provider, isbn, session))] = provider
+
+        try:
+            if not waiting:
+                return None
+            start_next()
+            while mode == "race" and waiting:
+                start_next()
+
+            while running:
+                timeout = None
+                if mode == "hedged" and waiting:
+                    timeout = self.hedge_delay(list(running.values())[-1])
+                done, _ = await asyncio.wait(running, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                if not done:  # Gecikme eşiği aşıldı: yedek sağlayıcı da başlasın
+                    start_next()
+                    continue
+                for task in done:
+                    provider = running.pop(task)
+                    if task.exception() is not None:
+                        errors.append(f"{provider.name}: {task.exception()}")
+                        logging.warning(f"{provider.name} hatası (ISBN: {isbn}): {task.exception()}")
+                    elif task.result() is not None:
+                        return task.result()
+                if not running and waiting:
+                    start_next()
+        finally:
+            for task in running:
+                task.cancel()
+
+        if errors:
+            raise APIError("; ".join(errors))
+        return None
+
+
+def default_registry(mode: str = "hedged") -> ProviderRegistry:
+    return ProviderRegistry([OpenLibraryProvider(), GoogleBooksProvider()], mode=mode)
+
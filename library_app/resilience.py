@@ -0,0 +1,161 @@
+import asyncio
+import random
+import time
+from typing import Callable, Optional
+
+import httpx
+
+from . import metrics
+from .exceptions import APIError
+
+
+class CircuitOpenError(APIError):
+    """Devre kesici açıkken sağlayıcıya istek gönderilmez"""
+    pass
+
+
+class TokenBucket:
+    """Saniyede `rate` istek, en fazla `capacity` ani istek"""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None,
+                 clock: Callable[[], float] = time.monotonic):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._clock = clock
+        self._updated = clock()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = self._clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self):
+        async with self._lock:  # Bekleyenler sırayla jeton alır
+            self._refill()
+            while self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= 1
+
+
+class CircuitBreaker:
+    """Art arda `failure_threshold` hatadan sonra `reset_timeout` saniye istekleri keser.
+
+    Süre dolunca tek bir deneme isteğine izin verilir (yarı açık); başarılı
+    olursa devre kapanır, başarısız olursa yeniden açılır.
+    """
+
+    CLOSED, OPEN, HALF_OPEN = "closed", "open", "half-open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0,
+                 clock: Callable[[], float] = time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._probing = False
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return self.CLOSED
+        if self._clock() - self._opened_at >= self.reset_timeout:
+            return self.HALF_OPEN
+        return self.OPEN
+
+    def before_call(self, name: str = "sağlayıcı") -> bool:
+        """İsteğe izin verilmezse CircuitOpenError; istek deneme isteğiyse True döner"""
+        state = self.state
+        if state == self.OPEN or (state == self.HALF_OPEN and self._probing):
+            raise CircuitOpenError(f"{name} geçici olarak devre dışı (devre kesici açık)")
+        if state == self.HALF_OPEN:
+            self._probing = True
+            return True
+        return False
+
+    def abandon_probe(self):
+        """Deneme isteği sonuçlanmadan bırakıldı (ör. iptal): sonraki istek yeniden deneme olabilir"""
+        self._probing = False
+
+    def record_success(self):
+        self._failures = 0
+        self._opened_at = None
+        self._probing = False
+
+    def record_failure(self):
+        self._failures += 1
+        if self._probing or self._failures >= self.failure_threshold:
+            self._opened_at = self._clock()
+        self._probing = False
+
+
+class ResiliencePolicy:
+    """Hız sınırı + üstel geri çekilmeli (jitter'lı) yeniden deneme + devre kesici.
+
+    429 ve 5xx yanıtları ile bağlantı hataları yeniden denenir; bütün
+    denemeler başarısız olursa devre kesiciye hata olarak yazılır.
+    """
+
+    RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+    def __init__(self, name: str = "sağlayıcı", rate: Optional[float] = None, burst: Optional[float] = None,
+                 attempts: int = 3, base_delay: float = 0.2, max_delay: float = 5.0,
+                 failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.name = name
+        self.bucket = TokenBucket(rate, burst) if rate else None
+        self.attempts = attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.breaker = CircuitBreaker(failure_threshold, reset_timeout)
+        self.retries = 0  # İstatistik: yapılan yeniden deneme sayısı
+
+    def backoff(self, attempt: int, response: Optional[httpx.Response] = None) -> float:
+        retry_after = response.headers.get("Retry-After") if response is not None else None
+        if retry_after and retry_after.isdigit():
+            return min(float(retry_after), self.max_delay)
+        # "Full jitter": 0 ile üstel sınır arasında rastgele bekleme
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+    async def get(self, session, url: str, **kwargs) -> httpx.Response:
+        probe = self.breaker.before_call(self.name)
+        try:
+            return await self._get(session, url, **kwargs)
+        except BaseException:
+            # Hedged/race modunda kaybeden istek iptal edilir; sonuç yazılmadıysa
+            # deneme hakkı bırakılmazsa devre süresiz yarı açık kalırdı
+            if probe:
+                self.breaker.abandon_probe()
+            raise
+
+    async def _get(self, session, url: str, **kwargs) -> httpx.Response:
+        response: Optional[httpx.Response] = None
+        for attempt in range(self.attempts):
+            if self.bucket is not None:
+                await self.bucket.acquire()
+            start = time.perf_counter()
+            try:
+                response = await session.get(url, **kwargs)
+            except httpx.TransportError as exc:
+                metrics.observe("library_http_request_seconds", time.perf_counter() - start,
+                                provider=self.name, status=type(exc).__name__)
+                if attempt == self.attempts - 1:
+                    self.breaker.record_failure()
+                    raise
+                response = None
+            else:
+                metrics.observe("library_http_request_seconds", time.perf_counter() - start,
+                                provider=self.name, status=str(response.status_code))
+                if response.status_code not in self.RETRY_STATUSES:
+                    self.breaker.record_success()
+                    return response
+                if attempt == self.attempts - 1:
+                    break
+            self.retries += 1
+            metrics.inc("library_http_retries_total", provider=self.name)
+            await asyncio.sleep(self.backoff(attempt, response))
+
+        self.breaker.record_failure()
+        return response
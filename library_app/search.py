@@ -0,0 +1,221 @@
+import heapq
+import math
+import re
+from bisect import bisect_left, insort
+from collections import Counter
+from typing import Dict, List, Set, Tuple
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Metni küçük harfli kelimelere ayırır"""
+    return _TOKEN_RE.findall(text.lower())
+
+
+def _trigrams(term: str) -> Set[str]:
+    return {term[i:i + 3] for i in range(len(term) - 2)}
+
+
+class SearchIndex:
+    """Başlık, yazar ve ISBN üzerinde ters indeks; sonuçlar BM25 ile sıralanır.
+
+    Sorgudaki her kelime tam eşleşme, önek veya (en az 3 karakterse) alt
+    dize olarak aranır; bir kitabın sonuçlarda yer alması için bütün
+    kelimelerin eşleşmesi gerekir.
+
+    Tek kelimelik sorgularda uzun terim listeleri baştan sona puanlanmaz:
+    BM25 puanı yalnızca (tekrar, kitap uzunluğu) çiftine bağlı olduğundan
+    sık terimlerin kitapları bu çiftlere göre gruplanır; gruplar puan
+    sırasında gezilir ve ilk `limit` kitapta durulur. Çok kelimelik
+    sorgularda adaylar C düzeyinde küme kesişimiyle bulunur, yalnızca onlar
+    puanlanır.
+    """
+
+    K1 = 1.2
+    B = 0.75
+    PREFIX_WEIGHT = 0.8
+    SUBSTRING_WEIGHT = 0.5
+    IMPACT_MIN = 64  # Bu kadar kitapta geçen terimlerin kitapları puan gruplarına da ayrılır
+
+    def __init__(self, max_expansions: int = 64):
+        self.max_expansions = max_expansions  # Önek/alt dize başına en fazla terim
+        self._postings: Dict[str, Dict[int, int]] = {}  # terim -> {kitap no: tekrar}
+        self._doc_len: Dict[int, int] = {}
+        self._total_len = 0
+        self._terms: List[str] = []  # Önek araması için sıralı sözlük (silinmiş terim içerebilir)
+        self._new_terms: List[str] = []  # Henüz sıralı sözlüğe girmemiş terimler
+        self._trigram_terms: Dict[str, Set[str]] = {}  # Alt dize araması için
+        self._impacts: Dict[str, Dict[Tuple[int, int], List[int]]] = {}  # terim -> {(tekrar, uzunluk): artan numaralar}
+
+    def __len__(self) -> int:
+        return len(self._doc_len)
+
+    def add(self, doc_id: int, text: str):
+        counts = Counter(tokenize(text))
+        length = sum(counts.values())
+        for term, tf in counts.items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = {}
+                self._new_terms.append(term)
+                for gram in _trigrams(term):
+                    self._trigram_terms.setdefault(gram, set()).add(term)
+            postings[doc_id] = tf
+            impacts = self._impacts.get(term)
+            if impacts is not None:  # Geri alınan silme eski numarayla dönebilir
+                insort(impacts.setdefault((tf, length), []), doc_id)
+            elif len(postings) >= self.IMPACT_MIN:
+                impacts = self._impacts[term] = {}
+                for other, n in postings.items():
+                    impacts.setdefault((n, self._doc_len.get(other, length)), []).append(other)
+                for ids in impacts.values():
+                    ids.sort()
+        self._doc_len[doc_id] = length
+        self._total_len += length
+
+    def remove(self, doc_id: int, text: str):
+        if doc_id not in self._doc_len:
+            return
+        for term in set(tokenize(text)):
+            postings = self._postings.get(term)
+            if postings is None:
+                continue
+            tf = postings.pop(doc_id, None)
+            impacts = self._impacts.get(term)
+            if impacts is not None and tf is not None:
+                key = (tf, self._doc_len[doc_id])
+                ids = impacts[key]
+                del ids[bisect_left(ids, doc_id)]
+                if not ids:
+                    del impacts[key]
+            if not postings:
+                del self._postings[term]
+                self._impacts.pop(term, None)
+                for gram in _trigrams(term):
+                    terms = self._trigram_terms[gram]
+                    terms.discard(term)
+                    if not terms:
+                        del self._trigram_terms[gram]
+        self._total_len -= self._doc_len.pop(doc_id)
+
+    def _sorted_terms(self) -> List[str]:
+        if self._new_terms:
+            if len(self._new_terms) > 1024:
+                self._terms = sorted(self._postings)
+            else:
+                for term in self._new_terms:
+                    pos = bisect_left(self._terms, term)
+                    if pos == len(self._terms) or self._terms[pos] != term:
+                        self._terms.insert(pos, term)
+            self._new_terms = []
+        return self._terms
+
+    def _expand(self, token: str) -> Dict[str, float]:
+        """Sorgu kelimesini eşleşen terimlere ve ağırlıklarına çevirir"""
+        matches: Dict[str, float] = {}
+        if token in self._postings:
+            matches[token] = 1.0
+
+        terms = self._sorted_terms()
+        found = 0
+        for pos in range(bisect_left(terms, token), len(terms)):
+            term = terms[pos]
+            if not term.startswith(token) or found >= self.max_expansions:
+                break
+            if term in self._postings and term not in matches:
+                matches[term] = self.PREFIX_WEIGHT
+                found += 1
+
+        if len(token) >= 3:
+            grams = sorted((self._trigram_terms.get(g, set()) for g in _trigrams(token)), key=len)
+            if grams and grams[0]:
+                found = 0
+                for term in grams[0]:
+                    if term not in matches and token in term:
+                        matches[term] = self.SUBSTRING_WEIGHT
+                        found += 1
+                        if found >= self.max_expansions:
+                            break
+        return matches
+
+    def search(self, query: str, limit: int = 10) -> List[Tuple[int, float]]:
+        """En iyi `limit` sonucu (kitap no, skor) olarak döner"""
+        tokens = list(dict.fromkeys(tokenize(query)))
+        if not tokens or not self._doc_len or limit < 1:
+            return []
+        expanded = []
+        for token in tokens:
+            matches = self._expand(token)
+            if not matches:
+                return []
+            expanded.append(matches)
+
+        n_docs = len(self._doc_len)
+        avg_len = self._total_len / n_docs
+        if len(expanded) == 1:
+            # Kitabın puanı eşleşen terimlerden en yükseği; her terimin ilk `limit`'i yeterli
+            totals: Dict[int, float] = {}
+            for term, weight in expanded[0].items():
+                for doc_id, score in self._top(term, weight, limit, n_docs, avg_len):
+                    if score > totals.get(doc_id, 0.0):
+                        totals[doc_id] = score
+        else:
+            totals = self._conjunctive(expanded, n_docs, avg_len)
+        return heapq.nsmallest(limit, totals.items(), key=lambda item: (-item[1], item[0]))
+
+    def _idf(self, postings: Dict[int, int], n_docs: int) -> float:
+        return math.log(1 + (n_docs - len(postings) + 0.5) / (len(postings) + 0.5))
+
+    def _top(self, term: str, weight: float, limit: int, n_docs: int, avg_len: float) -> List[Tuple[int, float]]:
+        """Terimin en iyi `limit` kitabı (puan azalan, eşitlikte numara artan)"""
+        postings = self._postings[term]
+        idf = self._idf(postings, n_docs)
+        k1, b, doc_len = self.K1, self.B, self._doc_len
+
+        def score(tf: int, length: int) -> float:
+            return weight * idf * tf * (k1 + 1) / (tf + k1 * (1 - b + b * length / avg_len))
+
+        impacts = self._impacts.get(term)
+        if impacts is None:
+            scored = ((doc_id, score(tf, doc_len[doc_id])) for doc_id, tf in postings.items())
+            return heapq.nsmallest(limit, scored, key=lambda item: (-item[1], item[0]))
+
+        # Aynı puanı veren gruplar (ör. farklı tekrar ve uzunluk) numara sırasıyla birleştirilir
+        groups: Dict[float, List[List[int]]] = {}
+        for (tf, length), ids in impacts.items():
+            groups.setdefault(score(tf, length), []).append(ids)
+        top: List[Tuple[int, float]] = []
+        for s in sorted(groups, reverse=True):
+            for doc_id in heapq.merge(*groups[s]):
+                top.append((doc_id, s))
+                if len(top) == limit:
+                    return top
+        return top
+
+    def _conjunctive(self, expanded: List[Dict[str, float]], n_docs: int, avg_len: float) -> Dict[int, float]:
+        """Bütün kelimelerin eşleştiği kitapların toplam puanı"""
+        postings = self._postings
+        # En küçük kümeden başlanır; kesişimler dict görünümleri üzerinden C düzeyinde yapılır
+        ordered = sorted(expanded, key=lambda matches: sum(len(postings[t]) for t in matches))
+        candidates = set().union(*(postings[t].keys() for t in ordered[0]))
+        for matches in ordered[1:]:
+            candidates = set().union(*(candidates & postings[t].keys() for t in matches))
+            if not candidates:
+                return {}
+
+        totals = dict.fromkeys(candidates, 0.0)
+        for matches in expanded:
+            scores: Dict[int, float] = {}
+            for term, weight in matches.items():
+                term_postings = postings[term]
+                idf = self._idf(term_postings, n_docs)
+                for doc_id in candidates & term_postings.keys():
+                    tf = term_postings[doc_id]
+                    norm = tf + self.K1 * (1 - self.B + self.B * self._doc_len[doc_id] / avg_len)
+                    score = weight * idf * tf * (self.K1 + 1) / norm
+                    if score > scores.get(doc_id, 0.0):
+                        scores[doc_id] = score
+            for doc_id, score in scores.items():
+                totals[doc_id] += score
+        return totals
@@ -0,0 +1,358 @@
+"""Library'yi ağ üzerinden sunan asyncio tabanlı HTTP/JSON servisi.
+
+    python -m library_app.server --port 8080 --file library.json
+
+Uç noktalar:
+
+    GET    /books?offset=&limit=&sort=&filter=   sayfalı liste
+    POST   /books          {"title", "author", "isbn"}
+    GET    /books/<isbn>   ISBN, başlık veya yazar ile tam eşleşme
+    DELETE /books/<isbn>
+    GET    /search?q=&limit=
+    GET    /find?q=        tam eşleşme, yoksa öneriler
+    POST   /import         {"isbns": [...], "concurrency": 8}  API'den çekip ekler
+    GET    /metrics?format=prometheus|json   ölçümler (--metrics ile açılır)
+
+Library'ye her erişim (dosya kilidi ve disk G/Ç'si içerebilir) olay
+döngüsünü bloklamamak için tek iş parçacıklı ayrı bir yürütücüde çalışır;
+böylece okumalar ile yazmalar hiçbir zaman aynı anda Library'ye dokunmaz.
+Yazmalar tek bir yazar görevinin kuyruğundan sırayla geçer; kuyrukta
+biriken yazmalar tek `Library.batch()` içinde (tek günlük yazımıyla)
+uygulanır. Grup başarısız olursa işlemler tek tek yeniden denenir ve
+yalnızca hatalı istek başarısız olur.
+"""
+import argparse
+import asyncio
+import json
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from . import metrics
+from .models import Book, Library
+
+MAX_BODY = 1 << 20
+_REASONS = {200: "OK", 201: "Created", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+            409: "Conflict", 413: "Payload Too Large", 500: "Internal Server Error"}
+
+
+class HTTPError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class LibraryService:
+    """Paylaşılan Library üzerinde okuma ve (tek yazarlı) yazma işlemleri"""
+
+    def __init__(self, library: Library, max_batch: int = 256):
+        self.library = library
+        self.max_batch = max_batch
+        self._queue: "asyncio.Queue[Tuple[Callable[[], Any], asyncio.Future]]" = asyncio.Queue()
+        self._writer: Optional[asyncio.Task] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def start(self):
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="library")
+        if self._writer is None:
+            self._writer = asyncio.create_task(self._write_loop())
+
+    async def stop(self):
+        if self._writer is not None:
+            self._writer.cancel()
+            try:
+                await self._writer
+            except asyncio.CancelledError:
+                pass
+            self._writer = None
+        if self._executor is not None:
+            await asyncio.to_thread(self._executor.shutdown)  # Süren yazma tamamlansın
+            self._executor = None
+
+    async def run(self, fn: Callable, *args, **kwargs) -> Any:
+        """`fn` Library iş parçacığında (diğer erişimlerle sırayla) çalışır"""
+        return await asyncio.get_running_loop().run_in_executor(self._executor, partial(fn, *args, **kwargs))
+
+    async def write(self, op: Callable[[], Any]) -> Any:
+        """`op` yazar görevinde çalışır; sonucunu döner"""
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((op, future))
+        return await future
+
+    async def _write_loop(self):
+        while True:
+            group = [await self._queue.get()]
+            while len(group) < self.max_batch and not self._queue.empty():
+                group.append(self._queue.get_nowait())
+            outcomes = await self.run(self._apply, [op for op, _ in group])
+            for (_, future), (ok, value) in zip(group, outcomes):
+                if future.done():
+                    continue
+                if ok:
+                    future.set_result(value)
+                else:
+                    future.set_exception(value)
+
+    def _apply(self, ops) -> List[Tuple[bool, Any]]:
+        """Grubu tek batch'te uygular; olmazsa her işlemi kendi batch'inde dener"""
+        try:
+            with self.library.batch():  # Grup tek kayıt işlemiyle diske yazılır
+                return [(True, op()) for op in ops]
+        except Exception as e:
+            if len(ops) == 1:
+                logging.error(f"Yazma hatası: {str(e)}")
+                return [(False, e)]
+            # batch geri alındı; hatalı işlem diğer isteklerin yazmasını engellemesin
+            logging.warning(f"Yazma grubu başarısız ({len(ops)} işlem), tek tek deneniyor: {str(e)}")
+        outcomes = []
+        for op in ops:
+            try:
+                with self.library.batch():
+                    result = op()
+            except Exception as e:
+                logging.error(f"Yazma hatası: {str(e)}")
+                outcomes.append((False, e))
+            else:
+                outcomes.append((True, result))
+        return outcomes
+
+    # Endpoints
+    async def list_books(self, query: Dict, body: Any) -> Tuple[int, Any]:
+        offset, limit = _int(query, "offset", 0), _int(query, "limit", 20)
+        try:
+            page = await self.run(self.library.list_books, offset=offset, limit=limit,
+                                   sort_by=query.get("sort"), filter=query.get("filter"))
+        except ValueError as e:
+            raise HTTPError(400, str(e))
+        return 200, {"total": page.total, "offset": page.offset, "limit": page.limit,
+                     "books": [b.to_dict() for b in page.books]}
+
+    async def add_book(self, query: Dict, body: Any) -> Tuple[int, Any]:
+        if not isinstance(body, dict) or not all(isinstance(body.get(k), str) for k in ("title", "author", "isbn")):
+            raise HTTPError(400, "title, author ve isbn metin olmalı")
+        book = Book.from_dict(body)
+        if not book.title.strip() or not book.isbn.strip():
+            raise HTTPError(400, "title ve isbn boş olamaz")
+        if not await self.write(lambda: self.library.add_book(book)):
+            raise HTTPError(409, "Bu ISBN veya başlık zaten kayıtlı")
+        return 201, book.to_dict()
+
+    async def get_book(self, query: Dict, body: Any, key: str) -> Tuple[int, Any]:
+        book = await self.run(self.library.lookup, key)
+        if book is None:
+            raise HTTPError(404, "Kitap bulunamadı")
+        return 200, book.to_dict()
+
+    async def remove_book(self, query: Dict, body: Any, key: str) -> Tuple[int, Any]:
+        if not await self.write(lambda: self.library.remove_book(key)):
+            raise HTTPError(404, "Kitap bulunamadı")
+        return 200, {"removed": key}
+
+    async def search(self, query: Dict, body: Any) -> Tuple[int, Any]:
+        books = await self.run(self.library.search, query.get("q", ""), limit=_int(query, "limit", 10))
+        return 200, {"books": [b.to_dict() for b in books]}
+
+    async def find(self, query: Dict, body: Any) -> Tuple[int, Any]:
+        book, matches = await self.run(self._find, query.get("q", ""))
+        if book is not None:
+            return 200, {"book": book.to_dict(), "suggestions": []}
+        return 404, {"book": None, "suggestions": matches}
+
+    def _find(self, q: str):
+        book = self.library.lookup(q)
+        if book is not None:
+            return book, []
+        return None, [b.title for b in self.library.search(q, limit=3)] or self.library.suggest(q)
+
+    async def import_isbns(self, query: Dict, body: Any) -> Tuple[int, Any]:
+        isbns = body.get("isbns") if isinstance(body, dict) else None
+        if not isinstance(isbns, list) or not all(isinstance(i, str) for i in isbns):
+            raise HTTPError(400, "isbns bir metin listesi olmalı")
+        concurrency = body.get("concurrency", 8)
+        if not isinstance(concurrency, int) or concurrency < 1:
+            raise HTTPError(400, "concurrency pozitif tamsayı olmalı")
+
+        result = {"added": [], "duplicates": [], "not_found": []}
+        async for isbn, book in self.library.fetch_books_from_api(isbns, concurrency=concurrency):
+            if book is None:
+                result["not_found"].append(isbn)
+            elif await self.write(lambda book=book: self.library.add_book(book)):
+                result["added"].append(book.to_dict())
+            else:
+                result["duplicates"].append(isbn)
+        return 200, result
+
+    async def get_metrics(self, query: Dict, body: Any) -> Tuple[int, Any]:
+        fmt = query.get("format", "prometheus")
+        if fmt == "json":
+            return 200, metrics.registry.snapshot()
+        if fmt != "prometheus":
+            raise HTTPError(400, "format prometheus veya json olmalı")
+        return 200, metrics.registry.to_prometheus()  # Metin yanıt: text/plain
+
+
+def _int(query: Dict, name: str, default: int) -> int:
+    value = query.get(name)
+    if value is None:
+        return default
+    if not value.isdigit():
+        raise HTTPError(400, f"{name} negatif olmayan bir tamsayı olmalı")
+    return int(value)
+
+
+class LibraryServer:
+    """HTTP/1.1 (keep-alive) üzerinden JSON isteklerini LibraryService'e yönlendirir"""
+
+    def __init__(self, library: Library, host: str = "127.0.0.1", port: int = 8080):
+        self.service = LibraryService(library)
+        self.host = host
+        self.port = port
+        self._server: Optional[asyncio.AbstractServer] = None
+        s = self.service
+        self._routes = {
+            ("GET", "/books"): s.list_books,
+            ("POST", "/books"): s.add_book,
+            ("GET", "/search"): s.search,
+            ("GET", "/find"): s.find,
+            ("POST", "/import"): s.import_isbns,
+            ("GET", "/metrics"): s.get_metrics,
+        }
+        self._item_routes = {"GET": s.get_book, "DELETE": s.remove_book}  # /books/<isbn>
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    async def start(self):
+        self.service.start()
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        await self.service.stop()
+        await self.service.library.aclose()
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.stop()
+
+    async def serve_forever(self):
+        await self._server.serve_forever()
+
+    async def dispatch(self, method: str, target: str, body: Any) -> Tuple[int, Any]:
+        parts = urlsplit(target)
+        query = {k: v[-1] for k, v in parse_qs(parts.query).items()}
+        path = parts.path.rstrip("/") or "/"
+        if path.startswith("/books/"):
+            handler = self._item_routes.get(method)
+            if handler is None:
+                raise HTTPError(405, "Yöntem desteklenmiyor")
+            return await handler(query, body, unquote(path[len("/books/"):]))
+        handler = self._routes.get((method, path))
+        if handler is not None:
+            return await handler(query, body)
+        if any(path == route for _, route in self._routes):
+            raise HTTPError(405, "Yöntem desteklenmiyor")
+        raise HTTPError(404, "Uç nokta bulunamadı")
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, target, version = request_line.decode("latin-1").rstrip("\r\n").split(" ", 2)
+                headers = {}
+                while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                keep_alive = headers.get("connection", "").lower() != "close" and version == "HTTP/1.1"
+
+                start = time.perf_counter()
+                try:
+                    length = int(headers.get("content-length", 0))
+                except ValueError:
+                    length = -1
+                if length < 0:
+                    keep_alive = False  # Gövdenin nerede bittiği bilinmiyor
+                    status, payload = 400, {"error": "Geçersiz Content-Length"}
+                else:
+                    status, payload = await self._respond(method, target, length, reader)
+                metrics.observe("library_server_request_seconds", time.perf_counter() - start,
+                                method=method, status=str(status))
+                if isinstance(payload, str):
+                    data, content_type = payload.encode("utf-8"), "text/plain; version=0.0.4"
+                else:
+                    data, content_type = json.dumps(payload, ensure_ascii=False).encode("utf-8"), "application/json"
+                writer.write(
+                    f"HTTP/1.1 {status} {_REASONS.get(status, 'Error')}\r\n"
+                    f"Content-Type: {content_type}; charset=utf-8\r\n"
+                    f"Content-Length: {len(data)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode() + data
+                )
+                await writer.drain()
+                if not keep_alive or status == 413:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def _respond(self, method: str, target: str, length: int,
+                       reader: asyncio.StreamReader) -> Tuple[int, Any]:
+        try:
+            if length > MAX_BODY:
+                raise HTTPError(413, "İstek gövdesi çok büyük")
+            body = None
+            if length:
+                try:
+                    body = json.loads(await reader.readexactly(length))
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    raise HTTPError(400, "Geçersiz JSON")
+            return await self.dispatch(method, target, body)
+        except HTTPError as e:
+            return e.status, {"error": str(e)}
+        except asyncio.IncompleteReadError:
+            raise
+        except Exception as e:
+            logging.exception(f"İstek işlenemedi ({method} {target})")
+            return 500, {"error": str(e)}
+
+
+async def serve(library: Library, host: str = "127.0.0.1", port: int = 8080):
+    server = LibraryServer(library, host, port)
+    async with server:
+        print(f"Dinleniyor: {server.url}", flush=True)
+        await server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Library HTTP/JSON servisi")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--file", default="library.json", help="Katalog dosyası")
+    parser.add_argument("--metrics", action="store_true", help="Ölçümleri topla (GET /metrics)")
+    args = parser.parse_args()
+    if args.metrics:
+        metrics.registry.enable()
+    logging.basicConfig(filename='library.log', level=logging.INFO,
+                        format='%(asctime)s - %(levelname)s - %(message)s')
+    try:
+        asyncio.run(serve(Library(args.file, lazy=False), args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
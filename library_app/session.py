@@ -0,0 +1,59 @@
+import asyncio
+from typing import Optional
+
+import httpx
+
+
+class HttpSession:
+    """Library ve OpenLibraryClient tarafından paylaşılan uzun ömürlü httpx.AsyncClient.
+
+    Bağlantılar (keep-alive) istekler arasında yeniden kullanılır; istemci
+    ilk istekte oluşturulur ve `aclose()` ya da `async with` ile kapatılır.
+    """
+
+    def __init__(self, timeout: float = 10.0, connect_timeout: float = 5.0,
+                 max_connections: int = 20, max_keepalive_connections: int = 10,
+                 keepalive_expiry: float = 30.0, http2: bool = False,
+                 transport: Optional[httpx.AsyncBaseTransport] = None, **client_kwargs):
+        self.timeout = httpx.Timeout(timeout, connect=connect_timeout)
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.http2 = http2  # h2 paketi kurulu olmalı
+        self.transport = transport
+        self.client_kwargs = client_kwargs
+        self._client: Optional[httpx.AsyncClient] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._loop is not loop:
+            # Bağlantı havuzu event loop'a bağlıdır; yeni loop'ta yeni istemci gerekir
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=self.limits,
+                http2=self.http2,
+                transport=self.transport,
+                follow_redirects=True,
+                **self.client_kwargs,
+            )
+            self._loop = loop
+        return self._client
+
+    async def get(self, url: str, **kwargs) -> httpx.Response:
+        return await self.client.get(url, **kwargs)
+
+    async def aclose(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._loop = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.aclose()
@@ -0,0 +1,32 @@
+import asyncio
+from typing import Awaitable, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Aynı anahtar için eşzamanlı çağrıları tek çağrıda birleştirir.
+
+    İlk çağrı işi başlatır, iş sürerken gelen çağrılar aynı sonucu bekler.
+    İş ayrı bir görevde çalışır; bekleyenlerden biri iptal edilse bile
+    diğerleri için devam eder.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, asyncio.Future] = {}
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        task = self._calls.get(key)
+        if task is None:
+            task = self._calls[key] = asyncio.ensure_future(fn())
+            task.add_done_callback(lambda t: self._done(key, t))
+        return await asyncio.shield(task)
+
+    def _done(self, key: Hashable, task: asyncio.Future):
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled():
+            task.exception()  # Bekleyen kalmadıysa "never retrieved" uyarısını önler
@@ -0,0 +1,348 @@
+"""Bellek eşlemli (mmap) ikili katalog anlık görüntüsü.
+
+Dosya düzeni (bütün tamsayılar little-endian uint32, başlıktakiler uint64):
+
+    başlık    MAGIC, sürüm, kitap sayısı ve her bölümün (konum, uzunluk) çifti
+    kayıtlar  kitap başına 6 sayı: başlık, yazar ve ISBN'in yığındaki (konum, uzunluk)'u
+    isbn      kanonik ISBN'e göre sıralı (anahtar konumu, anahtar uzunluğu, kitap no)
+    title     küçük harfli başlığa göre sıralı, aynı biçimde
+    author    küçük harfli yazara göre sıralı, aynı biçimde
+    yığın     UTF-8 metinler
+
+Dosya açılırken yalnızca başlık okunur; kitaplar erişildikçe yığından
+çözülür, indeks aramaları ikili aramayla doğrudan eşlenmiş sayfalarda
+yapılır. Sayfalar işletim sisteminin önbelleğinden gelir ve aynı dosyayı
+açan süreçler arasında paylaşılır.
+"""
+import mmap
+import struct
+import sys
+import weakref
+from array import array
+from bisect import bisect_left
+from itertools import chain
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from .isbn import canonical
+from .streaming import atomic_open, read_records, write_records
+
+MAGIC = b"LIBSNAP\0"
+VERSION = 1
+SECTIONS = ("records", "isbn", "title", "author", "heap")
+INDEX_FIELDS = ("isbn", "title", "author")
+_HEADER = struct.Struct("<8sII" + "QQ" * len(SECTIONS))
+_MAX_OFFSET = 1 << 32
+_FENCE_STEP = 32
+
+
+def _keys(title: str, author: str, isbn: str) -> Tuple[str, str, str]:
+    """Library'nin indeks anahtarlarıyla aynı: kanonik ISBN, küçük harfli başlık ve yazar"""
+    return canonical(isbn), title.lower(), author.lower()
+
+
+def _u32(values: array) -> bytes:
+    if sys.byteorder != "little":
+        values = array("I", values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def write_snapshot(path, records: Iterable[Dict]) -> int:
+    """Kayıtları ikili anlık görüntü olarak atomik yazar, yazılan kitap sayısını döner"""
+    heap = bytearray()
+    table = array("I")
+    keys: Tuple[List[str], List[str], List[str]] = ([], [], [])
+    key_refs: Tuple[array, array, array] = (array("I"), array("I"), array("I"))
+    authors: Dict[str, Tuple[int, int]] = {}  # Aynı yazarın metni yığında bir kez tutulur
+
+    def put(value: str) -> Tuple[int, int]:
+        data = value.encode("utf-8")
+        ref = (len(heap), len(data))
+        heap.extend(data)
+        return ref
+
+    for record in records:
+        title, author, isbn = record["title"], record["author"], record["isbn"]
+        title_ref = put(title)
+        author_ref = authors.get(author)
+        if author_ref is None:
+            author_ref = authors[author] = put(author)
+        isbn_ref = put(isbn)
+        table.extend((*title_ref, *author_ref, *isbn_ref))
+        # Anahtar asıl metinle aynıysa (ör. zaten kanonik ISBN) yığına yeniden yazılmaz
+        for i, (key, original, ref) in enumerate(zip(_keys(title, author, isbn), (isbn, title, author),
+                                                     (isbn_ref, title_ref, author_ref))):
+            keys[i].append(key)
+            key_refs[i].extend(ref if key == original else put(key))
+        if len(heap) >= _MAX_OFFSET:
+            raise ValueError("Anlık görüntü metinleri 4 GB sınırını aşıyor")
+
+    count = len(table) // 6
+    indexes = []
+    for field_keys, refs in zip(keys, key_refs):
+        # Anahtara, eşitse kitap numarasına göre sıralı: aynı anahtarın kitapları ardışık ve artan
+        entries = array("I")
+        for book_id in sorted(range(count), key=field_keys.__getitem__):
+            entries.extend((refs[2 * book_id], refs[2 * book_id + 1], book_id))
+        indexes.append(entries)
+
+    blobs = [_u32(table), *map(_u32, indexes), bytes(heap)]
+    layout, position = [], _HEADER.size
+    for blob in blobs:
+        layout.extend((position, len(blob)))
+        position += len(blob)
+    with atomic_open(path, binary=True) as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, count, *layout))
+        for blob in blobs:
+            f.write(blob)
+    return count
+
+
+class Snapshot:
+    """Salt okunur, mmap ile açılmış anlık görüntü"""
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, version, count, *layout = _HEADER.unpack_from(self._mm)
+        except struct.error:
+            magic = version = None
+        if magic != MAGIC or version != VERSION:
+            self._mm.close()
+            raise ValueError(f"Geçersiz anlık görüntü dosyası: {path}")
+        self.count = count
+        sections = dict(zip(SECTIONS, zip(layout[::2], layout[1::2])))
+        with memoryview(self._mm) as view:
+            self._table = self._ints(view, *sections["records"])
+            self._indexes = {field: self._ints(view, *sections[field]) for field in INDEX_FIELDS}
+        self._heap = sections["heap"][0]
+        self._fences: Dict[str, List[bytes]] = {}
+        self._views = 0  # Bu görüntüyü kullanan SnapshotBooks/SnapshotIndex sayısı
+
+    @staticmethod
+    def _ints(view: memoryview, offset: int, length: int):
+        if sys.byteorder != "little":  # Büyük-endian makinede kopyalanır
+            values = array("I", view[offset:offset + length].tobytes())
+            values.byteswap()
+            return values
+        return view[offset:offset + length].cast("I")
+
+    def close(self):
+        if self._mm.closed:
+            return
+        for values in (self._table, *self._indexes.values()):
+            if isinstance(values, memoryview):
+                values.release()
+        self._mm.close()
+
+    def attach(self, view: object):
+        """Görüntü, `view`'lerin sonuncusu da bırakıldığında kapatılır.
+
+        Library yeniden yüklendiğinde eski eşleme böylece hemen serbest
+        kalır; eski görünüm üzerinde süren bir yineleme varsa o bitene
+        kadar açık kalır.
+        """
+        self._views += 1
+        weakref.finalize(view, self._detach)
+
+    def _detach(self):
+        self._views -= 1
+        if not self._views:
+            self.close()
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _text(self, offset: int, length: int) -> str:
+        start = self._heap + offset
+        return self._mm[start:start + length].decode("utf-8")
+
+    def fields(self, book_id: int) -> Tuple[str, str, str]:
+        """(başlık, yazar, ISBN)"""
+        t = self._table
+        i = 6 * book_id
+        return self._text(t[i], t[i + 1]), self._text(t[i + 2], t[i + 3]), self._text(t[i + 4], t[i + 5])
+
+    def records(self) -> Iterator[Dict]:
+        for book_id in range(self.count):
+            title, author, isbn = self.fields(book_id)
+            yield {"title": title, "author": author, "isbn": isbn}
+
+    def _key(self, entries, position: int) -> bytes:
+        start = self._heap + entries[3 * position]
+        return self._mm[start:start + entries[3 * position + 1]]
+
+    def _fence(self, field: str) -> List[bytes]:
+        """Her `_FENCE_STEP`. anahtar; ilk aramada bir kez okunur (1M kitapta ~31 bin anahtar)"""
+        fence = self._fences.get(field)
+        if fence is None:
+            fence = self._fences[field] = [self._key(self._indexes[field], position)
+                                           for position in range(0, self.count, _FENCE_STEP)]
+        return fence
+
+    def ids(self, field: str, key: str) -> List[int]:
+        """Anahtarı tam eşleşen kitap numaraları (artan)"""
+        entries, mm, heap = self._indexes[field], self._mm, self._heap
+        target = key.encode("utf-8")
+        # Seyrek örnekle aralık daraltılır, kalan blokta ikili arama (UTF-8 bayt sırası = metin sırası)
+        block = bisect_left(self._fence(field), target)
+        lo, hi = max(0, (block - 1) * _FENCE_STEP + 1), min(self.count, block * _FENCE_STEP)
+        while lo < hi:
+            mid = (lo + hi) >> 1
+            start = heap + entries[3 * mid]
+            if mm[start:start + entries[3 * mid + 1]] < target:
+                lo = mid + 1
+            else:
+                hi = mid
+        ids = []
+        while lo < self.count and self._key(entries, lo) == target:
+            ids.append(entries[3 * lo + 2])
+            lo += 1
+        return ids
+
+    def items(self, field: str) -> Iterator[Tuple[str, List[int]]]:
+        """(anahtar, kitap numaraları) çiftleri, anahtar sırasıyla"""
+        entries = self._indexes[field]
+        current, ids = None, []
+        for position in range(self.count):
+            key = self._key(entries, position)
+            if key != current:
+                if ids:
+                    yield current.decode("utf-8"), ids
+                current, ids = key, []
+            ids.append(entries[3 * position + 2])
+        if ids:
+            yield current.decode("utf-8"), ids
+
+
+class SnapshotBooks:
+    """Library._books yerine geçen kitap no -> Book eşlemesi.
+
+    Anlık görüntüdeki kitaplar (0..n-1) her erişimde yığından oluşturulur;
+    sonradan eklenen kitaplar ve silinen numaralar bellekte tutulur.
+    Numaralar her zaman artan sırada (ekleme sırası) döner.
+    """
+
+    def __init__(self, snapshot: Snapshot, factory: Callable[[str, str, str], object]):
+        self.snapshot = snapshot
+        snapshot.attach(self)
+        self._factory = factory
+        self._base = len(snapshot)
+        self._books: Dict[int, object] = {}
+        self._removed: Set[int] = set()
+        self._extra = 0  # Anlık görüntüden sonra eklenen kitap sayısı
+
+    def __getitem__(self, book_id: int):
+        book = self._books.get(book_id)
+        if book is not None:
+            return book
+        if not 0 <= book_id < self._base or book_id in self._removed:
+            raise KeyError(book_id)
+        return self._factory(*self.snapshot.fields(book_id))
+
+    def __setitem__(self, book_id: int, book):
+        if book_id >= self._base and book_id not in self._books:
+            self._extra += 1
+        self._books[book_id] = book
+        self._removed.discard(book_id)
+
+    def pop(self, book_id: int):
+        book = self[book_id]
+        self._books.pop(book_id, None)
+        if book_id < self._base:
+            self._removed.add(book_id)
+        else:
+            self._extra -= 1
+        return book
+
+    def __contains__(self, book_id: int) -> bool:
+        return book_id in self._books or (0 <= book_id < self._base and book_id not in self._removed)
+
+    def __len__(self) -> int:
+        return self._base - len(self._removed) + self._extra
+
+    def __iter__(self) -> Iterator[int]:
+        removed = self._removed
+        base = range(self._base) if not removed else (i for i in range(self._base) if i not in removed)
+        return chain(base, sorted(i for i in self._books if i >= self._base))
+
+    def keys(self) -> Iterator[int]:
+        return iter(self)
+
+    def values(self) -> Iterator:
+        return map(self.__getitem__, self)
+
+    def items(self) -> Iterator[Tuple[int, object]]:
+        return ((book_id, self[book_id]) for book_id in self)
+
+
+class SnapshotIndex:
+    """Library'nin anahtar -> sıralı kitap numaraları indeksinin anlık görüntü üzerindeki hali.
+
+    Okumalar dosyadaki sıralı bölümden yapılır; değiştirilen anahtarın
+    listesi ilk yazmada belleğe kopyalanır (copy-on-write), silinen
+    anahtarlar ayrıca işaretlenir.
+    """
+
+    def __init__(self, snapshot: Snapshot, field: str):
+        self.snapshot = snapshot
+        snapshot.attach(self)
+        self.field = field
+        self._changed: Dict[str, List[int]] = {}
+        self._deleted: Set[str] = set()
+
+    def get(self, key: str, default=None):
+        ids = self._changed.get(key)
+        if ids is not None:
+            return ids
+        if key in self._deleted:
+            return default
+        return self.snapshot.ids(self.field, key) or default
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not None
+
+    def __getitem__(self, key: str) -> List[int]:
+        ids = self._changed.get(key)
+        if ids is None:
+            ids = self.get(key)
+            if ids is None:
+                raise KeyError(key)
+            self._changed[key] = ids
+        return ids
+
+    def setdefault(self, key: str, default: List[int]) -> List[int]:
+        try:
+            return self[key]
+        except KeyError:
+            self._deleted.discard(key)
+            self._changed[key] = default
+            return default
+
+    def __delitem__(self, key: str):
+        self[key]  # Yoksa KeyError
+        del self._changed[key]
+        self._deleted.add(key)
+
+    def items(self) -> Iterator[Tuple[str, List[int]]]:
+        changed, deleted = self._changed, self._deleted
+        base = ((k, ids) for k, ids in self.snapshot.items(self.field) if k not in changed and k not in deleted)
+        return chain(base, ((k, ids) for k, ids in changed.items() if ids))
+
+    def __iter__(self) -> Iterator[str]:
+        return (key for key, _ in self.items())
+
+
+def json_to_snapshot(source, target, fmt: Optional[str] = None) -> int:
+    """JSON (veya JSON Lines/CSV) katalogu ikili anlık görüntüye çevirir"""
+    return write_snapshot(target, read_records(source, fmt))
+
+
+def snapshot_to_json(source, target, fmt: Optional[str] = None) -> int:
+    """Anlık görüntüyü library.json (veya JSON Lines/CSV) biçiminde yazar"""
+    snapshot = Snapshot(source)
+    try:
+        return write_records(target, snapshot.records(), fmt)
+    finally:
+        snapshot.close()
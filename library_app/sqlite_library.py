@@ -0,0 +1,231 @@
+import logging
+import sqlite3
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional
+
+from .fuzzy import FuzzyIndex
+from .isbn import canonical
+from .models import BatchResult, Book, BookPage
+from .storage import open_storage
+
+# Başlık ve kanonik ISBN benzersiz: JSON Library'deki tekrar kuralı (aynı ISBN
+# veya aynı küçük harfli başlık) doğrudan kısıtlarla sağlanır.
+_SCHEMA = (
+    """CREATE TABLE IF NOT EXISTS books (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        title TEXT NOT NULL,
+        author TEXT NOT NULL,
+        isbn TEXT NOT NULL,
+        title_key TEXT NOT NULL UNIQUE,
+        author_key TEXT NOT NULL,
+        isbn_key TEXT NOT NULL UNIQUE
+    )""",
+    "CREATE INDEX IF NOT EXISTS idx_books_author_key ON books(author_key)",
+)
+# PRAGMA user_version ile tutulur. 0: ham ISBN'de benzersizlik kısıtı olan
+# ilk şema (isbn_key sütunu olmayabilir), 1: kanonik isbn_key.
+_SCHEMA_VERSION = 1
+
+_INSERT = (
+    "INSERT OR IGNORE INTO books (title, author, isbn, title_key, author_key, isbn_key) "
+    "VALUES (?, ?, ?, ?, ?, ?)"
+)
+_COPY = (
+    "INSERT OR IGNORE INTO books (id, title, author, isbn, title_key, author_key, isbn_key) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+_LOOKUP = (
+    "SELECT id, title, author, isbn FROM books "
+    "WHERE isbn_key = ? OR title_key = ? OR author_key = ? ORDER BY id LIMIT 1"
+)
+
+
+class SQLiteLibrary:
+    """sqlite3 tabanlı Library; katalog belleğe yüklenmez, sorgular indeksleri kullanır.
+
+    Yalnızca "Benzer kitaplar" önerileri için başlıkların trigram indeksi
+    ilk ihtiyaçta bellekte kurulur.
+    """
+
+    def __init__(self, db_path: str = "library.db"):
+        self.db_path = Path(db_path)
+        self._conn = sqlite3.connect(str(self.db_path))
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._migrate()
+        self.suggestion_cutoff = 0.4  # "Benzer kitaplar" önerileri için benzerlik eşiği
+        self._title_fuzzy: Optional[FuzzyIndex] = None  # İlk öneri isteğinde kurulur
+        self._data_version = None
+
+    def close(self):
+        self._conn.close()
+
+    def _migrate(self):
+        """Şemayı kurar veya eski sürümdeki veritabanını günceller"""
+        if self._conn.execute("PRAGMA user_version").fetchone()[0] >= _SCHEMA_VERSION:
+            return
+        with self._conn:
+            self._conn.execute("BEGIN IMMEDIATE")  # Aynı anda açan başka süreç beklesin
+            if self._conn.execute("PRAGMA user_version").fetchone()[0] >= _SCHEMA_VERSION:
+                return
+            exists = self._conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'books'").fetchone()
+            if exists:
+                # Eski benzersizlik kısıtı kaldırılamadığından tablo yeniden kurulur
+                self._conn.execute("ALTER TABLE books RENAME TO books_old")
+                self._conn.execute("DROP INDEX IF EXISTS idx_books_author_key")
+                self._conn.execute("DROP INDEX IF EXISTS idx_books_isbn_key")
+            for statement in _SCHEMA:
+                self._conn.execute(statement)
+            if exists:
+                rows = self._conn.execute("SELECT id, title, author, isbn FROM books_old ORDER BY id").fetchall()
+                before = self._conn.total_changes
+                self._conn.executemany(_COPY, ((row[0], *self._row(Book(*row[1:]))) for row in rows))
+                dropped = len(rows) - (self._conn.total_changes - before)
+                if dropped:
+                    logging.warning(f"{self.db_path}: kanonik ISBN'i veya başlığı tekrar eden {dropped} kitap atlandı")
+                self._conn.execute("DROP TABLE books_old")
+            self._conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM books").fetchone()[0]
+
+    @staticmethod
+    def _row(book: Book):
+        return (book.title, book.author, book.isbn,
+                book.title.lower(), book.author.lower(), canonical(book.isbn))
+
+    def add_book(self, book: Book) -> bool:
+        with self._conn:
+            added = self._conn.execute(_INSERT, self._row(book)).rowcount == 1
+        if added:
+            self._fuzzy_update(added=[book])
+        return added
+
+    def add_books(self, books: Iterable[Book]) -> BatchResult:
+        """Kitapları tek işlemde ekler (Library.add_books ile aynı sonuç)"""
+        result = BatchResult()
+        with self._conn:
+            for book in books:
+                if not isinstance(book, Book) or not book.title.strip() or not book.isbn.strip():
+                    result.rejected.append(book)
+                elif self._conn.execute(_INSERT, self._row(book)).rowcount == 1:
+                    result.added.append(book)
+                else:
+                    result.duplicates.append(book)
+        self._fuzzy_update(added=result.added)
+        return result
+
+    def remove_book(self, isbn: str) -> bool:
+        with self._conn:
+            book = self._remove(isbn)
+        if book is not None:
+            self._fuzzy_update(removed=[book])
+        return book is not None
+
+    def remove_books(self, isbns: Iterable[str]) -> BatchResult:
+        """Kitapları tek işlemde siler"""
+        result = BatchResult()
+        with self._conn:
+            for isbn in isbns:
+                book = self._remove(isbn)
+                if book is None:
+                    result.not_found.append(isbn)
+                else:
+                    result.removed.append(book)
+        self._fuzzy_update(removed=result.removed)
+        return result
+
+    def _remove(self, isbn: str) -> Optional[Book]:
+        key = isbn.lower()
+        row = self._conn.execute(_LOOKUP, (canonical(isbn), key, key)).fetchone()
+        if row is None:
+            return None
+        self._conn.execute("DELETE FROM books WHERE id = ?", (row[0],))
+        return Book(*row[1:])
+
+    _SORT_COLUMNS = {"title": "title_key", "author": "author_key", "isbn": "isbn_key"}
+
+    def iter_books(self, sort_by: Optional[str] = None, filter: Optional[str] = None) -> Iterator[Book]:
+        """Kitapları Library.iter_books ile aynı sırada ve filtreyle verir"""
+        where, params = self._filter(filter)
+        rows = self._conn.execute(f"SELECT title, author, isbn FROM books{where}{self._order(sort_by)}", params)
+        return (Book(*row) for row in rows)
+
+    def list_books(self, offset: int = 0, limit: Optional[int] = None, sort_by: Optional[str] = None,
+                   filter: Optional[str] = None) -> BookPage:
+        """`offset`'ten başlayarak en fazla `limit` kitaplık sayfa (limit yoksa hepsi)"""
+        if offset < 0 or (limit is not None and limit < 0):
+            raise ValueError("offset ve limit negatif olamaz")
+        where, params = self._filter(filter)
+        order = self._order(sort_by)
+        total = self._conn.execute(f"SELECT COUNT(*) FROM books{where}", params).fetchone()[0]
+        rows = self._conn.execute(f"SELECT title, author, isbn FROM books{where}{order} LIMIT ? OFFSET ?",
+                                  (*params, -1 if limit is None else limit, offset))
+        return BookPage([Book(*row) for row in rows], offset, limit, total)
+
+    def _order(self, sort_by: Optional[str]) -> str:
+        if not sort_by:
+            return " ORDER BY id"
+        column = self._SORT_COLUMNS.get(sort_by.lstrip("-"))
+        if column is None:
+            raise ValueError(f"Geçersiz sıralama alanı: {sort_by} ({', '.join(self._SORT_COLUMNS)})")
+        direction = " DESC" if sort_by.startswith("-") else ""
+        return f" ORDER BY {column}{direction}, id{direction}"
+
+    @staticmethod
+    def _filter(filter: Optional[str]):
+        if not filter:
+            return "", ()
+        needle = filter.lower()
+        return " WHERE instr(title_key, ?) > 0 OR instr(author_key, ?) > 0", (needle, needle)
+
+    def find_book(self, query: str) -> Optional[Book]:
+        key = query.lower()
+        row = self._conn.execute(_LOOKUP, (canonical(query), key, key)).fetchone()
+        if row is not None:
+            return Book(*row[1:])
+
+        matches = self.suggest(query)
+        if matches:
+            print("Benzer kitaplar:")
+            for match in matches:
+                print(f"- {match}")
+        return None
+
+    def suggest(self, query: str, n: int = 3, cutoff: Optional[float] = None) -> List[str]:
+        """Sorguya en çok benzeyen başlıklar (Library.suggest gibi trigram indeksiyle)"""
+        cutoff = self.suggestion_cutoff if cutoff is None else cutoff
+        return self._fuzzy().suggest(query, n, cutoff)
+
+    def _fuzzy(self) -> FuzzyIndex:
+        # data_version yalnızca başka bağlantıların yazmalarıyla değişir; kendi
+        # yazmalarımız indekse _fuzzy_update ile işlenir
+        version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+        if self._title_fuzzy is None or version != self._data_version:
+            self._title_fuzzy = FuzzyIndex()
+            for (title,) in self._conn.execute("SELECT title FROM books"):
+                self._title_fuzzy.add(title)
+            self._data_version = version
+        return self._title_fuzzy
+
+    def _fuzzy_update(self, added=(), removed=()):
+        if self._title_fuzzy is None:
+            return
+        for book in added:
+            self._title_fuzzy.add(book.title)
+        for book in removed:
+            self._title_fuzzy.remove(book.title)
+
+    def import_json(self, path: str) -> int:
+        """library.json dosyasını içe aktarır (migrasyon), eklenen sayısını döner.
+
+        Günlükte (library.json.journal) bekleyen değişiklikler de uygulanır.
+        """
+        return len(self.add_books(Book.from_dict(item) for item in open_storage(path).load()).added)
@@ -0,0 +1,323 @@
+import json
+import logging
+import os
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows: süreçler arası kilit yok
+    fcntl = None
+
+from . import metrics
+from .isbn import canonical
+from .snapshot import Snapshot, write_snapshot
+from .streaming import atomic_open, dump_json_array, iter_json_array
+
+
+def read_json(path: Path) -> List[Dict]:
+    """library.json biçimindeki dosyayı okur (bozuk veya eksik dosya boş liste döner)"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            # Dosya metni bütünüyle belleğe alınmadan kayıt kayıt ayrıştırılır
+            return list(iter_json_array(f))
+    except (ValueError, FileNotFoundError):
+        return []
+
+
+def write_json(path: Path, records: Iterable[Dict]):
+    """Kayıtları geçici dosyaya yazıp yerine taşır; yarım kalmış dosya oluşmaz"""
+    with atomic_open(path) as f:
+        dump_json_array(records, f)
+
+
+def _record_key(record: Dict) -> Tuple:
+    return record.get("title"), record.get("author"), canonical(record.get("isbn", ""))
+
+
+def _signature(path: Path) -> Optional[Tuple[int, int, int]]:
+    """Dosya değişti mi? (inode, mtime, boyut); dosya yoksa None"""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return st.st_ino, st.st_mtime_ns, st.st_size
+
+
+class FileLock:
+    """`<katalog>.lock` üzerinde fcntl.flock ile süreçler arası kilit.
+
+    Aynı nesne içinde iç içe alınabilir; kilit en dıştaki blok bitince
+    bırakılır. Paylaşımlı (okuma) kilidi tutulurken özel kilit istenirse
+    kilit yükseltilir.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._fd: Optional[int] = None
+        self._depth = 0
+        self._shared = False
+
+    @contextmanager
+    def __call__(self, shared: bool = False):
+        if fcntl is None:
+            yield
+            return
+        if self._depth == 0:
+            self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+            fcntl.flock(self._fd, fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+            self._shared = shared
+        elif self._shared and not shared:
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+            self._shared = False
+        self._depth += 1
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            if self._depth == 0:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+                os.close(self._fd)
+                self._fd = None
+
+
+class Storage:
+    """Library için kalıcılık katmanı"""
+
+    def load(self) -> List[Dict]:
+        """Kayıtlı kitapları ekleme sırasıyla döner"""
+        raise NotImplementedError
+
+    def append(self, op: str, record: Dict):
+        """Tek bir ekleme ('add') veya silme ('remove') işlemini kaydeder"""
+        raise NotImplementedError
+
+    def append_many(self, entries: Iterable[Tuple[str, Dict]]):
+        for op, record in entries:
+            self.append(op, record)
+
+    def needs_compaction(self) -> bool:
+        return False
+
+    def compact(self, records: Iterable[Dict]):
+        """Tüm katalogu tek seferde yazar"""
+        raise NotImplementedError
+
+    def lock(self, shared: bool = False):
+        """Okuma-değiştirme-yazma adımlarını başka süreçlere karşı korur"""
+        return nullcontext()
+
+    def open_snapshot(self) -> Optional[Tuple[Snapshot, List[Tuple[str, Dict]]]]:
+        """Bellek eşlemli anlık görüntü ve üstüne uygulanacak günlük işlemleri.
+
+        Desteklemeyen (veya henüz anlık görüntüsü olmayan) depolar None döner;
+        Library bu durumda `load()` kullanır.
+        """
+        return None
+
+    def changes(self) -> Optional[List[Tuple[str, Dict]]]:
+        """Son load/changes çağrısından beri başka süreçlerin yaptığı işlemler.
+
+        Yalnızca yeni işlemler okunabiliyorsa (op, kayıt) listesi, dosya
+        tümüyle değiştiyse (yeniden yazıldı/sıkıştırıldı) None döner.
+        """
+        return []
+
+
+class JsonStorage(Storage):
+    """Eski davranış: her değişiklikte library.json baştan yazılır"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.lock = FileLock(self.path.with_name(self.path.name + ".lock"))
+        self._signature: Optional[Tuple[int, int, int]] = None
+
+    def load(self) -> List[Dict]:
+        with metrics.span("library_storage_seconds", op="load"), self.lock(shared=True):
+            self._signature = _signature(self.path)
+            return read_json(self.path)
+
+    def append(self, op: str, record: Dict):
+        pass
+
+    def needs_compaction(self) -> bool:
+        return True
+
+    def compact(self, records: Iterable[Dict]):
+        with metrics.span("library_storage_seconds", op="compact"), self.lock():
+            write_json(self.path, records)
+            self._signature = _signature(self.path)
+
+    def changes(self) -> Optional[List[Tuple[str, Dict]]]:
+        return [] if _signature(self.path) == self._signature else None
+
+
+class JournalStorage(Storage):
+    """JSON anlık görüntü + yalnızca sona eklenen işlem günlüğü (write-ahead journal).
+
+    Anlık görüntü library.json ile aynı biçimdedir; günlükteki her satır
+    {"op": "add" | "remove", "book": {...}} şeklinde bir JSON kaydıdır.
+    Günlük `compact_every` kayda ulaşınca anlık görüntü atomik olarak
+    yeniden yazılır ve günlük yenisiyle değiştirilir.
+
+    Aynı dosyayı kullanan süreçler `<katalog>.lock` üzerinden kilitlenir.
+    Her süreç günlükte nereye kadar okuduğunu (bayt) ve anlık görüntü ile
+    günlüğün kimliğini (inode/mtime/boyut) tutar; `changes()` yalnızca
+    diğer süreçlerin sona eklediği satırları okur.
+    """
+
+    def __init__(self, path, journal_path: Optional[str] = None,
+                 compact_every: int = 1000, fsync: bool = False):
+        self.path = Path(path)
+        self.journal_path = Path(journal_path) if journal_path else self.path.with_name(self.path.name + ".journal")
+        self.compact_every = compact_every
+        self.fsync = fsync
+        self.lock = FileLock(self.path.with_name(self.path.name + ".lock"))
+        self._journal_entries = 0
+        self._snapshot: Optional[Tuple[int, int, int]] = None
+        self._journal_inode: Optional[int] = None
+        self._offset = 0  # Günlükte okunmuş/yazılmış son tam satırın sonu
+
+    def load(self) -> List[Dict]:
+        with metrics.span("library_storage_seconds", op="load"), self.lock(shared=True):
+            self._snapshot = _signature(self.path)
+            books = {_record_key(r): r for r in self._read_snapshot()}
+            self._journal_inode, self._offset = self._journal_identity()[0], 0
+            self._journal_entries = 0
+            for op, record in self._read_journal():
+                self._journal_entries += 1
+                if op == "add":
+                    books.setdefault(_record_key(record), record)
+                elif op == "remove":
+                    books.pop(_record_key(record), None)
+            return list(books.values())
+
+    def _read_snapshot(self) -> Iterable[Dict]:
+        return read_json(self.path)
+
+    def _write_snapshot(self, records: Iterable[Dict]):
+        write_json(self.path, records)
+
+    def _journal_identity(self) -> Tuple[Optional[int], int]:
+        try:
+            st = os.stat(self.journal_path)
+        except FileNotFoundError:
+            return None, 0
+        return st.st_ino, st.st_size
+
+    def _read_journal(self):
+        """`_offset`'ten itibaren tam satırları okur ve `_offset`'i ilerletir"""
+        if not self.journal_path.exists():
+            return
+        with open(self.journal_path, 'rb') as f:
+            f.seek(self._offset)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break  # Yazılmakta olan (veya çökmede yarım kalan) son satır
+                self._offset += len(line)
+                if not line.strip():
+                    continue
+                try:
+                    entry = json.loads(line)
+                    yield entry["op"], entry["book"]
+                except (json.JSONDecodeError, UnicodeDecodeError, KeyError, TypeError):
+                    # Çökme sırasında yarım yazılmış satır atlanır
+                    logging.warning(f"Günlük satırı okunamadı ({self.journal_path}, bayt {self._offset})")
+
+    def changes(self) -> Optional[List[Tuple[str, Dict]]]:
+        # Değişiklik yoksa (en sık durum) kilit alınmaz: iki stat çağrısı yeterli
+        if self._journal_identity() == (self._journal_inode, self._offset) and \
+                _signature(self.path) == self._snapshot:
+            return []
+        with self.lock(shared=True):
+            inode, size = self._journal_identity()
+            if _signature(self.path) != self._snapshot or inode != self._journal_inode or size < self._offset:
+                metrics.inc("library_reloads_total")
+                return None  # Başka bir süreç sıkıştırma yaptı: tam yeniden yükleme
+            if size == self._offset:
+                return []
+            entries = list(self._read_journal())
+            self._journal_entries += len(entries)
+            return entries
+
+    def append(self, op: str, record: Dict):
+        self.append_many([(op, record)])
+
+    def append_many(self, entries: Iterable[Tuple[str, Dict]]):
+        lines = "".join(
+            json.dumps({"op": op, "book": record}, ensure_ascii=False) + "\n"
+            for op, record in entries
+        ).encode("utf-8")
+        if not lines:
+            return
+        with metrics.span("library_storage_seconds", op="append"), self.lock(), \
+                open(self.journal_path, 'ab') as f:
+            size = f.seek(0, os.SEEK_END)
+            in_sync = (size == self._offset and self._journal_inode in (None, os.fstat(f.fileno()).st_ino))
+            if size and not in_sync:
+                # Yarım kalmış bir satır varsa yeni kayıt ona yapışmasın
+                with open(self.journal_path, 'rb') as r:
+                    r.seek(size - 1)
+                    if r.read(1) != b"\n":
+                        lines = b"\n" + lines
+            f.write(lines)
+            f.flush()
+            if self.fsync:
+                os.fsync(f.fileno())
+            if in_sync:  # Kendi yazdıklarımız changes() ile yeniden okunmasın
+                self._journal_inode = os.fstat(f.fileno()).st_ino
+                self._offset = size + len(lines)
+        self._journal_entries += lines.count(b"\n")
+
+    def needs_compaction(self) -> bool:
+        return self._journal_entries >= self.compact_every
+
+    def compact(self, records: Iterable[Dict]):
+        with metrics.span("library_storage_seconds", op="compact"), self.lock():
+            self._write_snapshot(records)
+            # Günlük yerinde kesilmez, boş bir dosyayla değiştirilir: yeni inode
+            # sayesinde diğer süreçler sıkıştırmayı changes() ile fark eder.
+            # Arada çökme olursa günlüğün yeniden oynatılması aynı sonucu verir.
+            with atomic_open(self.journal_path):
+                pass
+            self._snapshot = _signature(self.path)
+            self._journal_inode, self._offset = self._journal_identity()
+            self._journal_entries = 0
+
+
+class SnapshotStorage(JournalStorage):
+    """İkili, bellek eşlemli anlık görüntü (`snapshot` modülü) + JSON günlüğü.
+
+    Açılışta katalog ayrıştırılmaz: `open_snapshot` dosyayı mmap ile açar
+    ve yalnızca günlüğü okur. Sıkıştırma yeni bir anlık görüntü yazıp eskisinin
+    yerine taşır; eski dosyayı eşlemiş süreçler changes() ile yeniden açar.
+    """
+
+    def open_snapshot(self) -> Optional[Tuple[Snapshot, List[Tuple[str, Dict]]]]:
+        with metrics.span("library_storage_seconds", op="load"), self.lock(shared=True):
+            if not self.path.exists():
+                return None
+            self._snapshot = _signature(self.path)
+            snapshot = Snapshot(self.path)
+            self._journal_inode, self._offset = self._journal_identity()[0], 0
+            entries = list(self._read_journal())
+            self._journal_entries = len(entries)
+            return snapshot, entries
+
+    def _read_snapshot(self) -> Iterable[Dict]:
+        if not self.path.exists():
+            return []
+        snapshot = Snapshot(self.path)
+        try:
+            return list(snapshot.records())
+        finally:
+            snapshot.close()
+
+    def _write_snapshot(self, records: Iterable[Dict]):
+        write_snapshot(self.path, records)
+
+
+def open_storage(path) -> Storage:
+    """Uzantıya göre depo: `.snap` ikili anlık görüntü, diğerleri library.json biçimi"""
+    return SnapshotStorage(path) if Path(path).suffix == ".snap" else JournalStorage(path)
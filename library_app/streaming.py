@@ -0,0 +1,213 @@
+"""Büyük kataloglar için akış halinde içe/dışa aktarma (JSON, JSON Lines, CSV).
+
+Kayıtlar üreteç hattından geçer: oku -> ISBN'i normalleştir -> tekrarları
+ayıkla -> parçalar halinde yaz. Dosyanın tamamı hiçbir zaman belleğe
+alınmaz; tekrar kontrolü için yalnızca kanonik ISBN ve başlık anahtarları
+tutulur.
+"""
+import csv
+import json
+import logging
+import os
+from contextlib import contextmanager
+from itertools import islice
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, TextIO
+
+from .isbn import canonical
+
+FIELDS = ("title", "author", "isbn")
+FORMATS = ("json", "jsonl", "csv")
+_SUFFIXES = {".json": "json", ".jsonl": "jsonl", ".ndjson": "jsonl", ".csv": "csv"}
+
+
+def detect_format(path, fmt: Optional[str] = None) -> str:
+    if fmt:
+        return fmt
+    try:
+        return _SUFFIXES[Path(path).suffix.lower()]
+    except KeyError:
+        raise ValueError(f"Dosya biçimi anlaşılamadı: {path} (json, jsonl veya csv)")
+
+
+@contextmanager
+def atomic_open(path, newline: Optional[str] = None, binary: bool = False):
+    """Geçici dosyaya yazar, başarıyla biterse hedefin yerine taşır"""
+    import tempfile  # Açılış süresine eklenmesin diye yalnızca yazarken yüklenir
+
+    path = Path(path)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent or Path("."), prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with (os.fdopen(fd, 'wb') if binary else os.fdopen(fd, 'w', encoding='utf-8', newline=newline)) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        if os.path.exists(tmp_name):
+            os.remove(tmp_name)
+        raise
+
+
+# Readers
+def iter_json_array(f: TextIO, chunk_size: int = 1 << 16) -> Iterator[Dict]:
+    """`[ {...}, {...} ]` dizisini dosyayı parça parça okuyarak ayrıştırır"""
+    decoder = json.JSONDecoder()
+    buf, pos, eof = "", 0, False
+
+    def next_char() -> str:
+        nonlocal buf, pos, eof
+        while True:
+            while pos < len(buf) and buf[pos].isspace():
+                pos += 1
+            if pos < len(buf) or eof:
+                return buf[pos] if pos < len(buf) else ""
+            chunk = f.read(chunk_size)
+            eof = not chunk
+            buf, pos = buf[pos:] + chunk, 0
+
+    if next_char() != "[":
+        raise ValueError("JSON dizisi bekleniyordu")
+    pos += 1
+    if next_char() == "]":
+        return
+    while True:
+        next_char()
+        while True:
+            try:
+                item, end = decoder.raw_decode(buf, pos)
+                break
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                chunk = f.read(chunk_size)
+                eof = not chunk
+                buf, pos = buf[pos:] + chunk, 0
+        pos = end
+        yield item
+        sep = next_char()
+        pos += 1
+        if sep == "]":
+            return
+        if sep != ",":
+            raise ValueError("JSON dizisinde ',' veya ']' bekleniyordu")
+
+
+def read_json(path) -> Iterator[Dict]:
+    with open(path, 'r', encoding='utf-8') as f:
+        yield from iter_json_array(f)
+
+
+def read_jsonl(path) -> Iterator[Dict]:
+    with open(path, 'r', encoding='utf-8') as f:
+        for line_no, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                logging.warning(f"Satır okunamadı ({path}:{line_no})")
+
+
+def read_csv(path) -> Iterator[Dict]:
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        yield from csv.DictReader(f)
+
+
+_READERS = {"json": read_json, "jsonl": read_jsonl, "csv": read_csv}
+
+
+def read_records(path, fmt: Optional[str] = None) -> Iterator[Dict]:
+    return _READERS[detect_format(path, fmt)](path)
+
+
+# Pipeline stages
+def normalize(records: Iterable[Dict]) -> Iterator[Dict]:
+    """Alanları kırpar ve ISBN'i kanonik biçime çevirir; eksik kayıtları atlar"""
+    for record in records:
+        if not isinstance(record, dict):
+            continue
+        title, author, isbn = (_text(record.get(key)) for key in ("title", "author", "isbn"))
+        if not title or not isbn:  # Eksik veya liste/sözlük gibi metne çevrilemeyen değer
+            continue
+        yield {"title": title, "author": author or "", "isbn": canonical(isbn)}
+
+
+def _text(value) -> Optional[str]:
+    # JSON'da sayı olarak yazılmış ISBN/başlık metne çevrilir; diğer türler geçersizdir
+    if isinstance(value, str):
+        return value.strip()
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return str(value)
+    return None
+
+
+def dedup(records: Iterable[Dict]) -> Iterator[Dict]:
+    """Library ile aynı kural: aynı ISBN veya aynı (küçük harfli) başlık tekrar sayılır"""
+    isbns, titles = set(), set()
+    for record in records:
+        title_key = record["title"].lower()
+        if record["isbn"] in isbns or title_key in titles:
+            continue
+        isbns.add(record["isbn"])
+        titles.add(title_key)
+        yield record
+
+
+def chunked(records: Iterable[Dict], size: int) -> Iterator[List[Dict]]:
+    iterator = iter(records)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+# Writers
+def dump_json_array(records: Iterable[Dict], f: TextIO, indent: int = 2, chunk_size: int = 1000) -> int:
+    """json.dump(list, indent=indent) ile aynı çıktıyı listeyi kurmadan yazar"""
+    pad = " " * indent
+    count = 0
+    f.write("[")
+    for chunk in chunked(records, chunk_size):
+        parts = []
+        for record in chunk:
+            body = json.dumps(record, indent=indent).replace("\n", "\n" + pad)
+            parts.append(("," if count else "") + "\n" + pad + body)
+            count += 1
+        f.write("".join(parts))
+    f.write("\n]" if count else "]")
+    return count
+
+
+def write_json(path, records: Iterable[Dict], chunk_size: int = 1000) -> int:
+    with atomic_open(path) as f:
+        return dump_json_array(records, f, chunk_size=chunk_size)
+
+
+def write_jsonl(path, records: Iterable[Dict], chunk_size: int = 1000) -> int:
+    count = 0
+    with atomic_open(path) as f:
+        for chunk in chunked(records, chunk_size):
+            f.write("".join(json.dumps(r, ensure_ascii=False) + "\n" for r in chunk))
+            count += len(chunk)
+    return count
+
+
+def write_csv(path, records: Iterable[Dict], chunk_size: int = 1000) -> int:
+    count = 0
+    with atomic_open(path, newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDS, extrasaction='ignore')
+        writer.writeheader()
+        for chunk in chunked(records, chunk_size):
+            writer.writerows(chunk)
+            count += len(chunk)
+    return count
+
+
+_WRITERS = {"json": write_json, "jsonl": write_jsonl, "csv": write_csv}
+
+
+def write_records(path, records: Iterable[Dict], fmt: Optional[str] = None, chunk_size: int = 1000) -> int:
+    """Kayıtları dosyaya yazar, yazılan kayıt sayısını döner"""
+    return _WRITERS[detect_format(path, fmt)](path, records, chunk_size=chunk_size)
@@ -1,5 +1,6 @@
 import asyncio
 import logging
+from library_app.isbn import is_valid as is_valid_isbn
 from library_app.models import Book, Library  # Geliştirilmiş modeli kullanıyoruz
 
 logging.basicConfig(
@@ -33,8 +34,8 @@ async def main():
                 
         elif choice == "2":
             isbn = input("ISBN: ").strip()
-            if not isbn.replace("-", "").isdigit():
-                print("⚠️ Geçersiz ISBN formatı")
+            if not is_valid_isbn(isbn):
+                print("⚠️ Geçersiz ISBN (kontrol hanesi hatalı veya 10/13 hane değil)")
                 continue
                 
             book = await lib.fetch_book_from_api(isbn)
@@ -54,13 +55,18 @@ async def main():
                 print("❌ Kitap bulunamadı!")
                 
         elif choice == "4":
-            books = lib.list_books()
-            if books:
-                print("\n📚 KİTAP LİSTESİ:")
-                for i, book in enumerate(books, 1):
-                    print(f"{i}. {book}")
-            else:
+            page = lib.list_books(limit=20)
+            if not page:
                 print("📭 Kütüphane boş!")
+                continue
+
+            print("\n📚 KİTAP LİSTESİ:")
+            while True:
+                for i, book in enumerate(page, page.offset + 1):
+                    print(f"{i}. {book}")
+                if not page.has_next or input("Devamı için Enter, çıkmak için q: ").strip().lower() == "q":
+                    break
+                page = lib.list_books(offset=page.offset + len(page), limit=20)
                 
         elif choice == "5":
             query = input("Arama (ISBN/Ad/Yazar): ").strip()
@@ -74,5 +80,7 @@ async def main():
         else:
             print("⚠️ Geçersiz seçim!")
 
+    await lib.aclose()
+
 if __name__ == "__main__":
     asyncio.run(main())
@@ -1,5 +1,12 @@
+import asyncio
+import httpx
 import pytest
-from library_app.api_client import OpenLibraryClient
+from library_app.api_client import OpenLibraryClient, search_doc_to_record
+from library_app.exceptions import APIError
+from library_app.isbn import to_isbn13
+from library_app.models import Book, Library
+from library_app.resilience import ResiliencePolicy
+from library_app.session import HttpSession
 
 @pytest.mark.asyncio
 async def test_fetch_book_success():
@@ -14,4 +21,69 @@ async def test_search_books():
     client = OpenLibraryClient()
     results = await client.search_books("Dune")
     assert len(results) > 0
-    assert all("isbn" in doc for doc in results[:3])
\ No newline at end of file
+    assert all("isbn" in doc for doc in results[:3])
+
+def _search_transport(requests, total=250):
+    def handler(request):
+        params = request.url.params
+        requests.append(dict(params))
+        offset, limit = int(params["offset"]), int(params["limit"])
+        docs = [{"title": f"Kitap {i}", "author_name": ["Yazar"], "isbn": [to_isbn13(str(i).zfill(9))]}
+                for i in range(offset, min(offset + limit, total))]
+        return httpx.Response(200, json={"numFound": total, "docs": docs})
+    return httpx.MockTransport(handler)
+
+@pytest.mark.asyncio
+async def test_iter_search_pages_with_prefetch():
+    requests = []
+    async with HttpSession(transport=_search_transport(requests)) as session:
+        client = OpenLibraryClient(session=session, policy=ResiliencePolicy())
+        docs = client.iter_search("c++ & dune", page_size=100)
+        assert (await docs.__anext__())["title"] == "Kitap 0"
+        await asyncio.sleep(0.01)
+        assert len(requests) == 2  # İkinci sayfa ilk sayfa tüketilirken istendi
+        rest = [doc async for doc in docs]
+
+    assert len(rest) == 249
+    assert [r["offset"] for r in requests] == ["0", "100", "200"]  # Kısa son sayfadan sonra istek yok
+    assert requests[0]["q"] == "c++ & dune" and requests[0]["fields"] == "title,author_name,isbn"
+
+@pytest.mark.asyncio
+async def test_iter_search_max_results_and_early_stop():
+    requests = []
+    async with HttpSession(transport=_search_transport(requests)) as session:
+        client = OpenLibraryClient(session=session, policy=ResiliencePolicy())
+        assert len([d async for d in client.iter_search("x", page_size=40, max_results=90)]) == 90
+        assert [r["limit"] for r in requests] == ["40", "40", "10"]
+
+        requests.clear()
+        async for _ in client.iter_search("x", page_size=10):
+            break
+    assert len(requests) <= 2
+
+@pytest.mark.asyncio
+async def test_search_results_feed_batch_import(tmp_path):
+    lib = Library(str(tmp_path / "library.json"))
+    lib.add_book(Book("Mevcut", "Yazar", to_isbn13("000000003")))
+    async with HttpSession(transport=_search_transport([], total=30)) as session:
+        client = OpenLibraryClient(session=session, policy=ResiliencePolicy())
+        docs = client.iter_search("x", page_size=8)
+        counts = await lib.import_records((search_doc_to_record(d) async for d in docs), chunk_size=5)
+
+    assert counts == {"read": 30, "added": 29, "duplicates": 1, "skipped": 0}
+    assert len(Library(str(tmp_path / "library.json")).books) == 30
+
+@pytest.mark.asyncio
+async def test_connection_error_is_api_error():
+    def handler(request):
+        raise httpx.ConnectError("bağlantı yok", request=request)
+    async with HttpSession(transport=httpx.MockTransport(handler)) as session:
+        client = OpenLibraryClient(session=session, policy=ResiliencePolicy(attempts=1))
+        with pytest.raises(APIError):
+            async for _ in client.iter_search("x"):
+                pass
+
+def test_search_doc_to_record():
+    doc = {"title": "Dune", "author_name": ["Frank Herbert"], "isbn": ["0441172717", "bozuk", "9780441013593"]}
+    assert search_doc_to_record(doc) == {"title": "Dune", "author": "Frank Herbert", "isbn": "9780441013593"}
+    assert search_doc_to_record({"title": "ISBN'siz"}) is None
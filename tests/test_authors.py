@@ -0,0 +1,49 @@
+import asyncio
+import httpx
+import pytest
+from library_app.authors import AuthorResolver
+from library_app.cache import MetadataCache
+from library_app.isbn import to_isbn13
+from library_app.models import Library
+from library_app.resilience import ResiliencePolicy
+from library_app.session import HttpSession
+
+@pytest.mark.asyncio
+async def test_resolver_coalesces_and_batches():
+    batches = []
+    resolver = AuthorResolver(None)
+
+    async def fetch_batch(keys, session=None):
+        batches.append(list(keys))
+        return {k: f"Yazar {k}" for k in keys}
+
+    resolver.fetch_batch = fetch_batch
+    keys = ["/authors/OL1A", "/authors/OL2A"] * 10
+    names = await asyncio.gather(*(resolver.resolve(k) for k in keys))
+    assert names[:2] == ["Yazar /authors/OL1A", "Yazar /authors/OL2A"]
+    assert batches == [["/authors/OL1A", "/authors/OL2A"]]
+
+    await resolver.resolve("/authors/OL1A")  # Önbellekten
+    assert len(batches) == 1
+
+@pytest.mark.asyncio
+async def test_books_by_same_author_cost_one_author_request(tmp_path):
+    paths = []
+
+    def handler(request):
+        paths.append(request.url.path)
+        if request.url.path.startswith("/authors/"):
+            return httpx.Response(200, json={"name": "Frank Herbert"})
+        return httpx.Response(200, json={"title": request.url.path, "authors": [{"key": "/authors/OL1A"}]})
+
+    async with HttpSession(transport=httpx.MockTransport(handler)) as session:
+        lib = Library(str(tmp_path / "library.json"), session=session, cache=MetadataCache())
+        for provider in lib.providers.providers:
+            provider.policy = ResiliencePolicy(provider.name)  # Hız sınırı olmadan
+        isbns = [to_isbn13(str(i).zfill(9)) for i in range(30)]
+        books = [b async for _, b in lib.fetch_books_from_api(isbns, concurrency=10)]
+        books.append(await lib.fetch_book_from_api(to_isbn13("111111111")))
+
+    assert all(b.author == "Frank Herbert" for b in books)
+    assert paths.count("/authors/OL1A.json") == 1
+    assert len(paths) == 32
@@ -0,0 +1,53 @@
+import asyncio
+import pytest
+from click.testing import CliRunner
+from library_app import cli as cli_module
+from library_app.isbn import canonical, to_isbn13
+from library_app.models import Book, Library
+
+def test_canonical_isbn():
+    assert canonical("0-306-40615-2") == "9780306406157"
+    assert canonical("978-0-306-40615-7") == "9780306406157"
+    assert canonical("0-8044-2957-x") == "9780804429573"
+
+@pytest.fixture
+def fake_library(tmp_path):
+    lib = Library(str(tmp_path / "library.json"))
+    lib.calls = []
+    lib.in_flight = lib.max_in_flight = 0
+
+    async def fake_fetch(isbn):
+        lib.calls.append(isbn)
+        lib.in_flight += 1
+        lib.max_in_flight = max(lib.max_in_flight, lib.in_flight)
+        await asyncio.sleep(0.01)
+        lib.in_flight -= 1
+        return Book(f"Book {isbn}", "Author", isbn)
+
+    lib.fetch_book_from_api = fake_fetch
+    return lib
+
+@pytest.mark.asyncio
+async def test_fetch_books_from_api_dedups_and_bounds_concurrency(fake_library):
+    isbns = ["0-306-40615-2", "9780306406157"] + [to_isbn13(str(i).zfill(9)) for i in range(20)]
+    results = [r async for r in fake_library.fetch_books_from_api(isbns, concurrency=4)]
+
+    assert len(results) == 21
+    assert sorted(fake_library.calls) == sorted(set(fake_library.calls))
+    assert fake_library.max_in_flight == 4
+
+@pytest.mark.asyncio
+async def test_fetch_books_from_api_rejects_zero_concurrency(fake_library, monkeypatch):
+    monkeypatch.setattr(cli_module, "library", fake_library)
+    with pytest.raises(ValueError):
+        [r async for r in fake_library.fetch_books_from_api(["9780141439587"], concurrency=0)]
+    result = CliRunner().invoke(cli_module.cli, ["import-isbns", "--concurrency", "0"], input="9780141439587\n")
+    assert result.exit_code == 2
+
+def test_import_isbns_command(fake_library, monkeypatch):
+    monkeypatch.setattr(cli_module, "library", fake_library)
+    result = CliRunner().invoke(cli_module.cli, ["import-isbns", "--concurrency", "2"],
+                                input="0-306-40615-2\n9780306406157\n\n9780141439587\n")
+    assert result.exit_code == 0, result.output
+    assert "2 kitap eklendi" in result.output
+    assert fake_library.find_book("9780141439587") is not None
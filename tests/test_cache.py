@@ -0,0 +1,47 @@
+import httpx
+import pytest
+from library_app.cache import MetadataCache
+from library_app.models import Library
+from library_app.session import HttpSession
+
+DUNE = {"title": "Dune", "author": "Frank Herbert", "isbn": "9780441172719"}
+
+def test_lru_eviction_and_aliases():
+    cache = MetadataCache(max_entries=2)
+    cache.put(["0-441-17271-7"], DUNE)  # ISBN-10 ve ISBN-13 tek kayıt
+    assert cache.get("0441172717") == (True, DUNE)
+    cache.put([], {"title": "Emma", "author": "Jane Austen", "isbn": "9780141439587"})
+    cache.get("9780441172719")
+    cache.put_missing("9780000000002")
+    assert cache.get("9780141439587") == (False, None)  # En eski kullanılan çıkarıldı
+    assert cache.get("9780000000002") == (True, None)
+
+def test_ttl_and_persistence(tmp_path):
+    path = tmp_path / "cache.db"
+    MetadataCache(str(path)).put([], DUNE)
+    assert MetadataCache(str(path)).get("9780441172719") == (True, DUNE)
+
+    expired = MetadataCache(str(path), ttl=-1)
+    expired.put([], DUNE)
+    assert expired.get("9780441172719") == (False, None)
+
+@pytest.mark.asyncio
+async def test_repeated_imports_hit_disk_cache(tmp_path):
+    requests = []
+
+    def handler(request):
+        requests.append(request.url.path)
+        if request.url.host == "www.googleapis.com":
+            return httpx.Response(200, json={"totalItems": 0})
+        if request.url.path == "/isbn/9780000000002.json":
+            return httpx.Response(404)
+        return httpx.Response(200, json={"title": "Dune", "authors": [{"name": "Frank Herbert"}],
+                                         "isbn_10": ["0441172717"]})
+
+    for _ in range(2):  # İkinci çalıştırma yeni bir Library ile
+        async with HttpSession(transport=httpx.MockTransport(handler)) as session:
+            lib = Library(str(tmp_path / "library.json"), session=session)
+            assert (await lib.fetch_book_from_api("9780441172719")).title == "Dune"
+            assert (await lib.fetch_book_from_api("0441172717")).title == "Dune"
+            assert await lib.fetch_book_from_api("9780000000002") is None
+    assert len(requests) == 3  # Dune + iki sağlayıcıda bulunamayan ISBN
@@ -0,0 +1,29 @@
+from difflib import get_close_matches
+from library_app.fuzzy import FuzzyIndex
+from library_app.models import Book, Library
+
+def test_fuzzy_index_matches_difflib():
+    titles = ["Dune", "Dune Messiah", "Emma", "Ulysses", "Moby Dick"]
+    index = FuzzyIndex()
+    for title in titles:
+        index.add(title)
+
+    for query in ("dnue", "ulyses", "moby dik", "emm"):
+        expected = get_close_matches(query, [t.lower() for t in titles], n=3, cutoff=0.6)
+        assert [s.lower() for s in index.suggest(query, cutoff=0.6)] == expected
+
+def test_fuzzy_index_remove_keeps_shared_values():
+    index = FuzzyIndex()
+    index.add("Frank Herbert")
+    index.add("Frank Herbert")
+    index.remove("Frank Herbert")
+    assert index.suggest("frank herbrt") == ["Frank Herbert"]
+    index.remove("Frank Herbert")
+    assert index.suggest("frank herbrt") == []
+
+def test_find_book_prints_suggestions(tmp_path, capsys):
+    lib = Library(str(tmp_path / "library.json"))
+    lib.add_book(Book("Ulysses", "James Joyce", "111"))
+    assert lib.find_book("ulyses") is None
+    assert "- Ulysses" in capsys.readouterr().out
+    assert lib.suggest("jmes joyce", include_authors=True) == ["James Joyce"]
@@ -0,0 +1,17 @@
+from library_app.isbn import aliases, canonical, canonical_many, clean, is_valid, to_isbn10, to_isbn13
+
+def test_validation_and_conversion():
+    assert is_valid("0-306-40615-2") and is_valid("978-0-306-40615-7")
+    assert is_valid("0-8044-2957-X")
+    assert not is_valid("0-306-40615-3") and not is_valid("12345")
+    assert to_isbn13("0306406152") == "9780306406157"
+    assert to_isbn10("9780306406157") == "0306406152"
+    assert to_isbn10("9791234567896") is None  # 979 önekinin ISBN-10'u yok
+    assert clean("0-8044-2957-x") == "080442957X"
+    assert aliases("0-306-40615-2") == ["9780306406157", "0306406152"]
+
+def test_canonical_keys():
+    assert canonical_many(["0-306-40615-2", "978 0 306 40615 7", "0306406152"]) == ["9780306406157"] * 3
+    assert canonical("080442957x") == "9780804429573"
+    assert canonical(" 213e ") == "213E"  # Geçersiz değerler olduğu gibi (büyük harfle) kalır
+    assert canonical("0306406153") == "0306406153"
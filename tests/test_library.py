@@ -1,5 +1,9 @@
 import pytest
+import subprocess
+import sys
 import os
+from click.testing import CliRunner
+from library_app import cli as cli_module
 from library_app.models import Book, Library
 
 @pytest.fixture
@@ -29,4 +33,134 @@ async def test_fetch_book_from_api(temp_library):
     assert "To Kill a Mockingbird" in book.title
     
     # Test with invalid ISBN
-    assert await temp_library.fetch_book_from_api("0000000000") is None
\ No newline at end of file
+    assert await temp_library.fetch_book_from_api("0000000000") is None
+
+def test_duplicate_title_is_rejected(temp_library):
+    assert temp_library.add_book(Book("Dune", "Frank Herbert", "111"))
+    assert not temp_library.add_book(Book("DUNE", "Someone Else", "222"))
+    assert len(temp_library.books) == 1
+
+def test_find_book_uses_indexes(temp_library):
+    first = Book("Dune", "Frank Herbert", "111")
+    second = Book("Children of Dune", "Frank Herbert", "222")
+    temp_library.add_book(first)
+    temp_library.add_book(second)
+    assert temp_library.find_book("222") is second
+    assert temp_library.find_book("children of dune") is second
+    assert temp_library.find_book("FRANK HERBERT") is first  # İlk eklenen döner
+    assert temp_library.remove_book("dune")
+    assert temp_library.find_book("frank herbert") is second
+    assert temp_library.find_book("111") is None
+
+def test_add_books_reports_per_item_results(temp_library):
+    result = temp_library.add_books([
+        Book("Dune", "Frank Herbert", "111"),
+        Book("Dune", "Frank Herbert", "111"),
+        Book("", "Nobody", "222"),
+        Book("Emma", "Jane Austen", "333"),
+    ])
+    assert [b.isbn for b in result.added] == ["111", "333"]
+    assert len(result.duplicates) == 1
+    assert len(result.rejected) == 1
+
+    result = temp_library.remove_books(["111", "999"])
+    assert [b.isbn for b in result.removed] == ["111"]
+    assert result.not_found == ["999"]
+
+def test_batch_rolls_back_on_error(temp_library):
+    temp_library.add_book(Book("Dune", "Frank Herbert", "111"))
+    temp_library.add_book(Book("Emma", "Jane Austen", "222"))
+    with pytest.raises(RuntimeError):
+        with temp_library.batch():
+            temp_library.remove_book("111")
+            temp_library.add_book(Book("Ulysses", "James Joyce", "333"))
+            raise RuntimeError("iptal")
+
+    assert [b.isbn for b in temp_library.books] == ["111", "222"]
+    assert [b.isbn for b in Library(str(temp_library.file_path)).books] == ["111", "222"]
+
+def test_batch_rolls_back_when_flush_fails(temp_library, monkeypatch):
+    temp_library.add_book(Book("Dune", "Frank Herbert", "111"))
+
+    def fail(entries):
+        raise OSError("disk dolu")
+    monkeypatch.setattr(temp_library.storage, "append_many", fail)
+    with pytest.raises(OSError):
+        temp_library.add_books([Book("Emma", "Jane Austen", "222")])
+    monkeypatch.undo()
+
+    assert [b.isbn for b in temp_library.books] == ["111"]
+    assert temp_library.find_book("222") is None
+    temp_library.save_books()
+    assert [b.isbn for b in Library(str(temp_library.file_path)).books] == ["111"]
+
+def test_remove_from_shared_author_bucket(temp_library):
+    temp_library.add_books(Book(f"Kitap {i}", "Bilinmeyen Yazar", str(100 + i)) for i in range(50))
+    temp_library.remove_books(["100", "125", "149"])
+    assert temp_library.lookup("bilinmeyen yazar").isbn == "101"
+    assert temp_library._author_index["bilinmeyen yazar"] == [i for i in range(1, 49) if i != 25]
+
+def test_book_serialization():
+    book = Book.from_dict({"title": "Dune", "author": "Frank Herbert", "isbn": "111"})
+    assert book.to_dict() == {"title": "Dune", "author": "Frank Herbert", "isbn": "111"}
+    assert not hasattr(book, "__dict__")
+    assert book.author is Book("Dune Messiah", "".join(["Frank ", "Herbert"]), "222").author
+
+def test_isbn_variants_are_duplicates(temp_library):
+    assert temp_library.add_book(Book("Dune", "Frank Herbert", "0-441-17271-7"))
+    assert not temp_library.add_book(Book("Dune (2. baskı)", "Frank Herbert", "9780441172719"))
+    assert temp_library.find_book("978-0-441-17271-9").title == "Dune"
+    assert temp_library.remove_book("0441172717")
+
+def test_catalog_is_loaded_on_first_access(tmp_path):
+    db_file = tmp_path / "library.json"
+    Library(str(db_file)).add_book(Book("Dune", "Frank Herbert", "111"))
+
+    lib = Library(str(db_file))
+    assert not lib.loaded
+    assert lib.find_book("111").title == "Dune"
+    assert lib.loaded
+    assert Library(str(db_file), lazy=False).loaded
+
+def test_cli_import_skips_network_modules():
+    code = "import sys, library_app.cli; print('httpx' in sys.modules, 'sqlite3' in sys.modules)"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True,
+                            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    assert result.stdout.split() == ["False", "False"]
+
+def test_list_books_pages_and_sorts(tmp_path):
+    lib = Library(str(tmp_path / "library.json"))
+    for title, author, isbn in [("Emma", "Jane Austen", "3"), ("Dune", "Frank Herbert", "1"),
+                                ("Persuasion", "Jane Austen", "2")]:
+        lib.add_book(Book(title, author, isbn))
+
+    page = lib.list_books(limit=2, sort_by="title")
+    assert [b.title for b in page.books] == ["Dune", "Emma"]
+    assert page.total == 3 and page.has_next
+    assert list(lib.list_books(offset=2, limit=2, sort_by="title")) == ["Persuasion by Jane Austen (ISBN: 2)"]
+    assert [b.isbn for b in lib.iter_books(sort_by="-isbn")] == ["3", "2", "1"]
+
+    filtered = lib.list_books(limit=1, sort_by="title", filter="austen")
+    assert [b.title for b in filtered.books] == ["Emma"] and filtered.total == 2
+
+    lib.add_book(Book("Alpha", "Zed", "4"))  # Sıralı indeks değişiklikten sonra yenilenir
+    assert lib.list_books(limit=1, sort_by="title")[0].startswith("Alpha")
+    lib.remove_book("4")
+    assert [b.title for b in lib.iter_books(sort_by="-title")] == ["Persuasion", "Emma", "Dune"]
+    lib.add_book(Book("Sanditon", "Jane Austen", "5"))
+    lib.remove_book("2")  # Aynı yazar anahtarlı kitaplar arasından doğru kayıt çıkar
+    assert [b.title for b in lib.iter_books(sort_by="author")] == ["Dune", "Emma", "Sanditon"]
+    with pytest.raises(ValueError):
+        lib.list_books(sort_by="year")
+
+def test_cli_list_books_page_and_stream(tmp_path, monkeypatch):
+    lib = Library(str(tmp_path / "library.json"))
+    lib.add_books(Book(f"Kitap {i:02d}", "Yazar", str(i)) for i in range(25))
+    monkeypatch.setattr(cli_module, "library", lib)
+
+    result = CliRunner().invoke(cli_module.cli, ["list-books", "--page", "3", "--limit", "10", "--sort", "-title"])
+    assert result.output.splitlines() == [f"Kitap {i:02d} by Yazar (ISBN: {i})" for i in range(4, -1, -1)] + [
+        "Sayfa 3/3 (toplam 25 kitap)"]
+
+    result = CliRunner().invoke(cli_module.cli, ["list-books", "--stream"])
+    assert len(result.output.splitlines()) == 25
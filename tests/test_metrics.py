@@ -0,0 +1,122 @@
+import httpx
+import pytest
+import pytest_asyncio
+from click.testing import CliRunner
+from library_app import cli as cli_module
+from library_app import metrics
+from library_app.cache import MetadataCache
+from library_app.models import Book, Library
+from library_app.server import LibraryServer
+
+DUNE = {"title": "Dune", "author": "Frank Herbert", "isbn": "9780441172719"}
+
+@pytest.fixture
+def registry():
+    metrics.registry.reset()
+    metrics.registry.enable()
+    yield metrics.registry
+    metrics.registry.disable()
+    metrics.registry.reset()
+
+def test_disabled_registry_records_nothing():
+    reg = metrics.Registry()
+    reg.inc("x")
+    reg.observe("y", 0.1)
+    with reg.span("z"):
+        pass
+    assert reg.snapshot() == {"counters": [], "histograms": []}
+
+def test_counters_histograms_and_prometheus_text():
+    reg = metrics.Registry(enabled=True)
+    reg.inc("requests_total", result="hit")
+    reg.inc("requests_total", 2, result="hit")
+    reg.observe("op_seconds", 0.003, op="load")
+    reg.observe("op_seconds", 20, op="load")
+    with pytest.raises(KeyError):
+        with reg.span("op_seconds", op="save"):
+            raise KeyError
+    assert reg.counter("requests_total", result="hit") == 3
+    assert reg.histogram("op_seconds", op="save", error="KeyError").count == 1
+
+    text = reg.to_prometheus()
+    assert '# TYPE requests_total counter\nrequests_total{result="hit"} 3\n' in text
+    assert 'op_seconds_bucket{op="load",le="0.005"} 1\n' in text
+    assert 'op_seconds_bucket{op="load",le="+Inf"} 2\n' in text
+    assert 'op_seconds_count{op="load"} 2\n' in text
+
+def test_prometheus_label_values_are_escaped():
+    reg = metrics.Registry(enabled=True)
+    reg.inc("errors_total", message='a "b" \\ c\nd')
+    assert reg.to_prometheus().splitlines()[1] == 'errors_total{message="a \\"b\\" \\\\ c\\nd"} 1'
+
+def test_save_merges_snapshots(tmp_path):
+    path = tmp_path / "metrics.json"
+    for _ in range(2):
+        reg = metrics.Registry(enabled=True)
+        reg.inc("runs_total")
+        reg.observe("op_seconds", 0.2)
+        metrics.save(path, reg)
+    loaded = metrics.load(path)
+    assert loaded.counter("runs_total") == 2
+    assert loaded.histogram("op_seconds").count == 2
+    assert metrics.load(tmp_path / "missing.json").snapshot()["counters"] == []
+
+def test_library_hot_paths_are_instrumented(tmp_path, registry, capsys):
+    lib = Library(str(tmp_path / "library.json"))
+    lib.add_book(Book("Dune", "Frank Herbert", "111"))
+    lib.save_books()
+    lib.find_book("111")
+    lib.find_book("Dunee")
+
+    assert registry.counter("library_lookups_total", result="hit") == 1
+    assert registry.counter("library_lookups_total", result="miss") == 1
+    assert registry.counter("library_fuzzy_fallbacks_total") == 1
+    for op in ("load", "append", "compact"):
+        assert registry.histogram("library_storage_seconds", op=op).count >= 1
+    assert registry.histogram("library_operation_seconds", op="search").count == 1
+
+def test_cache_hits_and_misses(registry):
+    cache = MetadataCache()
+    cache.get(DUNE["isbn"])
+    cache.put([], DUNE)
+    cache.get(DUNE["isbn"])
+    cache.put_missing("9780000000002")
+    cache.get("9780000000002")
+    assert registry.counter("library_cache_requests_total", result="miss", layer="memory") == 1
+    assert registry.counter("library_cache_requests_total", result="hit", layer="memory") == 1
+    assert registry.counter("library_cache_requests_total", result="negative_hit", layer="memory") == 1
+
+def test_cli_collects_and_prints_stats(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(cli_module, "library", Library(str(tmp_path / "library.json")))
+    runner = CliRunner()
+    try:
+        assert runner.invoke(cli_module.cli, ["--metrics", "find", "--query", "Dune"]).exit_code == 0
+        assert runner.invoke(cli_module.cli, ["--metrics", "find", "--query", "Dune"]).exit_code == 0
+    finally:
+        metrics.registry.disable()
+        metrics.registry.reset()
+
+    result = runner.invoke(cli_module.cli, ["stats"])
+    assert 'library_operation_seconds_count{op="search"} 2' in result.output
+    result = runner.invoke(cli_module.cli, ["stats", "--format", "json", "--reset"])
+    assert '"library_operation_seconds"' in result.output
+    assert not (tmp_path / cli_module.METRICS_FILE).exists()
+
+@pytest_asyncio.fixture
+async def server(tmp_path, registry):
+    lib = Library(str(tmp_path / "library.json"))
+    lib.add_book(Book("Dune", "Frank Herbert", "111"))
+    async with LibraryServer(lib, port=0) as server:
+        yield server
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint(server):
+    async with httpx.AsyncClient(base_url=server.url) as client:
+        await client.get("/books/111")
+        response = await client.get("/metrics")
+        assert response.headers["content-type"].startswith("text/plain")
+        assert 'library_lookups_total{result="hit"} 1' in response.text
+        snapshot = (await client.get("/metrics", params={"format": "json"})).json()
+        assert any(c["name"] == "library_lookups_total" for c in snapshot["counters"])
+        assert (await client.get("/metrics", params={"format": "xml"})).status_code == 400
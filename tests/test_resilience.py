@@ -0,0 +1,98 @@
+import asyncio
+import time
+import pytest
+import pytest_asyncio
+from benchmarks.mock_server import MockServer
+from library_app.api_client import OpenLibraryClient
+from library_app.cache import MetadataCache
+from library_app.exceptions import APIError
+from library_app.isbn import to_isbn13
+from library_app.models import Library
+from library_app.providers import GoogleBooksProvider, OpenLibraryProvider, ProviderRegistry
+from library_app.resilience import CircuitBreaker, CircuitOpenError, ResiliencePolicy, TokenBucket
+
+@pytest_asyncio.fixture
+async def server():
+    async with MockServer() as srv:
+        yield srv
+
+def _library(tmp_path, server, **policy):
+    providers = ProviderRegistry([
+        OpenLibraryProvider(server.url, policy=ResiliencePolicy("openlibrary", base_delay=0.001, **policy)),
+        GoogleBooksProvider(server.url, policy=ResiliencePolicy("googlebooks", base_delay=0.001, **policy)),
+    ], mode="sequential")
+    return Library(str(tmp_path / "library.json"), cache=MetadataCache(), providers=providers)
+
+@pytest.mark.asyncio
+async def test_retries_429_and_5xx(tmp_path, server):
+    lib = _library(tmp_path, server)
+    server.fail_next(429)
+    server.fail_next(503)
+    book = await lib.fetch_book_from_api("9780441172719")
+    assert book.title == "Mock Book 9780441172719"
+    assert lib.providers.get("openlibrary").policy.retries == 2
+    await lib.aclose()
+
+@pytest.mark.asyncio
+async def test_circuit_breaker_fails_fast_during_outage(tmp_path, server):
+    lib = _library(tmp_path, server, attempts=2, failure_threshold=2)
+    server.down = True
+    for i in range(2):
+        assert await lib.fetch_book_from_api(to_isbn13(str(i).zfill(9))) is None
+    before = server.total_requests
+    assert await lib.fetch_book_from_api(to_isbn13("000000002")) is None
+    assert server.total_requests == before  # Devre açık: istek gönderilmedi
+    assert lib.providers.get("openlibrary").policy.breaker.state == CircuitBreaker.OPEN
+    await lib.aclose()
+
+@pytest.mark.asyncio
+async def test_open_library_client_uses_policy(server):
+    client = OpenLibraryClient(policy=ResiliencePolicy(base_delay=0.001, attempts=2, failure_threshold=1))
+    client.BASE_URL = server.url
+    assert (await client.fetch_book_by_isbn("9780441172719"))["title"] == "Mock Book 9780441172719"
+    server.down = True
+    with pytest.raises(APIError):
+        await client.fetch_book_by_isbn("9780441172719")
+    with pytest.raises(CircuitOpenError):
+        await client.fetch_book_by_isbn("9780441172719")
+    await client.aclose()
+
+@pytest.mark.asyncio
+async def test_token_bucket_limits_rate():
+    bucket = TokenBucket(rate=100, capacity=1)
+    start = time.perf_counter()
+    await asyncio.gather(*(bucket.acquire() for _ in range(6)))
+    assert time.perf_counter() - start >= 0.045
+
+def test_circuit_breaker_half_open():
+    now = [0.0]
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=lambda: now[0])
+    breaker.record_failure()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    now[0] = 10
+    breaker.before_call()  # Tek deneme isteği
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+@pytest.mark.asyncio
+async def test_cancelled_probe_releases_half_open_circuit():
+    now = [0.0]
+    policy = ResiliencePolicy(failure_threshold=1, reset_timeout=10)
+    policy.breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=lambda: now[0])
+    policy.breaker.record_failure()
+    now[0] = 10
+
+    class SlowSession:
+        async def get(self, url, **kwargs):
+            await asyncio.sleep(10)
+
+    probe = asyncio.ensure_future(policy.get(SlowSession(), "http://x"))
+    await asyncio.sleep(0)
+    probe.cancel()  # Hedged modda kaybeden sağlayıcı gibi
+    with pytest.raises(asyncio.CancelledError):
+        await probe
+    assert policy.breaker.state == CircuitBreaker.HALF_OPEN
+    assert policy.breaker.before_call() is True  # Yeni deneme isteğine izin verilir
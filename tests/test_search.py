@@ -0,0 +1,77 @@
+import heapq
+import math
+import random
+from click.testing import CliRunner
+from library_app import cli as cli_module
+from library_app.models import Book, Library
+from library_app.search import SearchIndex
+
+def test_search_index_ranking_and_prefix():
+    index = SearchIndex()
+    index.add(1, "Dune Frank Herbert 111")
+    index.add(2, "Dune Messiah Frank Herbert 222")
+    index.add(3, "Emma Jane Austen 333")
+
+    assert [doc for doc, _ in index.search("dune")] == [1, 2]  # Kısa belge önce
+    assert [doc for doc, _ in index.search("mess")] == [2]  # Önek
+    assert [doc for doc, _ in index.search("ustе")] == []
+    assert [doc for doc, _ in index.search("uste")] == [3]  # Alt dize
+    assert [doc for doc, _ in index.search("herbert messiah")] == [2]
+    assert index.search("dune", limit=1) == index.search("dune")[:1]
+
+    index.remove(2, "Dune Messiah Frank Herbert 222")
+    assert index.search("messiah") == []
+    assert len(index) == 2
+
+def _brute_force(index, query, limit):
+    """Her eşleşmeyi puanlayan başvuru uygulaması"""
+    n_docs, totals = len(index._doc_len), None
+    avg_len = index._total_len / n_docs
+    for token in dict.fromkeys(query.split()):
+        scores = {}
+        for term, weight in index._expand(token).items():
+            postings = index._postings[term]
+            idf = math.log(1 + (n_docs - len(postings) + 0.5) / (len(postings) + 0.5))
+            for doc_id, tf in postings.items():
+                norm = tf + index.K1 * (1 - index.B + index.B * index._doc_len[doc_id] / avg_len)
+                scores[doc_id] = max(scores.get(doc_id, 0.0), weight * idf * tf * (index.K1 + 1) / norm)
+        totals = scores if totals is None else {d: s + scores[d] for d, s in totals.items() if d in scores}
+    return heapq.nsmallest(limit, (totals or {}).items(), key=lambda item: (-item[1], item[0]))
+
+def test_pruned_search_matches_full_scoring():
+    rng = random.Random(5)
+    words = ["ada", "adalet", "bal", "balık", "can", "cam", "deniz", "dere", "el", "elma"]
+    index, texts = SearchIndex(), {}
+    for doc_id in range(600):
+        texts[doc_id] = " ".join(rng.choice(words) for _ in range(rng.randint(1, 6)))
+        index.add(doc_id, texts[doc_id])
+    for doc_id in rng.sample(range(600), 150):
+        index.remove(doc_id, texts[doc_id])
+    for doc_id in rng.sample(range(600), 40):  # Eski numarayla geri eklenenler sırayı bozar
+        if doc_id not in index._doc_len:
+            index.add(doc_id, texts[doc_id])
+
+    assert index._impacts
+    for query in [*words, "ad", "al", "eniz", "ada bal", "el elma", "can deniz dere", "balık ada"]:
+        for limit in (1, 10, 1000):
+            assert index.search(query, limit) == _brute_force(index, query, limit), (query, limit)
+
+def test_library_search(tmp_path):
+    lib = Library(str(tmp_path / "library.json"))
+    lib.add_book(Book("Dune", "Frank Herbert", "9780441172719"))
+    lib.add_book(Book("Emma", "Jane Austen", "9780141439587"))
+
+    assert [b.title for b in lib.search("herb")] == ["Dune"]
+    assert [b.title for b in lib.search("1439")] == ["Emma"]
+    assert lib._title_fuzzy is None  # Öneri indeksleri ilk suggest'te kurulur
+    lib.remove_book("Emma")
+    assert lib.search("austen") == []
+    assert lib.suggest("Dne") == ["Dune"]
+
+def test_cli_find_uses_search(tmp_path, monkeypatch):
+    lib = Library(str(tmp_path / "library.json"))
+    lib.add_book(Book("Dune", "Frank Herbert", "111"))
+    monkeypatch.setattr(cli_module, "library", lib)
+
+    result = CliRunner().invoke(cli_module.cli, ["find", "--query", "frank"])
+    assert "Dune by Frank Herbert (ISBN: 111)" in result.output
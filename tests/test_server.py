@@ -0,0 +1,92 @@
+import asyncio
+import httpx
+import pytest
+import pytest_asyncio
+from library_app.models import Book, Library
+from library_app.server import LibraryServer
+
+@pytest_asyncio.fixture
+async def server(tmp_path):
+    lib = Library(str(tmp_path / "library.json"))
+    lib.add_book(Book("Dune", "Frank Herbert", "111"))
+    async with LibraryServer(lib, port=0) as server:
+        yield server
+
+@pytest.mark.asyncio
+async def test_crud_endpoints(server):
+    async with httpx.AsyncClient(base_url=server.url) as client:
+        response = await client.post("/books", json={"title": "Emma", "author": "Jane Austen", "isbn": "222"})
+        assert response.status_code == 201
+        assert (await client.post("/books", json={"title": "emma", "author": "?", "isbn": "333"})).status_code == 409
+        assert (await client.post("/books", json={"title": "Eksik"})).status_code == 400
+
+        assert (await client.get("/books/222")).json()["title"] == "Emma"
+        page = (await client.get("/books", params={"sort": "title", "limit": 1})).json()
+        assert page["total"] == 2 and [b["title"] for b in page["books"]] == ["Dune"]
+        assert [b["isbn"] for b in (await client.get("/search", params={"q": "austen"})).json()["books"]] == ["222"]
+
+        missing = await client.get("/find", params={"q": "Dun"})
+        assert missing.status_code == 404 and missing.json()["suggestions"] == ["Dune"]
+
+        assert (await client.delete("/books/222")).status_code == 200
+        assert (await client.delete("/books/222")).status_code == 404
+        assert (await client.put("/books/111")).status_code == 405
+        assert (await client.get("/nowhere")).status_code == 404
+
+@pytest.mark.asyncio
+async def test_concurrent_writes_go_through_single_writer(server):
+    appends = []
+    storage = server.service.library.storage
+    original = storage.append_many
+    storage.append_many = lambda entries: appends.append(1) or original(entries)
+
+    async with httpx.AsyncClient(base_url=server.url) as client:
+        responses = await asyncio.gather(*(
+            client.post("/books", json={"title": f"Kitap {i}", "author": "Yazar", "isbn": f"9{i}"})
+            for i in range(50)
+        ))
+    assert all(r.status_code == 201 for r in responses)
+    assert len(server.service.library.books) == 51
+    assert len(appends) < 50  # Kuyrukta biriken yazmalar gruplanır
+
+@pytest.mark.asyncio
+async def test_failed_write_only_fails_its_own_request(server):
+    library = server.service.library
+    storage = library.storage
+    original = storage.append_many
+
+    def append_many(entries):
+        entries = list(entries)
+        if any(record["isbn"] == "666" for _, record in entries):
+            raise OSError("disk hatası")
+        original(entries)
+    storage.append_many = append_many
+
+    async with httpx.AsyncClient(base_url=server.url) as client:
+        isbns = ["501", "666", "502"]
+        responses = await asyncio.gather(*(
+            client.post("/books", json={"title": f"Kitap {isbn}", "author": "Yazar", "isbn": isbn}) for isbn in isbns
+        ))
+        assert dict(zip(isbns, (r.status_code for r in responses))) == {"501": 201, "666": 500, "502": 201}
+        assert (await client.get("/books/666")).status_code == 404
+    assert sorted(b.isbn for b in Library(str(library.file_path)).books) == ["111", "501", "502"]
+
+@pytest.mark.asyncio
+async def test_library_runs_off_the_event_loop(server):
+    import threading
+
+    threads = []
+    storage = server.service.library.storage
+    original = storage.changes
+    storage.changes = lambda: threads.append(threading.current_thread()) or original()
+    async with httpx.AsyncClient(base_url=server.url) as client:
+        assert (await client.get("/books/111")).status_code == 200
+    assert threads and threading.main_thread() not in threads
+
+@pytest.mark.asyncio
+async def test_invalid_content_length(server):
+    reader, writer = await asyncio.open_connection(server.host, server.port)
+    writer.write(b"POST /books HTTP/1.1\r\nContent-Length: abc\r\n\r\n{}")
+    await writer.drain()
+    assert (await reader.readline()).startswith(b"HTTP/1.1 400")
+    writer.close()
@@ -0,0 +1,46 @@
+import httpx
+import pytest
+from library_app.api_client import OpenLibraryClient
+from library_app.models import Library
+from library_app.session import HttpSession
+
+def _transport(requests):
+    def handler(request):
+        requests.append(request.url.path)
+        if request.url.path.startswith("/isbn/"):
+            return httpx.Response(200, json={"title": "Dune", "authors": [{"name": "Frank Herbert"}]})
+        return httpx.Response(200, json={"docs": [{"title": "Dune"}]})
+    return httpx.MockTransport(handler)
+
+@pytest.mark.asyncio
+async def test_session_is_shared_between_library_and_client(tmp_path):
+    requests = []
+    async with HttpSession(transport=_transport(requests)) as session:
+        lib = Library(str(tmp_path / "library.json"), session=session)
+        api = OpenLibraryClient(session=session)
+
+        book = await lib.fetch_book_from_api("9780441172719")
+        client = session.client
+        assert book.title == "Dune" and book.author == "Frank Herbert"
+        assert (await api.search_books("dune"))[0]["title"] == "Dune"
+        assert await api.fetch_book_by_isbn("9780141439587") is not None
+        assert session.client is client  # Aynı istemci yeniden kullanıldı
+
+        await lib.aclose()  # Paylaşılan oturumu kapatmaz
+        assert not client.is_closed
+    assert client.is_closed
+    assert len(requests) == 3
+
+@pytest.mark.asyncio
+async def test_library_closes_own_session(tmp_path):
+    async with Library(str(tmp_path / "library.json")) as lib:
+        client = lib.session.client
+    assert client.is_closed
+
+@pytest.mark.asyncio
+async def test_library_keeps_assigned_session_open(tmp_path):
+    async with HttpSession() as shared:
+        lib = Library(str(tmp_path / "library.json"))
+        lib.session = shared
+        await lib.aclose()
+        assert not shared.client.is_closed
@@ -0,0 +1,42 @@
+import asyncio
+import httpx
+import pytest
+from library_app.cache import MetadataCache
+from library_app.models import Library
+from library_app.session import HttpSession
+from library_app.singleflight import SingleFlight
+
+@pytest.mark.asyncio
+async def test_concurrent_lookups_share_one_request(tmp_path):
+    requests = []
+
+    async def handler(request):
+        requests.append(request.url.path)
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json={"title": "Dune", "authors": [{"name": "Frank Herbert"}]})
+
+    async with HttpSession(transport=httpx.MockTransport(handler)) as session:
+        lib = Library(str(tmp_path / "library.json"), session=session, cache=MetadataCache())
+        isbns = ["9780441172719", "0441172717", "0-441-17271-7"] * 5
+        books = await asyncio.gather(*(lib.fetch_book_from_api(i) for i in isbns))
+
+    assert all(b is books[0] for b in books)
+    assert len(requests) == 1
+    assert len(lib._inflight) == 0
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_cancel_shared_call():
+    flight = SingleFlight()
+    calls = []
+
+    async def work():
+        calls.append(1)
+        await asyncio.sleep(0.02)
+        return "ok"
+
+    first = asyncio.ensure_future(flight.do("k", work))
+    second = asyncio.ensure_future(flight.do("k", work))
+    await asyncio.sleep(0)
+    first.cancel()
+    assert await second == "ok"
+    assert calls == [1]
@@ -0,0 +1,138 @@
+import random
+import pytest
+from library_app.models import Book, Library
+from library_app.snapshot import Snapshot, json_to_snapshot, snapshot_to_json, write_snapshot
+from library_app.storage import SnapshotStorage, write_json
+
+RECORDS = [
+    {"title": "Dune", "author": "Frank Herbert", "isbn": "0-441-17271-7"},
+    {"title": "Émile", "author": "Jean-Jacques Rousseau", "isbn": "9780465019311"},
+    {"title": "Dune Messiah", "author": "Frank Herbert", "isbn": "9780593098233"},
+]
+
+@pytest.fixture
+def snap(tmp_path):
+    path = tmp_path / "library.snap"
+    write_snapshot(path, RECORDS)
+    return path
+
+def test_json_round_trip(tmp_path):
+    source, target = tmp_path / "library.json", tmp_path / "copy.json"
+    write_json(source, RECORDS)
+    assert json_to_snapshot(source, tmp_path / "library.snap") == 3
+    assert snapshot_to_json(tmp_path / "library.snap", target) == 3
+    assert target.read_bytes() == source.read_bytes()
+
+def test_snapshot_indexes(snap):
+    snapshot = Snapshot(snap)
+    assert snapshot.fields(1) == ("Émile", "Jean-Jacques Rousseau", "9780465019311")
+    assert snapshot.ids("isbn", "9780441172719") == [0]
+    assert snapshot.ids("author", "frank herbert") == [0, 2]
+    assert snapshot.ids("title", "yok") == []
+    assert [key for key, _ in snapshot.items("title")] == ["dune", "dune messiah", "émile"]
+    snapshot.close()
+
+def test_invalid_file(tmp_path):
+    (tmp_path / "bozuk.snap").write_bytes(b"[]")
+    with pytest.raises(ValueError):
+        Snapshot(tmp_path / "bozuk.snap")
+
+def test_library_on_snapshot(snap):
+    lib = Library(str(snap))
+    assert isinstance(lib.storage, SnapshotStorage)
+    assert lib.lookup("978-0-441-17271-9").title == "Dune"
+    assert lib.lookup("frank herbert").title == "Dune"
+    assert [b.title for b in lib.iter_books("-title")] == ["Émile", "Dune Messiah", "Dune"]
+    assert lib.list_books(1, 1, sort_by="author")[0] == "Dune Messiah by Frank Herbert (ISBN: 9780593098233)"
+    assert [b.title for b in lib.search("messiah")] == ["Dune Messiah"]
+
+    assert not lib.add_book(Book("dune", "?", "1"))
+    assert lib.add_book(Book("Emma", "Jane Austen", "9780141439587"))
+    assert lib.remove_book("9780441172719")
+    assert lib.lookup("frank herbert").title == "Dune Messiah"
+
+    reopened = Library(str(snap))  # Günlük anlık görüntünün üstüne uygulanır
+    assert [b.title for b in reopened.books] == ["Émile", "Dune Messiah", "Emma"]
+    reopened.save_books()
+    assert [r["title"] for r in Snapshot(snap).records()] == ["Émile", "Dune Messiah", "Emma"]
+    assert lib.lookup("jane austen").title == "Emma"  # Sıkıştırma sonrası yeniden açıldı
+
+def test_batch_rollback_restores_snapshot_books(snap):
+    lib = Library(str(snap))
+    with pytest.raises(RuntimeError):
+        with lib.batch():
+            lib.remove_book("9780465019311")
+            raise RuntimeError
+    assert [b.title for b in lib.books] == ["Dune", "Émile", "Dune Messiah"]
+    assert lib.lookup("émile").isbn == "9780465019311"
+
+def test_reload_closes_replaced_snapshot(snap):
+    lib, other = Library(str(snap)), Library(str(snap))
+    books = lib.iter_books()
+    assert next(books).title == "Dune"
+    old = lib._books.snapshot
+
+    other.add_book(Book("Emma", "Jane Austen", "9780141439587"))
+    other.save_books()  # Sıkıştırma dosyayı değiştirir, lib yeniden yükler
+    assert lib.lookup("jane austen").title == "Emma"
+    assert lib._books.snapshot is not old
+    assert next(books).title == "Émile"  # Süren yineleme eski eşlemeyi açık tutar
+    del books
+    assert old._mm.closed
+
+def test_matches_json_library(tmp_path):
+    rng = random.Random(7)
+    records = [{"title": f"Kitap {i % 40}", "author": f"Yazar {i % 7}", "isbn": f"{i:09d}"} for i in range(60)]
+    write_json(tmp_path / "library.json", records)
+    json_to_snapshot(tmp_path / "library.json", tmp_path / "library.snap")
+    snap = tmp_path / "library.snap"
+    plain = Library(str(tmp_path / "library.json"))
+    mapped = Library(str(snap), storage=SnapshotStorage(snap, compact_every=25))  # Arada sıkıştırmalar da olsun
+
+    for step in range(300):
+        i = rng.randrange(80)
+        if rng.random() < 0.5:
+            book = Book(f"Kitap {i}", f"Yazar {i % 9}", f"{i:09d}")
+            assert plain.add_book(book) == mapped.add_book(book)
+        else:
+            assert plain.remove_book(f"{i:09d}") == mapped.remove_book(f"{i:09d}")
+        query = rng.choice([f"{i:09d}", f"kitap {i}", f"yazar {i % 9}"])
+        assert str(plain.lookup(query)) == str(mapped.lookup(query))
+        if step % 50 == 0:
+            for sort_by in (None, "title", "-author", "isbn"):
+                assert list(plain.list_books(5, 10, sort_by=sort_by)) == list(mapped.list_books(5, 10, sort_by=sort_by))
+    assert [str(b) for b in plain.books] == [str(b) for b in mapped.books]
+
+def test_convert_command(tmp_path, monkeypatch):
+    from click.testing import CliRunner
+    from library_app import cli as cli_module
+
+    monkeypatch.chdir(tmp_path)
+    write_json(tmp_path / "library.json", RECORDS)
+    Library("library.json").add_book(Book("Emma", "Jane Austen", "9780141439587"))  # Günlükte bekliyor
+    runner = CliRunner()
+    assert "4 kitap yazıldı" in runner.invoke(cli_module.cli, ["convert", "library.json", "library.snap"]).output
+    monkeypatch.setattr(cli_module, "library", None)
+    result = runner.invoke(cli_module.cli, ["--file", "library.snap", "list-books", "--sort", "title"])
+    assert result.output.splitlines()[0].startswith("Dune by")
+    assert runner.invoke(cli_module.cli, ["convert", "library.snap", "back.jsonl"]).exit_code == 0
+    assert len((tmp_path / "back.jsonl").read_text(encoding="utf-8").splitlines()) == 4
+
+def test_convert_jsonl_and_csv_sources(tmp_path, monkeypatch):
+    from click.testing import CliRunner
+    from library_app import cli as cli_module
+    from library_app import streaming
+
+    monkeypatch.chdir(tmp_path)
+    streaming.write_jsonl("a.jsonl", RECORDS)
+    streaming.write_csv("b.csv", RECORDS)
+    runner = CliRunner()
+    assert "3 kitap yazıldı" in runner.invoke(cli_module.cli, ["convert", "a.jsonl", "out.snap"]).output
+    assert [r["title"] for r in Snapshot(tmp_path / "out.snap").records()] == [r["title"] for r in RECORDS]
+    assert "3 kitap yazıldı" in runner.invoke(cli_module.cli, ["convert", "b.csv", "out.json"]).output
+    assert not (tmp_path / "a.jsonl.lock").exists() and not (tmp_path / "b.csv.lock").exists()
+
+    (tmp_path / "c.txt").write_text("?", encoding="utf-8")
+    result = runner.invoke(cli_module.cli, ["convert", "c.txt", "out2.json"])
+    assert result.exit_code != 0 and "biçimi" in result.output
+    assert not (tmp_path / "out2.json").exists()
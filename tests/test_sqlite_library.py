@@ -0,0 +1,119 @@
+import json
+from click.testing import CliRunner
+from library_app.cli import cli
+from library_app.models import Book
+from library_app.sqlite_library import SQLiteLibrary
+
+def test_sqlite_library_api(tmp_path):
+    with SQLiteLibrary(str(tmp_path / "library.db")) as db:
+        assert db.add_book(Book("Dune", "Frank Herbert", "111"))
+        assert not db.add_book(Book("dune", "Other", "222"))  # Aynı başlık
+        assert not db.add_book(Book("Emma", "Other", "111"))  # Aynı ISBN
+        assert db.add_book(Book("Children of Dune", "Frank Herbert", "333"))
+
+        assert db.find_book("frank herbert").isbn == "111"
+        assert list(db.list_books()) == [
+            "Dune by Frank Herbert (ISBN: 111)",
+            "Children of Dune by Frank Herbert (ISBN: 333)",
+        ]
+        assert db.remove_book("111")
+        assert not db.remove_book("111")
+        assert db.find_book("Dune") is None
+
+def test_sqlite_batch_results(tmp_path):
+    with SQLiteLibrary(str(tmp_path / "library.db")) as db:
+        result = db.add_books([Book("Dune", "Frank Herbert", "111"), Book("DUNE", "?", "222"),
+                               Book("", "?", "333"), Book("Emma", "Jane Austen", "444")])
+        assert [b.isbn for b in result.added] == ["111", "444"]
+        assert len(result.duplicates) == 1 and len(result.rejected) == 1
+
+        result = db.remove_books(["111", "999"])
+        assert [b.isbn for b in result.removed] == ["111"]
+        assert result.not_found == ["999"]
+        assert len(db) == 1
+
+def test_sqlite_list_books_matches_library(tmp_path):
+    from library_app.models import Library
+
+    books = [Book(f"Kitap {i % 7}-{i}", f"Yazar {i % 3}", str(100 + i)) for i in range(20)]
+    lib = Library(str(tmp_path / "library.json"))
+    lib.add_books(books)
+    with SQLiteLibrary(str(tmp_path / "library.db")) as db:
+        db.add_books(books)
+        for sort_by in (None, "title", "-author", "isbn"):
+            for filter in (None, "yazar 1", "-1"):
+                expected, page = lib.list_books(3, 5, sort_by, filter), db.list_books(3, 5, sort_by, filter)
+                assert list(page) == list(expected) and page.total == expected.total
+            assert [str(b) for b in db.iter_books(sort_by)] == [str(b) for b in lib.iter_books(sort_by)]
+        assert not db.list_books(18, 5).has_next
+
+def test_sqlite_suggestions_follow_writes(tmp_path, capsys):
+    path = str(tmp_path / "library.db")
+    with SQLiteLibrary(path) as db, SQLiteLibrary(path) as other:
+        db.add_book(Book("Dune", "Frank Herbert", "111"))
+        assert db.find_book("Dunee") is None
+        assert "- Dune" in capsys.readouterr().out
+
+        db.add_book(Book("Dune Messiah", "Frank Herbert", "222"))
+        other.add_book(Book("Emma", "Jane Austen", "333"))  # Başka bağlantının yazması
+        db.remove_book("111")
+        assert db.suggest("dune mesiah") == ["Dune Messiah"]
+        assert db.suggest("emmaa") == ["Emma"]
+        assert db.suggest("dune", cutoff=0.9) == []
+
+def test_upgrades_legacy_schema(tmp_path):
+    import sqlite3
+
+    path = tmp_path / "library.db"
+    conn = sqlite3.connect(str(path))
+    conn.executescript("""
+        CREATE TABLE books (id INTEGER PRIMARY KEY AUTOINCREMENT, title TEXT NOT NULL, author TEXT NOT NULL,
+                            isbn TEXT NOT NULL UNIQUE, title_key TEXT NOT NULL UNIQUE, author_key TEXT NOT NULL);
+        CREATE INDEX idx_books_author_key ON books(author_key);
+        INSERT INTO books (title, author, isbn, title_key, author_key) VALUES
+            ('Dune', 'Frank Herbert', '0-441-17271-7', 'dune', 'frank herbert'),
+            ('Dune (2. baskı)', 'Frank Herbert', '9780441172719', 'dune (2. baskı)', 'frank herbert'),
+            ('Emma', 'Jane Austen', '222', 'emma', 'jane austen');
+    """)
+    conn.close()
+
+    with SQLiteLibrary(str(path)) as db:
+        assert db._conn.execute("PRAGMA user_version").fetchone()[0] == 1
+        assert [b.title for b in db.iter_books()] == ["Dune", "Emma"]
+        assert db.find_book("978-0-441-17271-9").title == "Dune"
+        assert not db.add_book(Book("Dune Messiah", "Frank Herbert", "0441172717"))
+        assert db.add_book(Book("Persuasion", "Jane Austen", "9780141439686"))
+        plan = db._conn.execute("EXPLAIN QUERY PLAN SELECT id FROM books WHERE author_key = 'x'").fetchall()
+        assert "idx_books_author_key" in str(plan)
+    with SQLiteLibrary(str(path)) as db:  # Tekrar açmak şemayı yeniden kurmaz
+        assert len(db) == 3
+
+def test_migrate_command(tmp_path):
+    source = tmp_path / "library.json"
+    source.write_text(json.dumps([
+        {"title": "Dune", "author": "Frank Herbert", "isbn": "111"},
+        {"title": "Emma", "author": "Jane Austen", "isbn": "222"},
+    ]), encoding="utf-8")
+    target = tmp_path / "library.db"
+
+    result = CliRunner().invoke(cli, ["migrate", "--source", str(source), "--target", str(target)])
+    assert result.exit_code == 0, result.output
+    with SQLiteLibrary(str(target)) as db:
+        assert len(db) == 2
+        assert db.find_book("222").title == "Emma"
+
+def test_migrate_replays_pending_journal(tmp_path):
+    from library_app.models import Library
+
+    source = tmp_path / "library.json"
+    source.write_text(json.dumps([{"title": "Emma", "author": "Jane Austen", "isbn": "222"}]), encoding="utf-8")
+    lib = Library(str(source))
+    lib.add_book(Book("Dune", "Frank Herbert", "111"))  # Yalnızca günlükte
+    lib.remove_book("222")
+    target = tmp_path / "library.db"
+
+    result = CliRunner().invoke(cli, ["migrate", "--source", str(source), "--target", str(target)])
+    assert "1 kitap aktarıldı" in result.output
+    with SQLiteLibrary(str(target)) as db:
+        assert db.find_book("111").title == "Dune"
+        assert db.find_book("222") is None
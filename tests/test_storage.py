@@ -0,0 +1,83 @@
+import multiprocessing
+import pytest
+import json
+from library_app.models import Book, Library
+from library_app.storage import JournalStorage, JsonStorage
+
+def test_journal_is_replayed_on_load(tmp_path):
+    db_file = tmp_path / "library.json"
+    lib = Library(str(db_file))
+    lib.add_book(Book("Dune", "Frank Herbert", "111"))
+    lib.add_book(Book("Emma", "Jane Austen", "222"))
+    lib.remove_book("111")
+
+    assert not db_file.exists()  # Henüz sıkıştırma yapılmadı
+    reloaded = Library(str(db_file))
+    assert [b.isbn for b in reloaded.books] == ["222"]
+
+def test_compaction_writes_json_snapshot(tmp_path):
+    db_file = tmp_path / "library.json"
+    lib = Library(str(db_file), storage=JournalStorage(db_file, compact_every=2))
+    lib.add_book(Book("Dune", "Frank Herbert", "111"))
+    lib.add_book(Book("Emma", "Jane Austen", "222"))
+
+    assert json.loads(db_file.read_text(encoding="utf-8"))[1]["isbn"] == "222"
+    assert lib.storage.journal_path.read_text(encoding="utf-8") == ""
+
+def test_truncated_journal_line_is_ignored(tmp_path):
+    db_file = tmp_path / "library.json"
+    lib = Library(str(db_file))
+    lib.add_book(Book("Dune", "Frank Herbert", "111"))
+    with open(lib.storage.journal_path, "a", encoding="utf-8") as f:
+        f.write('{"op": "add", "book": {"title": "Em')
+
+    assert [b.isbn for b in Library(str(db_file)).books] == ["111"]
+
+def test_json_import_export(tmp_path):
+    lib = Library(str(tmp_path / "a.json"), storage=JsonStorage(tmp_path / "a.json"))
+    lib.add_book(Book("Dune", "Frank Herbert", "111"))
+    lib.export_json(str(tmp_path / "export.json"))
+
+    other = Library(str(tmp_path / "b.json"))
+    assert other.import_json(str(tmp_path / "export.json")) == 1
+    assert other.find_book("111").title == "Dune"
+
+def _writer(path, worker, count):
+    lib = Library(path, storage=JournalStorage(path, compact_every=7))
+    for i in range(count):
+        lib.add_book(Book(f"Kitap {worker}-{i}", f"Yazar {worker}", f"{worker}-{i}"))
+        if i % 5 == 4:  # Arada bir kendi eklediğini sil
+            assert lib.remove_book(f"{worker}-{i - 1}")
+        lib.find_book(f"0-{i}")  # Diğer süreçlerin değişikliklerini de okur
+
+def test_concurrent_processes_keep_every_change(tmp_path):
+    pytest.importorskip("fcntl")
+    path = str(tmp_path / "library.json")
+    ctx = multiprocessing.get_context("fork")
+    workers, count = 4, 40
+    procs = [ctx.Process(target=_writer, args=(path, w, count)) for w in range(workers)]
+    for proc in procs:
+        proc.start()
+    for proc in procs:
+        proc.join(60)
+        assert proc.exitcode == 0
+
+    expected = {f"{w}-{i}" for w in range(workers) for i in range(count) if i % 5 != 3}
+    assert sorted(b.isbn for b in Library(path).books) == sorted(expected)
+
+def test_changes_from_other_instance_are_applied_incrementally(tmp_path):
+    path = str(tmp_path / "library.json")
+    first, second = Library(path), Library(path)
+    first.add_book(Book("Dune", "Frank Herbert", "111"))
+    assert second.find_book("111").title == "Dune"
+
+    loads = []
+    second.load_books = lambda: loads.append(1)  # Tam yeniden yükleme olmamalı
+    first.add_book(Book("Emma", "Jane Austen", "222"))
+    first.remove_book("111")
+    assert [b.isbn for b in second.books] == ["222"] and not loads
+
+    first.save_books()  # Sıkıştırma: diğer örnek dosyayı baştan okur
+    del second.load_books
+    assert second.add_book(Book("Dune", "Frank Herbert", "111"))
+    assert sorted(b.isbn for b in Library(path).books) == ["111", "222"]
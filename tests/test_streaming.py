@@ -0,0 +1,60 @@
+import io
+import json
+from library_app.isbn import to_isbn13
+from library_app.models import Book, Library
+from library_app.streaming import dump_json_array, iter_json_array, normalize, read_records, write_records
+
+def test_json_array_is_parsed_in_small_chunks():
+    records = [{"title": f"Kitap {i}", "author": "Yazar", "isbn": str(i)} for i in range(50)]
+    text = json.dumps(records, indent=2)
+    assert list(iter_json_array(io.StringIO(text), chunk_size=7)) == records
+    assert list(iter_json_array(io.StringIO("  [ ]"))) == []
+
+def test_json_writer_matches_json_dump():
+    records = [{"title": "Dune", "author": "Frank Herbert", "isbn": "1"}, {"title": "Emma", "author": "", "isbn": "2"}]
+    for data in (records, []):
+        out = io.StringIO()
+        dump_json_array(iter(data), out, chunk_size=1)
+        assert out.getvalue() == json.dumps(data, indent=2)
+
+def test_jsonl_and_csv_round_trip(tmp_path):
+    records = [{"title": "Dune", "author": "Frank Herbert", "isbn": "9780441013593"},
+               {"title": "Çalıkuşu", "author": "Reşat Nuri", "isbn": "123"}]
+    for name in ("books.jsonl", "books.csv", "books.json"):
+        assert write_records(tmp_path / name, iter(records), chunk_size=1) == 2
+        assert list(read_records(tmp_path / name)) == records
+
+def test_import_normalizes_and_dedups(tmp_path):
+    isbn = to_isbn13("044101359")
+    source = tmp_path / "books.jsonl"
+    source.write_text("\n".join([
+        json.dumps({"title": "Dune", "author": "Frank Herbert", "isbn": isbn[:3] + "-" + isbn[3:]}),
+        json.dumps({"title": "DUNE", "author": "Frank Herbert", "isbn": "x"}),  # dosya içi tekrar
+        '{"title": "bozuk',
+        json.dumps({"title": "", "author": "?", "isbn": "1"}),
+        json.dumps({"title": "Emma", "author": "Jane Austen", "isbn": "222"}),
+    ]) + "\n", encoding="utf-8")
+
+    lib = Library(str(tmp_path / "library.json"))
+    lib.add_book(Book("Emma", "Jane Austen", "222"))
+    counts = lib.import_file(str(source), chunk_size=1)
+
+    assert counts == {"read": 4, "added": 1, "duplicates": 1, "skipped": 2}
+    assert lib.find_book("Dune").isbn == isbn
+
+def test_normalize_accepts_non_string_values():
+    records = [{"title": 1984, "author": None, "isbn": 9780451524935},
+               {"title": ["?"], "author": "?", "isbn": "111"},
+               {"title": "Emma", "author": {"ad": "?"}, "isbn": True},
+               {"title": "Dune", "author": ["?"], "isbn": "222"}]
+    assert list(normalize(records)) == [{"title": "1984", "author": "", "isbn": "9780451524935"},
+                                        {"title": "Dune", "author": "", "isbn": "222"}]
+
+def test_export_then_import_into_empty_library(tmp_path):
+    lib = Library(str(tmp_path / "a.json"))
+    lib.add_books(Book(f"Kitap {i}", "Yazar", to_isbn13(str(i).zfill(9))) for i in range(25))
+    assert lib.export_file(str(tmp_path / "out.csv"), chunk_size=10) == 25
+
+    other = Library(str(tmp_path / "b.json"))
+    assert other.import_file(str(tmp_path / "out.csv"), chunk_size=10)["added"] == 25
+    assert [b.isbn for b in other.books] == [b.isbn for b in lib.books]